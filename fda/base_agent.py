@@ -9,7 +9,7 @@ access, and state management.
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Union
 from datetime import datetime
 
 import os
@@ -71,6 +71,9 @@ class BaseAgent(ABC):
         # Running state
         self._running = False
 
+        # (context token, context) from the last get_project_context_cached()
+        self._project_context_cache: Optional[tuple[Any, dict[str, Any]]] = None
+
     def chat(
         self,
         message: str,
@@ -268,7 +271,7 @@ class BaseAgent(ABC):
     def log_to_journal(
         self,
         summary: str,
-        content: str,
+        content: Union[str, Callable[[], str]],
         tags: Optional[list[str]] = None,
         relevance_decay: str = "medium",
     ) -> Path:
@@ -277,13 +280,16 @@ class BaseAgent(ABC):
 
         Args:
             summary: Brief summary of the entry.
-            content: Full content of the entry.
+            content: Full content of the entry, or a zero-argument callable
+                     that builds it, so callers can defer formatting.
             tags: Optional list of tags.
             relevance_decay: Decay rate for the entry.
 
         Returns:
             Path to the written journal file.
         """
+        if callable(content):
+            content = content()
         return self.journal_writer.write_entry(
             author=self.name,
             tags=tags or [self.name.lower()],
@@ -372,6 +378,29 @@ class BaseAgent(ABC):
             "unacknowledged_alerts": alerts,
         }
 
+    def get_project_context_cached(self) -> dict[str, Any]:
+        """
+        Get project context, reusing the last result while state is unchanged.
+
+        The cache is keyed on the state's context token, which moves only
+        when tasks or unacknowledged alerts change (from this or another
+        process); heartbeats and other unrelated writes keep it valid.
+
+        Returns:
+            Dictionary with project state information (see
+            get_project_context), with a fresh timestamp.
+        """
+        token = self.state.get_context_token()
+        cached = self._project_context_cache
+        if cached is not None and cached[0] == token:
+            context = dict(cached[1])
+            context["timestamp"] = datetime.now().isoformat()
+            return context
+
+        context = self.get_project_context()
+        self._project_context_cache = (token, context)
+        return dict(context)
+
     @abstractmethod
     def run_event_loop(self) -> None:
         """
@@ -10,6 +10,7 @@ Set FDA_CLAUDE_BACKEND=api to force API mode, or FDA_CLAUDE_BACKEND=cli to force
 By default, the system auto-detects: if `claude` is on PATH, it uses CLI.
 """
 
+import functools
 import json
 import logging
 import os
@@ -21,6 +22,26 @@ from typing import Any, Callable, Optional
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _cacheable_system(system: str) -> Any:
+    """
+    Wrap a system prompt as a cacheable block for the Messages API.
+
+    Agents send the same system prompt on every call, so marking it with
+    cache_control lets the API reuse the processed prefix instead of
+    reading it again each time. Built once per distinct prompt.
+
+    Args:
+        system: System prompt text.
+
+    Returns:
+        A one-element list of text blocks, or the prompt unchanged if empty.
+    """
+    if not system:
+        return system
+    return [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+
+
 class ToolLoopTimeoutError(Exception):
     """Raised when the complete_with_tools loop exceeds its time budget."""
 
@@ -326,7 +347,7 @@ class AnthropicAPIBackend(ClaudeBackend):
         response = self._client.messages.create(
             model=model,
             max_tokens=max_tokens,
-            system=system,
+            system=_cacheable_system(system),
             messages=messages,
             temperature=temperature,
         )
@@ -384,7 +405,7 @@ class AnthropicAPIBackend(ClaudeBackend):
             create_kwargs: dict[str, Any] = dict(
                 model=model,
                 max_tokens=effective_max_tokens,
-                system=system,
+                system=_cacheable_system(system),
                 messages=msgs,
                 tools=tools,
                 temperature=effective_temperature,
@@ -452,7 +473,7 @@ class AnthropicAPIBackend(ClaudeBackend):
             final = self._client.messages.create(
                 model=model,
                 max_tokens=max_tokens,
-                system=system,
+                system=_cacheable_system(system),
                 messages=msgs,
             )
             text_parts = [b.text for b in final.content if b.type == "text"]
@@ -523,7 +544,7 @@ class AnthropicAPIBackend(ClaudeBackend):
                 stream_kwargs: dict[str, Any] = dict(
                     model=model,
                     max_tokens=effective_max_tokens,
-                    system=system,
+                    system=_cacheable_system(system),
                     messages=msgs,
                     tools=tools,
                     temperature=effective_temperature,
@@ -648,7 +669,7 @@ class AnthropicAPIBackend(ClaudeBackend):
             with self._client.messages.stream(
                 model=model,
                 max_tokens=max_tokens,
-                system=system,
+                system=_cacheable_system(system),
                 messages=msgs,
             ) as stream:
                 for event in stream:
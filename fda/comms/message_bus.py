@@ -6,8 +6,10 @@ Supports peer-based collaboration between FDA, Librarian, and Executor agents.
 """
 
 import json
+import os
+import threading
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
 from datetime import datetime
 import uuid
 import fcntl
@@ -63,6 +65,15 @@ class Agents:
     DISCORD = "discord"
 
 
+# Per-agent wakeup events shared by every MessageBus in this process
+_wakeup_events: dict[str, threading.Event] = {}
+_wakeup_lock = threading.Lock()
+
+# Request ID -> event set when a reply to it is sent in this process,
+# registered for the duration of wait_for_response
+_reply_events: dict[str, threading.Event] = {}
+
+
 class MessageBus:
     """
     Message bus for inter-agent communication.
@@ -136,49 +147,116 @@ class MessageBus:
         Returns:
             Message ID of the sent message.
         """
-        msg_id = str(uuid.uuid4())
-        timestamp = datetime.now().isoformat()
-
-        # Determine thread_id - either from reply_to or start new thread
-        thread_id = msg_id
-        if reply_to:
-            # Look up the thread_id from the original message
-            fh = self._acquire_lock()
-            try:
-                bus_data = json.load(fh)
-                for msg in bus_data["messages"]:
-                    if msg["id"] == reply_to:
-                        thread_id = msg.get("thread_id", reply_to)
-                        break
-            finally:
-                self._release_lock(fh)
-
-        message = {
-            "id": msg_id,
-            "from": from_agent.lower(),
-            "to": to_agent.lower(),
-            "type": msg_type,
+        return self.send_batch([{
+            "from_agent": from_agent,
+            "to_agent": to_agent,
+            "msg_type": msg_type,
             "subject": subject,
             "body": body,
             "priority": priority,
-            "timestamp": timestamp,
-            "read": False,
-            "thread_id": thread_id,
             "reply_to": reply_to,
-        }
+        }])[0]
+
+    def send_batch(self, messages: list[dict[str, Any]]) -> list[str]:
+        """
+        Send several messages with a single locked read/write of the bus.
+
+        Args:
+            messages: List of dicts holding the keyword arguments of
+                      ``send`` (from_agent, to_agent, msg_type, subject,
+                      body, and optionally priority and reply_to).
+
+        Returns:
+            Message IDs of the sent messages, in order.
+        """
+        timestamp = datetime.now().isoformat()
+
+        built = []
+        for spec in messages:
+            msg_id = str(uuid.uuid4())
+            built.append({
+                "id": msg_id,
+                "from": spec["from_agent"].lower(),
+                "to": spec["to_agent"].lower(),
+                "type": spec["msg_type"],
+                "subject": spec["subject"],
+                "body": spec["body"],
+                "priority": spec.get("priority", "medium"),
+                "timestamp": timestamp,
+                "read": False,
+                # Start a new thread unless this replies to a known message
+                "thread_id": msg_id,
+                "reply_to": spec.get("reply_to"),
+            })
 
         fh = self._acquire_lock()
         try:
             fh.seek(0)
             bus_data = json.load(fh)
-            bus_data["messages"].append(message)
+
+            # Replies join the thread of the message they answer
+            replied_to = {m["reply_to"] for m in built if m["reply_to"]}
+            if replied_to:
+                thread_ids = {
+                    msg["id"]: msg.get("thread_id", msg["id"])
+                    for msg in bus_data["messages"]
+                    if msg["id"] in replied_to
+                }
+                for message in built:
+                    if message["reply_to"] in thread_ids:
+                        message["thread_id"] = thread_ids[message["reply_to"]]
+
+            bus_data["messages"].extend(built)
             fh.seek(0)
             fh.truncate()
             json.dump(bus_data, fh, indent=2)
         finally:
             self._release_lock(fh)
 
-        return msg_id
+        # Wake the recipients' event loops if they run in this process
+        for recipient in {m["to"] for m in built}:
+            event = _wakeup_events.get(recipient)
+            if event is not None:
+                event.set()
+
+        # Wake callers blocked in wait_for_response on these replies
+        for message in built:
+            if message["reply_to"]:
+                event = _reply_events.get(message["reply_to"])
+                if event is not None:
+                    event.set()
+
+        return [m["id"] for m in built]
+
+    @staticmethod
+    def wakeup_event(agent_name: str) -> threading.Event:
+        """
+        Get the event that is set whenever a message is sent to an agent.
+
+        Only senders in the same process can set it, so event loops should
+        still wait with a timeout to pick up messages from other processes.
+
+        Args:
+            agent_name: Name of the receiving agent.
+
+        Returns:
+            The agent's wakeup event (shared per process).
+        """
+        with _wakeup_lock:
+            return _wakeup_events.setdefault(agent_name.lower(), threading.Event())
+
+    def get_version(self) -> tuple[int, int]:
+        """
+        Get a cheap change token for the bus file.
+
+        The token is the file's (mtime_ns, size). It changes on every write,
+        so callers can skip reading and parsing the bus when it is unchanged.
+
+        Returns:
+            Tuple of (modification time in ns, size in bytes).
+        """
+        st = os.stat(self.bus_path)
+        return (st.st_mtime_ns, st.st_size)
 
     def get_pending(self, agent_name: str) -> list[dict[str, Any]]:
         """
@@ -259,6 +337,33 @@ class MessageBus:
         finally:
             self._release_lock(fh)
 
+    def mark_read_batch(self, msg_ids: list[str]) -> None:
+        """
+        Mark several messages as read with a single bus rewrite.
+
+        Args:
+            msg_ids: IDs of the messages to mark as read.
+        """
+        if not msg_ids:
+            return
+
+        ids = set(msg_ids)
+        read_at = datetime.now().isoformat()
+
+        fh = self._acquire_lock()
+        try:
+            fh.seek(0)
+            bus_data = json.load(fh)
+            for msg in bus_data["messages"]:
+                if msg["id"] in ids:
+                    msg["read"] = True
+                    msg["read_at"] = read_at
+            fh.seek(0)
+            fh.truncate()
+            json.dump(bus_data, fh, indent=2)
+        finally:
+            self._release_lock(fh)
+
     def get_thread(self, msg_id: str) -> list[dict[str, Any]]:
         """
         Get all messages in a conversation thread.
@@ -387,7 +492,7 @@ class MessageBus:
     def request_execute(
         self,
         from_agent: str,
-        command: str,
+        command: Union[str, list[str]],
         cwd: Optional[str] = None,
         priority: str = "medium",
     ) -> str:
@@ -396,7 +501,8 @@ class MessageBus:
 
         Args:
             from_agent: Agent making the request.
-            command: Command to execute.
+            command: Command to execute, either a shell string or an argv
+                list (run by the Executor without a shell).
             cwd: Working directory for the command.
             priority: Request priority.
 
@@ -404,11 +510,12 @@ class MessageBus:
             Message ID for tracking the request.
         """
         body = json.dumps({"command": command, "cwd": cwd})
+        display = command if isinstance(command, str) else " ".join(command)
         return self.send(
             from_agent=from_agent,
             to_agent=Agents.EXECUTOR,
             msg_type=MessageTypes.EXECUTE_REQUEST,
-            subject=f"Execute: {command[:50]}",
+            subject=f"Execute: {display[:50]}",
             body=body,
             priority=priority,
         )
@@ -675,24 +782,41 @@ class MessageBus:
         """
         Wait for a response to a specific request.
 
+        A reply sent from this process wakes the waiter immediately; replies
+        written by other processes are picked up every poll_interval.
+
         Args:
             agent_name: Agent waiting for the response.
             request_id: ID of the original request.
             timeout_seconds: Maximum time to wait.
-            poll_interval: Time between checks.
+            poll_interval: Time between checks for cross-process replies.
 
         Returns:
             Response message or None if timeout.
         """
         import time
 
-        start_time = time.time()
-        while time.time() - start_time < timeout_seconds:
-            # Check for messages that are replies to our request
-            pending = self.get_pending(agent_name)
-            for msg in pending:
-                if msg.get("reply_to") == request_id:
-                    return msg
-            time.sleep(poll_interval)
-
-        return None
+        event = threading.Event()
+        with _wakeup_lock:
+            _reply_events[request_id] = event
+        try:
+            deadline = time.monotonic() + timeout_seconds
+            version = None
+            while True:
+                # Only re-read the bus when it has changed
+                current = self.get_version()
+                if current != version:
+                    version = current
+                    event.clear()
+                    for msg in self.get_pending(agent_name):
+                        if msg.get("reply_to") == request_id:
+                            return msg
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                event.wait(min(poll_interval, remaining))
+        finally:
+            with _wakeup_lock:
+                if _reply_events.get(request_id) is event:
+                    del _reply_events[request_id]
@@ -11,14 +11,25 @@ As a peer to FDA and Librarian, it collaborates via the message bus
 without hierarchy - responding to requests and reporting results.
 """
 
+import functools
+import itertools
 import logging
+import mmap
+import queue
+import random
+import re
+import selectors
+import shlex
+import stat
+import threading
 import time
 import subprocess
 import os
 import shutil
 import json
+from collections import deque
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Union
 from datetime import datetime
 
 from fda.base_agent import BaseAgent
@@ -28,6 +39,255 @@ from fda.comms.message_bus import MessageTypes, Agents
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=64)
+def _validated_cwd(path: str) -> str:
+    """
+    Check that a working directory exists, caching successful lookups.
+
+    Args:
+        path: Directory to validate.
+
+    Returns:
+        The same path, if it is an existing directory.
+
+    Raises:
+        FileNotFoundError: If the directory does not exist.
+    """
+    if not os.path.isdir(path):
+        raise FileNotFoundError(f"Working directory does not exist: {path}")
+    return path
+
+
+# Phrases in a task response that mark the task as blocked
+_BLOCKER_RE = re.compile(
+    r"blocked by|waiting for|blocker|cannot proceed|dependency", re.IGNORECASE
+)
+# Phrases that introduce the blocker reason itself
+_BLOCKER_REASON_RE = re.compile(
+    r"blocked by|waiting for|blocker:|cannot proceed because", re.IGNORECASE
+)
+
+# Files larger than this are read through mmap instead of read()
+MMAP_READ_THRESHOLD = 64 * 1024
+
+# Write buffer for file operations, large enough that typical generated
+# files are flushed with a single write() call
+WRITE_BUFFER_SIZE = 256 * 1024
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write already-encoded data to a file in one buffered write.
+
+    Args:
+        path: File to create or truncate.
+        data: Bytes to write.
+    """
+    with open(path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(data)
+
+
+def _replace_bytes(path: Path, data: bytes, mode: int) -> None:
+    """
+    Atomically replace a file's contents via a temp file and os.replace.
+
+    Readers see either the old or the new file, never a torn write.
+
+    Args:
+        path: Existing file to replace (symlinks should be resolved first).
+        data: New contents.
+        mode: Permission bits to give the replacement file.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        _write_bytes(tmp_path, data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _fast_copy(src: str, dst: str) -> str:
+    """
+    Copy a file's data and metadata, like shutil.copy2, in the kernel.
+
+    Tries copy_file_range (which can reflink on btrfs/XFS), then
+    sendfile, and finishes with copyfileobj for anything the kernel
+    paths did not copy (unsupported filesystems, files that report no
+    size).
+
+    Args:
+        src: Source file path.
+        dst: Destination file or directory path.
+
+    Returns:
+        The destination file path.
+
+    Raises:
+        shutil.SameFileError: If src and dst are the same file.
+    """
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+
+    # Opening dst for writing would truncate src before it is read
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(in_fd).st_size
+        offset = 0
+
+        if hasattr(os, "copy_file_range"):
+            try:
+                while offset < size:
+                    copied = os.copy_file_range(in_fd, out_fd, size - offset, offset, offset)
+                    if copied == 0:
+                        break
+                    offset += copied
+            except OSError:
+                pass
+
+        if offset < size and hasattr(os, "sendfile"):
+            try:
+                os.lseek(out_fd, offset, os.SEEK_SET)
+                while offset < size:
+                    sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                pass
+
+        fsrc.seek(offset)
+        fdst.seek(offset)
+        shutil.copyfileobj(fsrc, fdst)
+
+    shutil.copystat(src, dst)
+    return dst
+
+
+class MappedFile:
+    """
+    Read-only memory mapping of a file, exposed as a memoryview.
+
+    Returned by ``ExecutorAgent.read_file(..., decode=False)`` so callers
+    can scan file bytes (``view.find``, ``re.search(rb"...", view)``)
+    without decoding or copying them. Use as a context manager, or call
+    ``close()``, to release the mapping.
+    """
+
+    def __init__(self, path: Path, limit: Optional[int] = None):
+        """
+        Map a file.
+
+        Args:
+            path: File to map.
+            limit: Optional maximum number of bytes to expose.
+        """
+        self._mmap: Optional[mmap.mmap] = None
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size > 0:
+                # The mapping stays valid after the file object is closed
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap if self._mmap is not None else b"")
+        self.view: memoryview = view[:limit] if limit is not None else view
+
+    def close(self) -> None:
+        """Release the view and unmap the file."""
+        self.view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> memoryview:
+        return self.view
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+# Output characters kept from a command; anything past these is read and
+# discarded
+COMMAND_STDOUT_LIMIT = 10000
+COMMAND_STDERR_LIMIT = 5000
+_PIPE_READ_SIZE = 64 * 1024
+# Longest UTF-8 encoding of one character, so limit * this many bytes
+# always hold the first limit characters
+_MAX_UTF8_CHAR_BYTES = 4
+
+
+def _run_capped(
+    args: Union[str, list[str]],
+    shell: bool,
+    cwd: str,
+    timeout: float,
+    stdout_limit: int = COMMAND_STDOUT_LIMIT,
+    stderr_limit: int = COMMAND_STDERR_LIMIT,
+) -> tuple[int, str, str]:
+    """
+    Run a process, keeping only a bounded prefix of its output.
+
+    Both pipes are drained until EOF so a noisy child never blocks on a
+    full pipe, but output past each limit is dropped as it arrives
+    instead of being accumulated and sliced afterwards. Only as many bytes
+    as the limit's characters can take are kept, then the output is
+    decoded (invalid bytes replaced) and cut to the character limit.
+
+    Args:
+        args: Command string or argv list, as for subprocess.Popen.
+        shell: Whether to run through the shell.
+        cwd: Working directory.
+        timeout: Seconds before the process is killed.
+        stdout_limit: Maximum stdout characters to keep.
+        stderr_limit: Maximum stderr characters to keep.
+
+    Returns:
+        Tuple of (return_code, stdout, stderr).
+
+    Raises:
+        subprocess.TimeoutExpired: If the process outlives the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    with subprocess.Popen(
+        args, shell=shell, cwd=cwd,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    ) as proc:
+        buffers = {proc.stdout: bytearray(), proc.stderr: bytearray()}
+        limits = {
+            proc.stdout: stdout_limit * _MAX_UTF8_CHAR_BYTES,
+            proc.stderr: stderr_limit * _MAX_UTF8_CHAR_BYTES,
+        }
+        try:
+            with selectors.DefaultSelector() as selector:
+                for pipe in buffers:
+                    selector.register(pipe, selectors.EVENT_READ)
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise subprocess.TimeoutExpired(args, timeout)
+                    for key, _ in selector.select(remaining):
+                        chunk = os.read(key.fd, _PIPE_READ_SIZE)
+                        if not chunk:
+                            selector.unregister(key.fileobj)
+                            continue
+                        buf = buffers[key.fileobj]
+                        room = limits[key.fileobj] - len(buf)
+                        if room > 0:
+                            buf += chunk[:room]
+            return_code = proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            raise
+
+    return (
+        return_code,
+        buffers[proc.stdout].decode("utf-8", errors="replace")[:stdout_limit],
+        buffers[proc.stderr].decode("utf-8", errors="replace")[:stderr_limit],
+    )
+
+
 EXECUTOR_SYSTEM_PROMPT = """You are the Executor Agent - a PEER in a multi-agent system.
 
 You work alongside FDA (user interface) and Librarian (knowledge) as equals.
@@ -80,6 +340,54 @@ class ExecutorAgent(BaseAgent):
         "> /dev/sda",
     ]
 
+    # All dangerous patterns in one case-insensitive regex (single pass)
+    _DANGEROUS_RE = re.compile(
+        "|".join(re.escape(p) for p in DANGEROUS_PATTERNS), re.IGNORECASE
+    )
+    # Splits a shell command line into its simple commands
+    _COMMAND_SEPARATOR_RE = re.compile(r"&&|\|\||[;&|\n]")
+    # rm arguments naming the working directory, dangerous after "cd /"
+    _RM_CWD_TARGETS = frozenset({"*", ".", "./", "./*"})
+    # Review responses containing this word approve the task
+    _APPROVED_RE = re.compile(r"approved", re.IGNORECASE)
+
+    # Number of recent commands kept in memory
+    COMMAND_HISTORY_LIMIT = 100
+
+    # Minimum seconds between liveness writes while the status is unchanged
+    HEARTBEAT_INTERVAL = 5.0
+
+    # Error backoff bounds in seconds (sleep is capped, growth is capped)
+    ERROR_BACKOFF_SLEEP_CAP = 30.0
+    ERROR_BACKOFF_MAX = 60.0
+
+    # Journal entries are written in batches of up to this many...
+    JOURNAL_BATCH_SIZE = 20
+    # ...collected for at most this many seconds after the first one
+    JOURNAL_FLUSH_INTERVAL = 0.25
+
+    # Seconds a pre-started Claude Code process may sit unused before the
+    # event loop stops it
+    WARM_CLAUDE_IDLE_TIMEOUT = 600.0
+
+    # Longest blocker reason sentence extracted from a task response
+    MAX_BLOCKER_REASON_LENGTH = 500
+
+    # Task descriptions shorter than this skip the journal lookup
+    MIN_JOURNAL_QUERY_LENGTH = 40
+
+    # Task priority ranks; lower is picked up first
+    PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+    # Interpreter argv prefix for run_script, keyed by file extension.
+    # Extensions not listed are executed directly.
+    SCRIPT_RUNNERS: dict[str, list[str]] = {
+        ".py": ["python"],
+        ".sh": ["bash"],
+        ".bash": ["bash"],
+        ".js": ["node"],
+    }
+
     def __init__(
         self,
         project_state_path: Optional[Path] = None,
@@ -102,7 +410,52 @@ class ExecutorAgent(BaseAgent):
         self.working_directory = working_directory or os.path.expanduser("~")
         self.current_task: Optional[dict[str, Any]] = None
         self.task_start_time: Optional[datetime] = None
-        self.command_history: list[dict[str, Any]] = []
+        self.command_history: deque[dict[str, Any]] = deque(maxlen=self.COMMAND_HISTORY_LIMIT)
+
+        # Last status written to state, used to throttle heartbeat writes
+        self._last_status: Optional[tuple[str, Optional[str]]] = None
+        self._last_heartbeat = 0.0
+        self._error_backoff = 1.0
+
+        # Pre-started `claude --print` process for the next read-only request
+        self._claude_proc: Optional[subprocess.Popen] = None
+        self._claude_proc_cwd: Optional[str] = None
+        self._claude_proc_started = 0.0
+
+        # Change tokens of the message bus and state DB at the last read
+        self._bus_version: Optional[tuple[int, int]] = None
+        self._data_version: Optional[int] = None
+        self._tasks_may_be_pending = True
+
+        # Set by in-process senders so the event loop wakes without waiting
+        self._wake = self.message_bus.wakeup_event(self.name)
+
+        # Journal entries waiting for the background flusher
+        self._journal_queue: queue.Queue = queue.Queue()
+        self._journal_thread: Optional[threading.Thread] = None
+
+        # Message type -> (handler, result type). Handlers with a result type do
+        # real work: they need a body and run inside a busy/running status
+        # bracket. The rest are lightweight and never touch agent status.
+        self._message_handlers: dict[
+            str, tuple[Callable[[dict[str, Any]], None], Optional[str]]
+        ] = {
+            MessageTypes.EXECUTE_REQUEST: (self._handle_execute_request, MessageTypes.EXECUTE_RESULT),
+            MessageTypes.FILE_REQUEST: (self._handle_file_request, MessageTypes.FILE_COMPLETE),
+            MessageTypes.CLAUDE_CODE_REQUEST: (
+                self._handle_claude_code_request, MessageTypes.CLAUDE_CODE_RESULT,
+            ),
+            MessageTypes.STATUS_REQUEST: (self._handle_status_request, None),
+            # Legacy message types for backward compatibility
+            MessageTypes.REVIEW_RESPONSE: (self._handle_review_response, None),
+            "task_assignment": (self._handle_task_assignment, None),
+            "priority_change": (self._handle_priority_change, None),
+        }
+
+        # Searchable text of the journal index (one line per entry) and the
+        # index file version it was built from
+        self._journal_text = ""
+        self._journal_text_version: Optional[tuple[Any, ...]] = None
 
     def run_event_loop(self) -> None:
         """
@@ -116,37 +469,33 @@ class ExecutorAgent(BaseAgent):
         logger.info("[Executor] Starting event loop...")
 
         # Update agent status
-        self.state.update_agent_status(self.name.lower(), "running", "Starting up")
+        self._report_status("running", "Starting up")
 
         # Check for messages frequently (every 1 second) for responsive inter-agent comms
         message_check_interval = 1  # Check messages every 1 second
-        task_check_counter = 0
-        task_check_frequency = 5  # Check for new tasks every 5 message checks
 
         print("[Executor] Ready and listening for requests...")
 
         while self._running:
             try:
-                # Heartbeat
-                self.state.agent_heartbeat(self.name.lower())
-                self.state.update_agent_status(self.name.lower(), "running")
+                # Heartbeat (status upsert also stamps last_heartbeat)
+                self._report_status("running")
+
+                # One fetch of messages and pending tasks per tick
+                messages, pending_tasks = self._fetch_work_items()
 
                 # Process pending messages from peers (highest priority, check frequently!)
-                messages = self.get_pending_messages()
-                for message in messages:
-                    self._handle_message(message)
-
-                # Check for tasks less frequently than messages
-                task_check_counter += 1
-                if task_check_counter >= task_check_frequency and self.current_task is None:
-                    task_check_counter = 0
-                    task = self.pick_up_task()
+                if messages:
+                    self._dispatch_messages(messages)
+
+                # Pick up a task when idle
+                if self.current_task is None and pending_tasks:
+                    task = self.pick_up_task(pending_tasks)
                     if task:
                         self.current_task = task
                         self.task_start_time = datetime.now()
-                        self.state.update_agent_status(
-                            self.name.lower(), "busy",
-                            f"Executing task: {task.get('title', '')[:30]}"
+                        self._report_status(
+                            "busy", f"Executing task: {task.get('title', '')[:30]}"
                         )
                         logger.info(f"[Executor] Picked up task: {task.get('title')}")
 
@@ -161,20 +510,248 @@ class ExecutorAgent(BaseAgent):
 
                         self.current_task = None
                         self.task_start_time = None
-                        self.state.update_agent_status(self.name.lower(), "running")
+                        self._report_status("running")
 
-                time.sleep(message_check_interval)
+                # Don't keep an unused warm Claude Code process around forever
+                if (
+                    self._claude_proc is not None
+                    and time.monotonic() - self._claude_proc_started > self.WARM_CLAUDE_IDLE_TIMEOUT
+                ):
+                    self._release_warm_claude()
+
+                # Successful iteration - relax any error backoff
+                self._error_backoff = max(1.0, self._error_backoff / 2)
+
+                # Sleep until the next tick, or until a message is sent to us
+                self._wake.wait(timeout=message_check_interval)
+                self._wake.clear()
 
             except KeyboardInterrupt:
                 logger.info("[Executor] Received shutdown signal")
                 break
             except Exception as e:
                 logger.error(f"[Executor] Error in event loop: {e}")
-                time.sleep(60)
+                self._backoff_after_error()
 
-        self.state.update_agent_status(self.name.lower(), "stopped")
+        self._release_warm_claude()
+        self._stop_journal_flusher()
+        self._report_status("stopped")
         logger.info("[Executor] Event loop stopped")
 
+    def _fetch_work_items(self) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        Fetch pending messages and pending tasks for one loop tick.
+
+        Messages live in the bus file and tasks in SQLite, so they cannot
+        share a query. Instead, each source is read only when its change token
+        has moved since the last read: the bus file's (mtime, size) and
+        SQLite's data_version. Pending tasks are also re-read after a task
+        was picked up, since more may be queued.
+
+        Returns:
+            Tuple of (pending messages, pending tasks).
+        """
+        messages: list[dict[str, Any]] = []
+        bus_version = self.message_bus.get_version()
+        if bus_version != self._bus_version:
+            messages = self.get_pending_messages()
+            # Only remember the version once the read succeeded, so a
+            # failed read is retried on the next tick
+            self._bus_version = bus_version
+
+        pending_tasks: list[dict[str, Any]] = []
+        if self.current_task is None:
+            data_version = self.state.get_data_version()
+            if self._tasks_may_be_pending or data_version != self._data_version:
+                pending_tasks = self.state.get_tasks(status="pending")
+                self._data_version = data_version
+                self._tasks_may_be_pending = False
+
+        return messages, pending_tasks
+
+    def _dispatch_messages(self, messages: list[dict[str, Any]]) -> None:
+        """
+        Handle a batch of peer messages, then mark them read in one bus write.
+
+        Messages are marked read only after they are handled. If a handler
+        raises, that message is still marked read so it is not retried
+        forever, but the rest of the batch stays unread; the bus write
+        changes its version, so they are fetched again on the next tick.
+
+        Args:
+            messages: Pending messages, in the order to handle them.
+        """
+        handled: list[str] = []
+        try:
+            for message in messages:
+                handled.append(message.get("id", ""))
+                self._handle_message(message)
+        finally:
+            self.message_bus.mark_read_batch(handled)
+
+    def wake(self) -> None:
+        """Wake the event loop early, e.g. after queueing work for it."""
+        self._wake.set()
+
+    def stop(self) -> None:
+        """
+        Stop the event loop without waiting for the current tick to end.
+
+        Also stops any pre-started Claude Code process, which is otherwise
+        only cleaned up when the event loop exits.
+        """
+        super().stop()
+        self._wake.set()
+        self._release_warm_claude()
+
+    def _backoff_after_error(self) -> None:
+        """
+        Sleep with jittered exponential backoff after an event loop error.
+
+        The heartbeat keeps being written during the wait so the agent is
+        not reported dead while it recovers.
+        """
+        delay = min(self.ERROR_BACKOFF_SLEEP_CAP, self._error_backoff) * random.uniform(0.5, 1.5)
+        self._error_backoff = min(self.ERROR_BACKOFF_MAX, self._error_backoff * 2)
+
+        deadline = time.monotonic() + delay
+        while self._running:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                self.state.agent_heartbeat(self.name.lower())
+            except Exception as e:
+                logger.debug(f"[Executor] Heartbeat failed during backoff: {e}")
+            time.sleep(min(self.HEARTBEAT_INTERVAL, remaining))
+
+    def _queue_journal(
+        self,
+        summary: str,
+        content: Union[str, Callable[[], str]],
+        tags: Optional[list[str]] = None,
+        relevance_decay: str = "medium",
+    ) -> None:
+        """
+        Queue a journal entry for the background flusher.
+
+        Takes the same arguments as ``log_to_journal`` but returns
+        immediately; entries are written in batches off the event loop.
+        ``content`` may be a zero-argument callable, in which case the
+        (possibly large) markdown is only built by the flusher thread.
+        """
+        if self._journal_thread is None:
+            self._journal_thread = threading.Thread(
+                target=self._journal_flusher,
+                name="executor-journal",
+                daemon=True,
+            )
+            self._journal_thread.start()
+
+        self._journal_queue.put({
+            "author": self.name,
+            "tags": tags or [self.name.lower()],
+            "summary": summary,
+            "content": content,
+            "relevance_decay": relevance_decay,
+        })
+
+    def _journal_flusher(self) -> None:
+        """Background thread that writes queued journal entries in batches."""
+        while True:
+            entry = self._journal_queue.get()
+            if entry is None:
+                return
+
+            batch = [entry]
+            stop = False
+            deadline = time.monotonic() + self.JOURNAL_FLUSH_INTERVAL
+            while len(batch) < self.JOURNAL_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = self._journal_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if entry is None:
+                    stop = True
+                    break
+                batch.append(entry)
+
+            try:
+                for item in batch:
+                    if callable(item["content"]):
+                        item["content"] = item["content"]()
+                self.journal_writer.write_entries(self._coalesce_command_entries(batch))
+            except Exception as e:
+                logger.error(f"[Executor] Failed to write {len(batch)} journal entries: {e}")
+
+            if stop:
+                return
+
+    @staticmethod
+    def _coalesce_command_entries(batch: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Merge the command-execution entries of a batch into one entry.
+
+        A burst of commands then produces a single journal file and index
+        update instead of one per command. Other entries are left as-is.
+
+        Args:
+            batch: Resolved journal entries, in queue order.
+
+        Returns:
+            The batch with command entries merged at the first one's position.
+        """
+        commands = [e for e in batch if "command" in e["tags"]]
+        if len(commands) < 2:
+            return batch
+
+        merged = dict(commands[0])
+        merged["summary"] = f"Commands executed: {len(commands)} (first: {commands[0]['summary']})"
+        merged["content"] = "\n\n".join(e["content"] for e in commands)
+
+        result = []
+        for entry in batch:
+            if entry is commands[0]:
+                result.append(merged)
+            elif "command" not in entry["tags"]:
+                result.append(entry)
+        return result
+
+    def _stop_journal_flusher(self) -> None:
+        """Flush any queued journal entries and stop the flusher thread."""
+        if self._journal_thread is None:
+            return
+        self._journal_queue.put(None)
+        self._journal_thread.join(timeout=10)
+        self._journal_thread = None
+
+    def _report_status(self, status: str, detail: Optional[str] = None) -> None:
+        """
+        Record the agent's status and heartbeat in a single state write.
+
+        ``update_agent_status`` upserts ``last_heartbeat`` together with the
+        status, so no separate ``agent_heartbeat`` call is needed. Repeats of
+        an unchanged status are skipped until ``HEARTBEAT_INTERVAL`` elapses,
+        which is still often enough for liveness checks.
+
+        Args:
+            status: Agent status (running, busy, stopped).
+            detail: Optional description of the current activity.
+        """
+        now = time.monotonic()
+        if (
+            (status, detail) == self._last_status
+            and now - self._last_heartbeat < self.HEARTBEAT_INTERVAL
+        ):
+            return
+
+        self.state.update_agent_status(self.name.lower(), status, detail)
+        self._last_status = (status, detail)
+        self._last_heartbeat = now
+
     def _handle_message(self, message: dict[str, Any]) -> None:
         """Handle an incoming message from a peer agent."""
         msg_type = message.get("type", "")
@@ -183,41 +760,38 @@ class ExecutorAgent(BaseAgent):
         from_agent = message.get("from", "")
         msg_id = message.get("id", "")
 
+        # Messages are marked read in bulk once handled (see _dispatch_messages)
         logger.info(f"[Executor] Received {msg_type} from {from_agent}: {subject}")
-        self.message_bus.mark_read(msg_id)
-
-        # Update status while processing
-        self.state.update_agent_status(self.name.lower(), "busy", f"Processing {msg_type}")
-
-        try:
-            if msg_type == MessageTypes.EXECUTE_REQUEST:
-                self._handle_execute_request(message)
-
-            elif msg_type == MessageTypes.FILE_REQUEST:
-                self._handle_file_request(message)
-
-            elif msg_type == MessageTypes.STATUS_REQUEST:
-                self._handle_status_request(message)
-
-            elif msg_type == MessageTypes.CLAUDE_CODE_REQUEST:
-                self._handle_claude_code_request(message)
 
-            # Legacy message types for backward compatibility
-            elif msg_type == "review_response":
-                self._handle_review_response(message)
+        handler, result_type = self._message_handlers.get(msg_type, (None, None))
+        if handler is None:
+            return
 
-            elif msg_type == "task_assignment":
-                logger.info(f"[Executor] Received task assignment: {subject}")
+        # Work requests without a usable body fail fast, before any DB writes
+        if result_type is not None and not (isinstance(body, str) and body.strip()):
+            self.message_bus.send_result(
+                from_agent=self.name.lower(),
+                to_agent=from_agent.lower(),
+                msg_type=result_type,
+                result=None,
+                success=False,
+                error="Empty or invalid request body",
+                reply_to=msg_id,
+            )
+            return
 
-            elif msg_type == "priority_change":
-                logger.info(f"[Executor] Priority change: {body}")
+        # Update status while processing (lightweight handlers skip this)
+        if result_type is not None:
+            self._report_status("busy", f"Processing {msg_type}")
 
+        try:
+            handler(message)
         except Exception as e:
             logger.error(f"[Executor] Error handling message: {e}")
             self.message_bus.send_result(
                 from_agent=self.name.lower(),
                 to_agent=from_agent.lower(),
-                msg_type=MessageTypes.EXECUTE_RESULT,
+                msg_type=result_type or MessageTypes.EXECUTE_RESULT,
                 result=None,
                 success=False,
                 error=str(e),
@@ -225,7 +799,16 @@ class ExecutorAgent(BaseAgent):
             )
 
         # Reset status
-        self.state.update_agent_status(self.name.lower(), "running")
+        if result_type is not None:
+            self._report_status("running")
+
+    def _handle_task_assignment(self, message: dict[str, Any]) -> None:
+        """Log a legacy task assignment; tasks are picked up from the queue."""
+        logger.info(f"[Executor] Received task assignment: {message.get('subject', '')}")
+
+    def _handle_priority_change(self, message: dict[str, Any]) -> None:
+        """Log a legacy priority change notification."""
+        logger.info(f"[Executor] Priority change: {message.get('body', '')}")
 
     def _handle_execute_request(self, message: dict[str, Any]) -> None:
         """Handle a command execution request from a peer."""
@@ -237,7 +820,7 @@ class ExecutorAgent(BaseAgent):
         try:
             request = json.loads(body)
             command = request.get("command", "")
-            cwd = request.get("cwd", self.working_directory)
+            cwd = request.get("cwd") or self.working_directory
         except (json.JSONDecodeError, TypeError):
             command = body
             cwd = self.working_directory
@@ -325,7 +908,9 @@ class ExecutorAgent(BaseAgent):
             "commands_executed": len(self.command_history),
             "recent_commands": [
                 {"command": c.get("command", "")[:50], "success": c.get("success")}
-                for c in self.command_history[-5:]
+                for c in itertools.islice(
+                    self.command_history, max(0, len(self.command_history) - 5), None
+                )
             ],
         }
 
@@ -353,7 +938,7 @@ class ExecutorAgent(BaseAgent):
         try:
             request = json.loads(body)
             prompt = request.get("prompt", "")
-            cwd = request.get("cwd", self.working_directory)
+            cwd = request.get("cwd") or self.working_directory
             allow_edits = request.get("allow_edits", False)
             timeout = request.get("timeout", 300)  # 5 minute default
         except (json.JSONDecodeError, TypeError):
@@ -418,14 +1003,26 @@ class ExecutorAgent(BaseAgent):
 
         logger.info(f"[Executor] Running Claude Code in {cwd}")
 
+        # Read-only runs reuse a pre-started process that takes the prompt on stdin
+        warm_proc = None if allow_edits else self._take_warm_claude(cwd)
+
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
+            if warm_proc is not None:
+                stdout, stderr = warm_proc.communicate(prompt, timeout=timeout)
+                result = subprocess.CompletedProcess(
+                    warm_proc.args, warm_proc.returncode, stdout, stderr,
+                )
+            else:
+                result = subprocess.run(
+                    cmd,
+                    cwd=cwd,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                )
+
+            if not allow_edits:
+                self._prewarm_claude(cwd)
 
             success = result.returncode == 0
             output = result.stdout
@@ -457,6 +1054,8 @@ class ExecutorAgent(BaseAgent):
                 }
 
         except subprocess.TimeoutExpired:
+            if warm_proc is not None:
+                self._discard_claude_proc(warm_proc)
             error_msg = f"Claude Code timed out after {timeout} seconds"
             logger.error(f"[Executor] {error_msg}")
             return {
@@ -480,53 +1079,110 @@ class ExecutorAgent(BaseAgent):
                 "prompt": prompt,
             }
 
+    def _prewarm_claude(self, cwd: str) -> None:
+        """
+        Start a read-only Claude Code process ahead of the next request.
+
+        ``claude --print`` reads its prompt from stdin when none is given on
+        the command line, so the process can finish its Node.js startup
+        while idle and answer the next prompt for the same directory.
+
+        Args:
+            cwd: Working directory the process is started in.
+        """
+        self._discard_claude_proc(self._claude_proc)
+        try:
+            self._claude_proc = subprocess.Popen(
+                ["claude", "--print"],
+                cwd=cwd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+            self._claude_proc_cwd = cwd
+            self._claude_proc_started = time.monotonic()
+        except OSError as e:
+            logger.debug(f"[Executor] Could not pre-warm Claude Code: {e}")
+            self._claude_proc = None
+            self._claude_proc_cwd = None
+
+    def _take_warm_claude(self, cwd: str) -> Optional[subprocess.Popen]:
+        """
+        Hand over the pre-warmed Claude Code process if it fits the request.
+
+        Args:
+            cwd: Working directory of the request.
+
+        Returns:
+            A live process started in ``cwd``, or None to use a fresh one.
+        """
+        proc, self._claude_proc = self._claude_proc, None
+        if proc is None:
+            return None
+        if proc.poll() is not None or self._claude_proc_cwd != cwd:
+            self._discard_claude_proc(proc)
+            return None
+        return proc
+
+    def _release_warm_claude(self) -> None:
+        """Stop the pre-started Claude Code process, if any."""
+        proc, self._claude_proc = self._claude_proc, None
+        self._discard_claude_proc(proc)
+
+    @staticmethod
+    def _discard_claude_proc(proc: Optional[subprocess.Popen]) -> None:
+        """Kill and reap a Claude Code process that will not be used."""
+        if proc is None:
+            return
+        if proc.poll() is None:
+            proc.kill()
+        try:
+            proc.communicate(timeout=5)
+        except (subprocess.TimeoutExpired, ValueError, OSError):
+            pass
+
     def _handle_review_response(self, message: dict[str, Any]) -> None:
         """Handle a review response from FDA."""
         body = message.get("body", "")
 
         # Parse the review response
-        if "approved" in body.lower():
+        if self._APPROVED_RE.search(body):
             logger.info("[Executor] Task approved by FDA")
             # Task is complete, no further action needed
         else:
             logger.info("[Executor] Task needs revision based on FDA feedback")
             # Could trigger re-work of the task
 
-    def pick_up_task(self) -> Optional[dict[str, Any]]:
+    def pick_up_task(
+        self, pending_tasks: Optional[list[dict[str, Any]]] = None
+    ) -> Optional[dict[str, Any]]:
         """
         Pick up a task from the queue.
 
+        Args:
+            pending_tasks: Already-fetched pending tasks; fetched from state
+                when omitted.
+
         Returns:
             Task dictionary if available, None otherwise.
         """
         # Get pending tasks
-        pending_tasks = self.state.get_tasks(status="pending")
+        if pending_tasks is None:
+            pending_tasks = self.state.get_tasks(status="pending")
 
         if not pending_tasks:
             return None
 
-        # Sort by priority (high first) then by creation date (oldest first)
-        priority_order = {"high": 0, "medium": 1, "low": 2}
-
-        sorted_tasks = sorted(
-            pending_tasks,
-            key=lambda t: (
-                priority_order.get(t.get("priority", "medium"), 1),
-                t.get("created_at", ""),
-            ),
-        )
-
-        if not sorted_tasks:
-            return None
-
-        # Pick up the highest priority task
-        task = sorted_tasks[0]
+        # Pick up the highest priority task, oldest first within a priority
+        task = min(pending_tasks, key=self._task_order_key)
 
         # Update task status to in_progress
         self.state.update_task(task["id"], status="in_progress", owner=self.name)
+        self._tasks_may_be_pending = True
 
         # Log the pickup
-        self.log_to_journal(
+        self._queue_journal(
             summary=f"Task picked up: {task.get('title')}",
             content=f"Started working on task {task.get('id')}: {task.get('title')}\n\nDescription: {task.get('description')}",
             tags=["task-pickup", "executor"],
@@ -535,6 +1191,22 @@ class ExecutorAgent(BaseAgent):
 
         return task
 
+    @classmethod
+    def _task_order_key(cls, task: dict[str, Any]) -> tuple[int, str]:
+        """
+        Sort key for pending tasks: priority first, then oldest first.
+
+        Args:
+            task: Task dictionary.
+
+        Returns:
+            Tuple of (priority rank, created_at).
+        """
+        return (
+            cls.PRIORITY_ORDER.get(task.get("priority", "medium"), 1),
+            task.get("created_at", ""),
+        )
+
     def execute_task(self, task: dict[str, Any]) -> dict[str, Any]:
         """
         Execute a given task.
@@ -552,11 +1224,14 @@ class ExecutorAgent(BaseAgent):
         logger.info(f"[Executor] Executing task: {title}")
 
         # Build context for the task
-        context = self.get_project_context()
+        context = self.get_project_context_cached()
         context["current_task"] = task
 
         # Search for relevant journal entries
-        relevant = self.search_journal(f"{title} {description}", top_n=3)
+        query = f"{title} {description}"
+        relevant = []
+        if self._journal_may_match(query, description):
+            relevant = self.search_journal(query, top_n=3)
         if relevant:
             context["relevant_history"] = [
                 {"summary": e.get("summary"), "author": e.get("author")}
@@ -583,15 +1258,13 @@ If you encounter any blockers that prevent completion, clearly state them."""
 
         response = self.chat_with_context(prompt, context)
 
-        # Analyze the response to determine status
-        is_blocked = any(
-            phrase in response.lower()
-            for phrase in ["blocker", "blocked by", "cannot proceed", "waiting for", "dependency"]
-        )
+        # Analyze the response to determine status (one case-insensitive scan)
+        finished_at = datetime.now().isoformat()
+        blocker_match = _BLOCKER_RE.search(response)
 
-        if is_blocked:
+        if blocker_match is not None:
             # Extract the blocker reason
-            blocker_reason = self._extract_blocker_reason(response)
+            blocker_reason = self._extract_blocker_reason(response, blocker_match.start())
 
             # Update task status
             self.state.update_task(task_id, status="blocked")
@@ -601,16 +1274,16 @@ If you encounter any blockers that prevent completion, clearly state them."""
                 "task_id": task_id,
                 "reason": blocker_reason,
                 "response": response,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": finished_at,
             }
 
         # Task completed successfully
         self.state.update_task(task_id, status="completed")
 
         # Log completion
-        self.log_to_journal(
+        self._queue_journal(
             summary=f"Task completed: {title}",
-            content=f"## Task Execution: {title}\n\n{response}",
+            content=lambda: f"## Task Execution: {title}\n\n{response}",
             tags=["task-complete", "executor"],
             relevance_decay="medium",
         )
@@ -619,27 +1292,74 @@ If you encounter any blockers that prevent completion, clearly state them."""
             "status": "completed",
             "task_id": task_id,
             "response": response,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": finished_at,
         }
 
-    def _extract_blocker_reason(self, response: str) -> str:
-        """Extract the blocker reason from a response."""
-        # Simple extraction - look for common patterns
-        response_lower = response.lower()
-
-        for keyword in ["blocked by", "waiting for", "blocker:", "cannot proceed because"]:
-            idx = response_lower.find(keyword)
-            if idx != -1:
-                # Extract the next sentence or line
-                start = idx
-                end = response.find(".", start)
-                if end == -1:
-                    end = response.find("\n", start)
-                if end == -1:
-                    end = min(start + 200, len(response))
-                return response[start:end].strip()
-
-        return "Blocker identified in task execution"
+    def _journal_may_match(self, query: str, description: str) -> bool:
+        """
+        Cheap pre-check before running a journal search for a task.
+
+        Trivial tasks (short descriptions) skip the search. Otherwise the
+        query is matched the way JournalIndex.search matches it (the whole
+        query or any of its words as a substring of an entry's summary and
+        tags), but against one cached string holding every entry, so a
+        search is only skipped when it could not return anything.
+
+        Args:
+            query: The search query built from the task.
+            description: The task description.
+
+        Returns:
+            True if the journal search is worth running.
+        """
+        if len(description) < self.MIN_JOURNAL_QUERY_LENGTH:
+            return False
+
+        index = self.journal_retriever.index
+        try:
+            stat = index.index_path.stat()
+            version = (stat.st_mtime_ns, stat.st_size, len(index.entries))
+        except OSError:
+            version = (None, None, len(index.entries))
+        if version != self._journal_text_version:
+            # Newlines keep a query word from matching across two entries
+            self._journal_text = "\n".join(
+                f"{entry.get('summary', '')} {' '.join(entry.get('tags', []))}".lower()
+                for entry in index.entries
+            )
+            self._journal_text_version = version
+
+        keywords = query.lower()
+        text = self._journal_text
+        return keywords in text or any(word in text for word in keywords.split())
+
+    def _extract_blocker_reason(self, response: str, search_from: int = 0) -> str:
+        """
+        Extract the blocker reason from a response.
+
+        Args:
+            response: The task response text.
+            search_from: Offset to start looking from, e.g. where blocker
+                detection already matched (no reason phrase occurs earlier).
+
+        Returns:
+            The sentence starting at the first reason phrase, or a default.
+        """
+        # Simple extraction - find the first reason phrase
+        match = _BLOCKER_REASON_RE.search(response, search_from)
+        if match is None:
+            return "Blocker identified in task execution"
+
+        # Extract the next sentence or line, looking only a bounded distance
+        # ahead so a huge response without punctuation is not scanned twice
+        start = match.start()
+        window_end = start + self.MAX_BLOCKER_REASON_LENGTH
+        end = response.find(".", start, window_end)
+        if end == -1:
+            end = response.find("\n", start, window_end)
+        if end == -1:
+            end = min(start + 200, len(response))
+        return response[start:end].strip()
 
     def request_review(self, task_id: str) -> dict[str, Any]:
         """
@@ -654,8 +1374,7 @@ If you encounter any blockers that prevent completion, clearly state them."""
         logger.info(f"[Executor] Requesting review for task: {task_id}")
 
         # Get task details
-        tasks = self.state.get_tasks()
-        task = next((t for t in tasks if t.get("id") == task_id), None)
+        task = self.state.get_task(task_id)
 
         if not task:
             return {
@@ -693,8 +1412,7 @@ If you encounter any blockers that prevent completion, clearly state them."""
         logger.info(f"[Executor] Reporting blocker for task: {task_id}")
 
         # Get task details
-        tasks = self.state.get_tasks()
-        task = next((t for t in tasks if t.get("id") == task_id), None)
+        task = self.state.get_task(task_id)
 
         task_title = task.get("title", task_id) if task else task_id
 
@@ -714,7 +1432,7 @@ If you encounter any blockers that prevent completion, clearly state them."""
         )
 
         # Log to journal
-        self.log_to_journal(
+        self._queue_journal(
             summary=f"Blocker reported: {task_title}",
             content=f"## Blocker Report\n\nTask: {task_title}\nID: {task_id}\n\nReason:\n{reason}",
             tags=["blocker", "escalation"],
@@ -797,8 +1515,7 @@ Please provide:
             Handoff confirmation.
         """
         # Get task details
-        tasks = self.state.get_tasks()
-        task = next((t for t in tasks if t.get("id") == task_id), None)
+        task = self.state.get_task(task_id)
 
         if not task:
             return {"status": "error", "message": f"Task {task_id} not found"}
@@ -816,7 +1533,7 @@ Please provide:
         )
 
         # Log the handoff
-        self.log_to_journal(
+        self._queue_journal(
             summary=f"Task handoff: {task.get('title')} to {to_agent}",
             content=f"Handed off task {task_id} to {to_agent}.\nReason: {reason}",
             tags=["handoff", "task-transfer"],
@@ -840,7 +1557,7 @@ Please provide:
 
     def run_command(
         self,
-        command: str,
+        command: Union[str, list[str]],
         cwd: Optional[str] = None,
         timeout: int = 60,
         shell: bool = True,
@@ -849,14 +1566,22 @@ Please provide:
         Execute a shell command.
 
         Args:
-            command: The command to execute.
+            command: The command to execute. A list is treated as an argv
+                and executed directly, without a shell.
             cwd: Working directory (defaults to self.working_directory).
             timeout: Command timeout in seconds.
-            shell: Whether to run through shell (default True).
+            shell: Whether to run through shell (default True; ignored
+                for argv lists).
 
         Returns:
             Dictionary with stdout, stderr, return_code, and success.
         """
+        argv = None
+        if isinstance(command, list):
+            argv = [os.fspath(arg) for arg in command]
+            command = shlex.join(argv)
+            shell = False
+
         # Safety check for dangerous commands
         if self._is_dangerous_command(command):
             logger.warning(f"[Executor] Blocked dangerous command: {command}")
@@ -877,23 +1602,21 @@ Please provide:
         logger.info(f"[Executor] Running: {command} in {working_dir}")
 
         try:
-            result = subprocess.run(
-                command,
+            _validated_cwd(working_dir)
+            return_code, stdout, stderr = _run_capped(
+                argv if argv is not None else command,
                 shell=shell,
                 cwd=working_dir,
-                capture_output=True,
-                text=True,
                 timeout=timeout,
             )
 
             output = {
                 "command": command,
                 "cwd": working_dir,
-                "stdout": result.stdout[:10000] if result.stdout else "",  # Limit output
-                "stderr": result.stderr[:5000] if result.stderr else "",
-                "return_code": result.returncode,
-                "success": result.returncode == 0,
-                "timestamp": datetime.now().isoformat(),
+                "stdout": stdout,
+                "stderr": stderr,
+                "return_code": return_code,
+                "success": return_code == 0,
             }
 
         except subprocess.TimeoutExpired:
@@ -905,7 +1628,6 @@ Please provide:
                 "return_code": -1,
                 "success": False,
                 "error": "timeout",
-                "timestamp": datetime.now().isoformat(),
             }
 
         except Exception as e:
@@ -917,21 +1639,19 @@ Please provide:
                 "return_code": -1,
                 "success": False,
                 "error": str(e),
-                "timestamp": datetime.now().isoformat(),
             }
 
-        # Add to history
-        self.command_history.append(output)
+        # One completion timestamp, whichever way the command ended
+        output["timestamp"] = datetime.now().isoformat()
 
-        # Keep history manageable
-        if len(self.command_history) > 100:
-            self.command_history = self.command_history[-100:]
+        # Add to history (the deque drops the oldest entry once full)
+        self.command_history.append(output)
 
         # Log to journal if it's a significant command
         if output["success"] and len(command) > 10:
-            self.log_to_journal(
+            self._queue_journal(
                 summary=f"Command executed: {command[:50]}",
-                content=f"## Command Execution\n\nCommand: `{command}`\nWorking Directory: {working_dir}\n\nOutput:\n```\n{output['stdout'][:1000]}\n```",
+                content=lambda: f"## Command Execution\n\nCommand: `{command}`\nWorking Directory: {working_dir}\n\nOutput:\n```\n{output['stdout'][:1000]}\n```",
                 tags=["command", "execution"],
                 relevance_decay="fast",
             )
@@ -963,33 +1683,83 @@ Please provide:
                 "error": f"Script not found: {script_path}",
             }
 
-        # Determine how to run the script based on extension
-        ext = path.suffix.lower()
-        args = args or []
-
-        if ext == ".py":
-            cmd = f"python {script_path} {' '.join(args)}"
-        elif ext in [".sh", ".bash"]:
-            cmd = f"bash {script_path} {' '.join(args)}"
-        elif ext == ".js":
-            cmd = f"node {script_path} {' '.join(args)}"
-        else:
-            # Try to run it directly if executable
-            cmd = f"{script_path} {' '.join(args)}"
+        # Determine how to run the script based on extension. The argv list
+        # runs without a shell, so arguments are passed through verbatim.
+        # Unknown extensions are run directly, if executable.
+        runner = self.SCRIPT_RUNNERS.get(path.suffix.lower(), [])
+        cmd = [*runner, str(path.resolve()), *(args or [])]
 
         return self.run_command(cmd, cwd=str(path.parent), timeout=timeout)
 
     def _is_dangerous_command(self, command: str) -> bool:
         """Check if a command is potentially dangerous."""
+        if self._DANGEROUS_RE.search(command):
+            return True
+
+        # Check for rm -rf with root paths anywhere in the command line
         command_lower = command.lower().strip()
+        if "rm " in command_lower and "-rf" in command_lower and " /" in command_lower:
+            return True
 
-        for pattern in self.DANGEROUS_PATTERNS:
-            if pattern in command_lower:
-                return True
+        # ...and for recursive forced rm of root, whatever the flag spelling
+        return self._rm_rf_targets_root(command)
+
+    def _rm_rf_targets_root(self, command: str) -> bool:
+        """
+        Check for a recursive, forced rm of an absolute path or the home dir.
+
+        Each simple command is tokenized, so the flags may come in any form
+        or order (-rf, -fr, -Rf, -r -f, --recursive --force). After a cd to
+        an absolute path or home, removing the working directory (*, .)
+        counts too.
 
-        # Check for rm -rf with root paths
-        if "rm " in command_lower and "-rf" in command_lower:
-            if " /" in command_lower or command_lower.endswith(" /"):
+        Args:
+            command: Shell command line.
+
+        Returns:
+            True if some rm in the command line removes such a target.
+        """
+        cwd_is_root = False
+        for segment in self._COMMAND_SEPARATOR_RE.split(command):
+            try:
+                words = shlex.split(segment)
+            except ValueError:
+                words = segment.split()
+            if not words:
+                continue
+
+            if words[0] == "cd":
+                # A bare "cd" goes home
+                cwd_is_root = len(words) == 1 or words[1].startswith(("/", "~"))
+                continue
+
+            # rm may follow sudo, env, ... or be given by its full path
+            rm_at = next(
+                (i for i, word in enumerate(words) if os.path.basename(word).lower() == "rm"),
+                None,
+            )
+            if rm_at is None:
+                continue
+
+            recursive = force = options_done = False
+            targets = []
+            for arg in words[rm_at + 1:]:
+                if options_done or not arg.startswith("-") or arg == "-":
+                    targets.append(arg)
+                elif arg == "--":
+                    options_done = True
+                elif arg.startswith("--"):
+                    recursive = recursive or arg == "--recursive"
+                    force = force or arg == "--force"
+                else:
+                    recursive = recursive or "r" in arg.lower()
+                    force = force or "f" in arg.lower()
+
+            if recursive and force and any(
+                target.startswith(("/", "~", "$HOME"))
+                or (cwd_is_root and target in self._RM_CWD_TARGETS)
+                for target in targets
+            ):
                 return True
 
         return False
@@ -1007,6 +1777,23 @@ Please provide:
         Returns:
             Result dictionary with success status.
         """
+        try:
+            data = content.encode("utf-8")
+        except UnicodeEncodeError as e:
+            return {"success": False, "path": path, "error": str(e)}
+        return self.create_file_bytes(path, data)
+
+    def create_file_bytes(self, path: str, data: bytes) -> dict[str, Any]:
+        """
+        Create a new file from already-encoded bytes.
+
+        Args:
+            path: File path to create.
+            data: File content, written as-is.
+
+        Returns:
+            Result dictionary with success status and size in bytes.
+        """
         try:
             file_path = Path(path)
 
@@ -1014,14 +1801,14 @@ Please provide:
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Write the file
-            file_path.write_text(content, encoding="utf-8")
+            _write_bytes(file_path, data)
 
             logger.info(f"[Executor] Created file: {path}")
 
             # Log to journal
-            self.log_to_journal(
+            self._queue_journal(
                 summary=f"Created file: {file_path.name}",
-                content=f"Created file at {path}\nSize: {len(content)} bytes",
+                content=f"Created file at {path}\nSize: {len(data)} bytes",
                 tags=["file-create"],
                 relevance_decay="fast",
             )
@@ -1029,7 +1816,7 @@ Please provide:
             return {
                 "success": True,
                 "path": str(file_path.absolute()),
-                "size": len(content),
+                "size": len(data),
             }
 
         except Exception as e:
@@ -1051,21 +1838,49 @@ Please provide:
         Returns:
             Result dictionary with success status.
         """
+        try:
+            data = content.encode("utf-8")
+        except UnicodeEncodeError as e:
+            return {"success": False, "path": path, "error": str(e)}
+        return self.edit_file_bytes(path, data)
+
+    def edit_file_bytes(self, path: str, data: bytes) -> dict[str, Any]:
+        """
+        Overwrite an existing file with already-encoded bytes.
+
+        Args:
+            path: File path to edit.
+            data: New file content, written as-is.
+
+        Returns:
+            Result dictionary with success status and sizes in bytes.
+        """
         file_path = Path(path)
 
-        if not file_path.exists():
+        # A single stat of the resolved target serves as the existence
+        # check and supplies the original size and permissions.
+        try:
+            target = file_path.resolve(strict=True)
+            original = target.stat()
+        except FileNotFoundError:
             return {
                 "success": False,
                 "path": path,
                 "error": "File does not exist",
             }
+        except (OSError, RuntimeError) as e:
+            # e.g. permission denied or a symlink loop
+            return {
+                "success": False,
+                "path": path,
+                "error": str(e),
+            }
 
         try:
-            # Read original for logging
-            original_size = file_path.stat().st_size
+            original_size = original.st_size
 
-            # Write new content
-            file_path.write_text(content, encoding="utf-8")
+            # Write new content atomically, keeping the original permissions
+            _replace_bytes(target, data, stat.S_IMODE(original.st_mode))
 
             logger.info(f"[Executor] Edited file: {path}")
 
@@ -1073,7 +1888,7 @@ Please provide:
                 "success": True,
                 "path": str(file_path.absolute()),
                 "original_size": original_size,
-                "new_size": len(content),
+                "new_size": len(data),
             }
 
         except Exception as e:
@@ -1096,7 +1911,11 @@ Please provide:
         """
         file_path = Path(path)
 
-        if not file_path.exists():
+        # One lstat decides everything: symlinks (even dangling ones) are
+        # unlinked rather than followed.
+        try:
+            st = file_path.lstat()
+        except FileNotFoundError:
             return {
                 "success": False,
                 "path": path,
@@ -1104,7 +1923,9 @@ Please provide:
             }
 
         try:
-            if file_path.is_dir():
+            if stat.S_ISDIR(st.st_mode):
+                # rmtree already walks with scandir and directory fds, using
+                # the cached dirent type instead of a stat per entry
                 shutil.rmtree(file_path)
             else:
                 file_path.unlink()
@@ -1124,16 +1945,20 @@ Please provide:
                 "error": str(e),
             }
 
-    def read_file(self, path: str, max_size: int = 100000) -> dict[str, Any]:
+    def read_file(
+        self, path: str, max_size: int = 100000, decode: bool = True
+    ) -> dict[str, Any]:
         """
         Read a file's contents.
 
         Args:
             path: File path to read.
-            max_size: Maximum bytes to read.
+            max_size: Maximum characters to read (bytes for ``mapping``).
+            decode: When False, return a ``MappedFile`` under ``mapping``
+                instead of decoded ``content``; the caller must close it.
 
         Returns:
-            Result dictionary with content.
+            Result dictionary with content (or mapping).
         """
         file_path = Path(path)
 
@@ -1153,15 +1978,32 @@ Please provide:
 
         try:
             size = file_path.stat().st_size
+            truncated = size > max_size
+
+            if not decode:
+                return {
+                    "success": True,
+                    "path": str(file_path.absolute()),
+                    "mapping": MappedFile(file_path, max_size),
+                    "size": size,
+                    "truncated": truncated,
+                }
 
-            if size > max_size:
+            if size > MMAP_READ_THRESHOLD:
+                # Large file: decode straight from the page cache mapping
+                with open(file_path, "rb") as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    # Enough bytes for max_size characters, cut like read(max_size)
+                    window = mm[:max_size * _MAX_UTF8_CHAR_BYTES]
+                    content = window.decode("utf-8", errors="ignore")[:max_size]
+            elif truncated:
                 # Read only first part
                 with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
                     content = f.read(max_size)
-                truncated = True
             else:
                 content = file_path.read_text(encoding="utf-8", errors="ignore")
-                truncated = False
 
             return {
                 "success": True,
@@ -1202,9 +2044,9 @@ Please provide:
 
         try:
             if src_path.is_dir():
-                shutil.copytree(source, destination)
+                shutil.copytree(source, destination, copy_function=_fast_copy)
             else:
-                shutil.copy2(source, destination)
+                _fast_copy(source, destination)
 
             logger.info(f"[Executor] Copied {source} to {destination}")
 
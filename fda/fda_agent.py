@@ -6,13 +6,18 @@ via Discord voice (primary) and Telegram (secondary), and delegates work
 to the Worker agent for code analysis, fixes, and deployments.
 """
 
+import hashlib
+import itertools
 import logging
+import threading
 import time
 import json
 import re
 import os
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 from datetime import datetime
 
 import requests
@@ -23,14 +28,142 @@ from fda.base_agent import BaseAgent
 from fda.config import (
     MODEL_FDA,
     DEFAULT_CHECK_INTERVAL_MINUTES,
+    DEFAULT_CALENDAR_CHECK_INTERVAL_MINUTES,
     PROJECT_ROOT,
     DEFAULT_NOTETAKING_TIME,
 )
-from fda.outlook import OutlookCalendar
 from fda.comms.message_bus import MessageTypes, Agents
 
+if TYPE_CHECKING:
+    from fda.outlook import OutlookCalendar
+
 logger = logging.getLogger(__name__)
 
+# orjson is an optional speedup for parsing peer message bodies
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Message types that carry a peer's reply to one of FDA's requests
+_RESPONSE_TYPES = frozenset({
+    MessageTypes.SEARCH_RESULT,
+    MessageTypes.EXECUTE_RESULT,
+    MessageTypes.FILE_COMPLETE,
+    MessageTypes.KNOWLEDGE_RESULT,
+    MessageTypes.INDEX_COMPLETE,
+})
+
+
+# Shared pool for overlapping FDA's local disk reads with slower peer and
+# LLM round trips; threads are only started on first use
+_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="fda-io")
+
+# Newline for use inside f-string expressions, which cannot hold a backslash
+# before Python 3.12
+_NL = "\n"
+
+
+def _bullet_list(items: list[Any], empty: str) -> str:
+    """
+    Render items as markdown bullet lines for a prompt.
+
+    Args:
+        items: Items to list, one per line.
+        empty: Text to use instead when there are no items.
+
+    Returns:
+        The bullet lines, or empty if items is empty.
+    """
+    if not items:
+        return empty
+    return _NL.join([f"- {item}" for item in items])
+
+
+def _truncate_for_prompt(obj: Any, max_items: int = 20, max_str: int = 500) -> Any:
+    """
+    Shrink a JSON-like value before serializing it into a prompt.
+
+    Prompts only keep the first couple of thousand characters of a dumped
+    peer result, so long lists and strings are cut first rather than
+    encoded in full and then discarded.
+
+    Args:
+        obj: Value to shrink (dicts, lists and strings are truncated).
+        max_items: Maximum number of list items kept at each level.
+        max_str: Maximum length of each string.
+
+    Returns:
+        A truncated copy of obj.
+    """
+    if isinstance(obj, str):
+        return obj[:max_str]
+    if isinstance(obj, dict):
+        return {k: _truncate_for_prompt(v, max_items, max_str) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_truncate_for_prompt(v, max_items, max_str) for v in obj[:max_items]]
+    return obj
+
+
+# Wording in LLM responses that flags a daily check-in as critical, or a
+# task review as approved
+_CRITICAL_RE = re.compile(r"at risk|critical|urgent|blocked", re.IGNORECASE)
+_REVIEW_APPROVED_RE = re.compile(
+    r"approved|can be marked as complete|looks good", re.IGNORECASE
+)
+
+# Phrases marking a question that needs tools FDA lacks (web search,
+# live data, APIs, code execution, research, explicit Claude Code use),
+# matched as substrings of the lowercased question in a single pass
+_EXTERNAL_CAPABILITY_PHRASES = (
+    # Web search / internet lookups
+    "search the web", "web search", "search online", "look up online",
+    "google", "search for", "find online", "internet search",
+    "what's the latest", "current news", "recent news", "today's news",
+    "latest update", "what happened", "breaking news",
+    # Real-time / live data
+    "current price", "stock price", "weather", "forecast",
+    "right now", "live", "real-time", "realtime", "real time",
+    "up to date", "latest", "current",
+    # External API / integration tasks
+    "api", "fetch data", "download", "scrape", "crawl",
+    "call the", "query the", "access the", "connect to",
+    # Code execution / automation
+    "run this code", "execute", "automate", "script",
+    "install", "deploy", "build", "compile",
+    # Research / complex tasks
+    "research", "investigate", "analyze this", "deep dive",
+    "comprehensive", "detailed analysis", "thorough review",
+    # Explicit Claude Code delegation requests
+    "using claude code", "use claude code", "with claude code",
+    "via claude code", "through claude code", "ask claude code",
+    "claude code", "delegate to claude",
+)
+_EXTERNAL_CAPABILITY_RE = re.compile(
+    "|".join(map(re.escape, _EXTERNAL_CAPABILITY_PHRASES))
+)
+
+
+def _parse_json_object(body: Any) -> Optional[dict[str, Any]]:
+    """
+    Parse a message body holding a JSON object.
+
+    Plain-text bodies are recognised by their first character, so they
+    never pay for a raised and caught JSONDecodeError.
+
+    Args:
+        body: Message body.
+
+    Returns:
+        The decoded dictionary, or None if the body is not a JSON object.
+    """
+    if not isinstance(body, str) or body.lstrip()[:1] != "{":
+        return None
+    try:
+        data = _json_loads(body)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
 
 FDA_SYSTEM_PROMPT = """You are FDA (Facilitating Director Agent), a personal AI assistant living on the user's computer.
 
@@ -66,6 +199,16 @@ When responding:
 - Check the journal before re-running tasks that may have been done before
 """
 
+# Prompt for the personalized welcome shown at the end of onboarding
+ONBOARDING_WELCOME_PROMPT = (
+    "The user {name} just completed onboarding. "
+    "Role: {role}. "
+    "Goals: {goals}. "
+    "Channels: {channels}. "
+    "Write a brief, warm welcome (2-3 sentences) and suggest "
+    "one thing they could try first. Keep it conversational."
+)
+
 
 class FDAAgent(BaseAgent):
     """
@@ -75,6 +218,23 @@ class FDAAgent(BaseAgent):
     It delegates code work to the Worker agent.
     """
 
+    # Most peer requests remembered while waiting for their replies
+    MAX_PENDING_REQUESTS = 1024
+
+    # Meetings briefed concurrently by _check_upcoming_meetings
+    MEETING_PREP_WORKERS = 3
+
+    # Seconds between bus checks while waiting on a reply the event loop
+    # will dispatch (replies from other processes don't wake the loop)
+    RESPONSE_POLL_INTERVAL = 0.5
+
+    # Seconds a peer's status row is reused by _get_peer_status_cached
+    PEER_STATUS_TTL = 2.0
+
+    # Seconds a daily_checkin/check_kpis result is reused while its inputs
+    # are unchanged
+    ANALYSIS_CACHE_TTL = 600.0
+
     def __init__(
         self,
         state_path: Optional[Path] = None,
@@ -95,16 +255,53 @@ class FDAAgent(BaseAgent):
         )
 
         # Initialize Outlook calendar if config provided
-        self.calendar: Optional[OutlookCalendar] = None
+        self.calendar: Optional["OutlookCalendar"] = None
         if outlook_config:
+            from fda.outlook import OutlookCalendar
+
             self.calendar = OutlookCalendar(
                 client_id=outlook_config["client_id"],
                 tenant_id=outlook_config["tenant_id"],
                 client_secret=outlook_config.get("client_secret"),
             )
 
-        # Track pending requests to peer agents
-        self.pending_requests: dict[str, dict[str, Any]] = {}
+        # Bus/state key for this agent, computed once
+        self._name_lower = self.name.lower()
+
+        # Incoming message type -> handler, used by _handle_message
+        self._handlers: dict[str, Callable[[dict[str, Any]], None]] = {
+            **dict.fromkeys(_RESPONSE_TYPES, self._handle_peer_response),
+            MessageTypes.DISCOVERY: self._handle_discovery,
+            MessageTypes.BLOCKER: self._handle_blocker,
+            MessageTypes.STATUS_RESPONSE: self._handle_status,
+            MessageTypes.REVIEW_REQUEST: self._handle_review_request,
+            MessageTypes.ALERT: self._handle_alert,
+        }
+
+        # Track in-flight requests to peer agents (see _track_request)
+        self.pending_requests: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._pending_lock = threading.Lock()
+
+        # Set when a message is sent to FDA in this process, so the event
+        # loop wakes immediately instead of waiting out its poll interval
+        self._wake = self.message_bus.wakeup_event(self.name)
+
+        # Thread running run_event_loop, if any; replies to requests made
+        # from other threads are delivered through it
+        self._loop_thread: Optional[int] = None
+
+        # Monotonic time of the event loop's last calendar poll
+        self._last_calendar_check = 0.0
+
+        # Background calendar check started by the event loop, if any
+        self._meeting_check: Optional[Future] = None
+
+        # Peer name -> (monotonic fetch time, status) for _get_peer_status_cached
+        self._peer_status_cache: dict[str, tuple[float, Optional[dict[str, Any]]]] = {}
+
+        # Analysis name -> (monotonic time, inputs digest, result), see
+        # _get_cached_analysis
+        self._analysis_cache: dict[str, tuple[float, str, dict[str, Any]]] = {}
 
     def run_event_loop(self) -> None:
         """
@@ -117,136 +314,171 @@ class FDAAgent(BaseAgent):
         logger.info("[FDA] Starting event loop...")
 
         # Update agent status
-        self.state.update_agent_status(self.name.lower(), "running", "Starting up")
+        self.state.update_agent_status(self._name_lower, "running", "Starting up")
 
         check_interval = min(DEFAULT_CHECK_INTERVAL_MINUTES * 60, 30)  # Check frequently
+        calendar_interval = DEFAULT_CALENDAR_CHECK_INTERVAL_MINUTES * 60
+        self._loop_thread = threading.get_ident()
 
         while self._running:
             try:
                 # Heartbeat
-                self.state.agent_heartbeat(self.name.lower())
-                self.state.update_agent_status(self.name.lower(), "running")
+                self.state.agent_heartbeat(self._name_lower)
+                self.state.update_agent_status(self._name_lower, "running")
 
-                # Process pending messages from peers
+                # Process pending messages from peers, marking the batch
+                # read with one bus write once handled
                 messages = self.get_pending_messages()
-                for message in messages:
-                    self._handle_message(message)
+                if messages:
+                    self._dispatch_messages(messages)
 
-                # Check for upcoming meetings
+                # Check for upcoming meetings; the calendar changes far less
+                # often than messages arrive, so poll it on its own interval.
+                # Briefings take several LLM calls, so they run in the
+                # background while the loop keeps draining messages
                 if self.calendar:
-                    self._check_upcoming_meetings()
-
-                time.sleep(check_interval)
+                    now = time.monotonic()
+                    check = self._meeting_check
+                    if (
+                        now - self._last_calendar_check >= calendar_interval
+                        and (check is None or check.done())
+                    ):
+                        self._last_calendar_check = now
+                        self._meeting_check = _IO_POOL.submit(self._check_upcoming_meetings)
+
+                # Sleep until the next check, or until a message/stop arrives
+                self._wake.wait(timeout=check_interval)
+                self._wake.clear()
 
             except KeyboardInterrupt:
                 logger.info("[FDA] Received shutdown signal")
                 break
             except Exception as e:
                 logger.error(f"[FDA] Error in event loop: {e}")
-                time.sleep(60)
+                # Back off, but still let stop() or new messages end the wait
+                self._wake.wait(timeout=60)
+                self._wake.clear()
 
-        self.state.update_agent_status(self.name.lower(), "stopped")
+        self._loop_thread = None
+        self.state.update_agent_status(self._name_lower, "stopped")
         logger.info("[FDA] Event loop stopped")
 
+    def _dispatch_messages(self, messages: list[dict[str, Any]]) -> None:
+        """
+        Handle a batch of peer messages, then mark them read in one bus write.
+
+        Messages are marked read only after they are handled. If a handler
+        raises, that message is still marked read so it is not retried
+        forever, but the rest of the batch stays unread for the next pass.
+
+        Args:
+            messages: Pending messages, in the order to handle them.
+        """
+        handled: list[str] = []
+        try:
+            for message in messages:
+                handled.append(message.get("id", ""))
+                self._handle_message(message)
+        finally:
+            self.message_bus.mark_read_batch(handled)
+
+    def wake(self) -> None:
+        """Wake the event loop early, e.g. after queueing work for it."""
+        self._wake.set()
+
+    def stop(self) -> None:
+        """Stop the event loop without waiting out the poll interval."""
+        super().stop()
+        self._wake.set()
+
     def _handle_message(self, message: dict[str, Any]) -> None:
         """Handle an incoming message from a peer agent."""
-        msg_type = message.get("type", "")
-        subject = message.get("subject", "")
-        body = message.get("body", "")
-        from_agent = message.get("from", "")
-        msg_id = message.get("id", "")
-        reply_to = message.get("reply_to")
-
-        logger.info(f"[FDA] Received {msg_type} from {from_agent}: {subject}")
-        self.message_bus.mark_read(msg_id)
-
-        # Handle responses from peer agents
-        if msg_type in [
-            MessageTypes.SEARCH_RESULT,
-            MessageTypes.EXECUTE_RESULT,
-            MessageTypes.FILE_COMPLETE,
-            MessageTypes.KNOWLEDGE_RESULT,
-            MessageTypes.INDEX_COMPLETE,
-        ]:
-            self._handle_peer_response(message)
-
-        elif msg_type == MessageTypes.DISCOVERY:
-            # Peer agent shared a discovery
-            self._handle_discovery(message)
-
-        elif msg_type == MessageTypes.BLOCKER:
-            # Peer agent reports being blocked
-            self.add_alert("warning", f"Blocker from {from_agent}: {subject} - {body}")
-
-        elif msg_type == MessageTypes.STATUS_RESPONSE:
-            # Peer agent status update
-            logger.info(f"[FDA] Status from {from_agent}: {body}")
-
-        # Legacy message types
-        elif msg_type == "review_request":
-            task_id = body
-            result = self.review_task(task_id)
-            self.send_message(
-                to_agent=from_agent,
-                msg_type="review_response",
-                subject=f"Review complete: {task_id}",
-                body=str(result),
-            )
+        get = message.get
+        msg_type = get("type", "")
+
+        # Callers mark messages read (see _dispatch_messages)
+        logger.info(f"[FDA] Received {msg_type} from {get('from', '')}: {get('subject', '')}")
+
+        handler = self._handlers.get(msg_type)
+        if handler is not None:
+            handler(message)
+
+    def _handle_blocker(self, message: dict[str, Any]) -> None:
+        """Raise an alert for a peer agent reporting being blocked."""
+        get = message.get
+        self.add_alert(
+            "warning",
+            f"Blocker from {get('from', '')}: {get('subject', '')} - {get('body', '')}",
+        )
 
-        elif msg_type == "blocker":
-            self.add_alert("warning", f"Blocker reported: {subject} - {body}")
+    def _handle_status(self, message: dict[str, Any]) -> None:
+        """Log a peer agent's status update."""
+        logger.info(f"[FDA] Status from {message.get('from', '')}: {message.get('body', '')}")
+
+    def _handle_review_request(self, message: dict[str, Any]) -> None:
+        """Review a task on behalf of a peer and reply with the result (legacy)."""
+        task_id = message.get("body", "")
+        result = self.review_task(task_id)
+        self.send_message(
+            to_agent=message.get("from", ""),
+            msg_type="review_response",
+            subject=f"Review complete: {task_id}",
+            body=str(result),
+        )
 
-        elif msg_type == "alert":
-            level = "critical" if "critical" in subject.lower() else "warning"
-            self.add_alert(level, body)
+    def _handle_alert(self, message: dict[str, Any]) -> None:
+        """Record an alert sent by a peer (legacy)."""
+        level = "critical" if "critical" in message.get("subject", "").lower() else "warning"
+        self.add_alert(level, message.get("body", ""))
 
     def _handle_peer_response(self, message: dict[str, Any]) -> None:
         """Handle a response from a peer agent (Librarian or Executor)."""
-        msg_type = message.get("type", "")
-        body = message.get("body", "")
-        from_agent = message.get("from", "")
-        reply_to = message.get("reply_to")
+        get = message.get
+        body = get("body", "")
+        reply_to = get("reply_to")
 
-        try:
-            result_data = json.loads(body)
-        except (json.JSONDecodeError, TypeError):
+        result_data = _parse_json_object(body)
+        if result_data is None:
             result_data = {"result": body}
 
-        success = result_data.get("success", True)
-        result = result_data.get("result")
         error = result_data.get("error")
 
-        # Store the response for retrieval
-        if reply_to and reply_to in self.pending_requests:
-            self.pending_requests[reply_to]["response"] = result_data
-            self.pending_requests[reply_to]["completed"] = True
-            logger.info(f"[FDA] Received response for request {reply_to}")
+        # Hand the response to the waiting caller; the request is done
+        if reply_to:
+            with self._pending_lock:
+                pending = self.pending_requests.pop(reply_to, None)
+            if pending is not None:
+                future = pending["future"]
+                if not future.done():
+                    future.set_result(result_data)
+                logger.info(f"[FDA] Received response for request {reply_to}")
 
         if error:
-            logger.warning(f"[FDA] Peer {from_agent} reported error: {error}")
+            logger.warning(f"[FDA] Peer {get('from', '')} reported error: {error}")
 
     def _handle_discovery(self, message: dict[str, Any]) -> None:
         """Handle a discovery shared by a peer agent."""
-        body = message.get("body", "")
-        from_agent = message.get("from", "")
-
-        try:
-            discovery_data = json.loads(body)
-            discovery_type = discovery_data.get("discovery_type", "unknown")
-            description = discovery_data.get("description", "")
-
-            logger.info(f"[FDA] Discovery from {from_agent}: {discovery_type} - {description}")
-
-            # Store in state for future reference
-            self.state.add_discovery(
-                agent=from_agent,
-                discovery_type=discovery_type,
-                description=description,
-                details=discovery_data.get("details"),
-            )
+        get = message.get
+        body = get("body", "")
+        from_agent = get("from", "")
 
-        except (json.JSONDecodeError, TypeError):
+        discovery_data = _parse_json_object(body)
+        if discovery_data is None:
             logger.info(f"[FDA] Discovery from {from_agent}: {body}")
+            return
+
+        discovery_type = discovery_data.get("discovery_type", "unknown")
+        description = discovery_data.get("description", "")
+
+        logger.info(f"[FDA] Discovery from {from_agent}: {discovery_type} - {description}")
+
+        # Store in state for future reference
+        self.state.add_discovery(
+            agent=from_agent,
+            discovery_type=discovery_type,
+            description=description,
+            details=discovery_data.get("details"),
+        )
 
     def _check_upcoming_meetings(self) -> None:
         """Check for upcoming meetings and prepare if needed."""
@@ -257,19 +489,43 @@ class FDAAgent(BaseAgent):
             # Get meetings in the next 45 minutes
             upcoming = self.calendar.get_upcoming_events(within_minutes=45)
 
-            for event in upcoming:
-                event_id = event.get("id")
-                if not event_id:
-                    continue
+            # Skip meetings we already have prep for
+            upcoming = [event for event in upcoming if event.get("id")]
+            prepared = self.state.get_prepared_event_ids([e["id"] for e in upcoming])
+            to_prepare = [event for event in upcoming if event["id"] not in prepared]
+            if not to_prepare:
+                return
 
-                # Check if we already have prep for this meeting
-                existing_prep = self.state.get_meeting_prep(event_id)
-                if existing_prep:
-                    continue
-
-                # Prepare for the meeting
+            for event in to_prepare:
                 logger.info(f"[FDA] Preparing for meeting: {event.get('subject')}")
-                self.prepare_meeting(event_id)
+
+            if len(to_prepare) == 1:
+                self.prepare_meeting(to_prepare[0]["id"])
+                return
+
+            # Outlook, state and journal access stay on this thread; only
+            # the LLM calls, which dominate a briefing, run concurrently
+            inputs = []
+            for event in to_prepare:
+                try:
+                    inputs.append((event, self._meeting_prep_inputs(event["id"])))
+                except Exception as e:
+                    logger.error(f"[FDA] Error preparing meeting {event.get('subject')}: {e}")
+            if not inputs:
+                return
+
+            with ThreadPoolExecutor(
+                max_workers=min(self.MEETING_PREP_WORKERS, len(inputs)),
+            ) as pool:
+                futures = [
+                    pool.submit(self.chat_with_context, prompt, context)
+                    for _, (_, context, prompt, _) in inputs
+                ]
+            for (event, (details, _, _, files)), future in zip(inputs, futures):
+                try:
+                    self._record_meeting_prep(event["id"], details, files, future.result())
+                except Exception as e:
+                    logger.error(f"[FDA] Error preparing meeting {event.get('subject')}: {e}")
 
         except Exception as e:
             logger.error(f"[FDA] Error checking meetings: {e}")
@@ -295,34 +551,12 @@ class FDAAgent(BaseAgent):
         Returns:
             Search results if wait_for_response=True, else the request ID.
         """
-        msg_id = self.message_bus.request_search(
-            from_agent=self.name.lower(),
-            query=query,
-            path=path,
+        return self._request(
+            self.message_bus.request_search, "search", {"query": query},
+            wait_for_response, timeout, report_timeout=True,
+            query=query, path=path,
         )
 
-        self.pending_requests[msg_id] = {
-            "type": "search",
-            "query": query,
-            "sent_at": datetime.now().isoformat(),
-            "completed": False,
-            "response": None,
-        }
-
-        if wait_for_response:
-            response = self.message_bus.wait_for_response(
-                agent_name=self.name.lower(),
-                request_id=msg_id,
-                timeout_seconds=timeout,
-            )
-            if response:
-                self._handle_peer_response(response)
-                return self.pending_requests[msg_id].get("response")
-            # Timed out waiting for response - return a dict that indicates timeout
-            return {"request_id": msg_id, "timed_out": True}
-
-        return {"request_id": msg_id}
-
     def request_command_execution(
         self,
         command: str,
@@ -342,32 +576,12 @@ class FDAAgent(BaseAgent):
         Returns:
             Execution results if wait_for_response=True, else the request ID.
         """
-        msg_id = self.message_bus.request_execute(
-            from_agent=self.name.lower(),
-            command=command,
-            cwd=cwd,
+        return self._request(
+            self.message_bus.request_execute, "execute", {"command": command},
+            wait_for_response, timeout,
+            command=command, cwd=cwd,
         )
 
-        self.pending_requests[msg_id] = {
-            "type": "execute",
-            "command": command,
-            "sent_at": datetime.now().isoformat(),
-            "completed": False,
-            "response": None,
-        }
-
-        if wait_for_response:
-            response = self.message_bus.wait_for_response(
-                agent_name=self.name.lower(),
-                request_id=msg_id,
-                timeout_seconds=timeout,
-            )
-            if response:
-                self._handle_peer_response(response)
-                return self.pending_requests[msg_id].get("response")
-
-        return {"request_id": msg_id}
-
     def request_file_operation(
         self,
         operation: str,
@@ -391,34 +605,13 @@ class FDAAgent(BaseAgent):
         Returns:
             Operation results if wait_for_response=True, else the request ID.
         """
-        msg_id = self.message_bus.request_file_operation(
-            from_agent=self.name.lower(),
-            operation=operation,
-            path=path,
-            content=content,
+        return self._request(
+            self.message_bus.request_file_operation, "file_operation",
+            {"operation": operation, "path": path},
+            wait_for_response, timeout,
+            operation=operation, path=path, content=content,
         )
 
-        self.pending_requests[msg_id] = {
-            "type": "file_operation",
-            "operation": operation,
-            "path": path,
-            "sent_at": datetime.now().isoformat(),
-            "completed": False,
-            "response": None,
-        }
-
-        if wait_for_response:
-            response = self.message_bus.wait_for_response(
-                agent_name=self.name.lower(),
-                request_id=msg_id,
-                timeout_seconds=timeout,
-            )
-            if response:
-                self._handle_peer_response(response)
-                return self.pending_requests[msg_id].get("response")
-
-        return {"request_id": msg_id}
-
     def request_knowledge(
         self,
         question: str,
@@ -438,32 +631,130 @@ class FDAAgent(BaseAgent):
         Returns:
             Knowledge results if wait_for_response=True, else the request ID.
         """
-        msg_id = self.message_bus.request_knowledge(
-            from_agent=self.name.lower(),
-            question=question,
-            context=context,
+        return self._request(
+            self.message_bus.request_knowledge, "knowledge", {"question": question},
+            wait_for_response, timeout,
+            question=question, context=context,
         )
 
-        self.pending_requests[msg_id] = {
-            "type": "knowledge",
-            "question": question,
-            "sent_at": datetime.now().isoformat(),
-            "completed": False,
-            "response": None,
-        }
+    def _request(
+        self,
+        send: Callable[..., str],
+        request_type: str,
+        details: dict[str, Any],
+        wait_for_response: bool,
+        timeout: float,
+        report_timeout: bool = False,
+        **bus_kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Send a peer request and optionally wait for its reply.
+
+        Shared by all the ``request_*`` methods.
+
+        Args:
+            send: MessageBus request helper (e.g. ``request_search``).
+            request_type: Kind of request, recorded in pending_requests.
+            details: Fields describing the request, recorded alongside it.
+            wait_for_response: Whether to wait for the response.
+            timeout: How long to wait for response.
+            report_timeout: Add ``timed_out: True`` when the wait times out.
+            **bus_kwargs: Arguments for ``send`` besides ``from_agent``.
+
+        Returns:
+            The response if one arrived, else a dict with the request ID.
+        """
+        msg_id = send(from_agent=self._name_lower, **bus_kwargs)
+        future = self._track_request(msg_id, request_type, **details)
 
         if wait_for_response:
-            response = self.message_bus.wait_for_response(
-                agent_name=self.name.lower(),
-                request_id=msg_id,
-                timeout_seconds=timeout,
-            )
-            if response:
-                self._handle_peer_response(response)
-                return self.pending_requests[msg_id].get("response")
+            response = self._await_response(msg_id, future, timeout)
+            if response is not None:
+                return response
+            if report_timeout:
+                return {"request_id": msg_id, "timed_out": True}
 
         return {"request_id": msg_id}
 
+    def _track_request(self, msg_id: str, request_type: str, **details: Any) -> Future:
+        """
+        Record an outgoing peer request until its reply arrives.
+
+        The table is bounded: once MAX_PENDING_REQUESTS entries are held,
+        the oldest (most likely abandoned) request is forgotten.
+
+        Args:
+            msg_id: ID of the request message.
+            request_type: Kind of request (search, execute, ...).
+            **details: Extra fields describing the request.
+
+        Returns:
+            Future resolved with the parsed response.
+        """
+        future: Future = Future()
+        with self._pending_lock:
+            while len(self.pending_requests) >= self.MAX_PENDING_REQUESTS:
+                self.pending_requests.popitem(last=False)
+            self.pending_requests[msg_id] = {
+                "type": request_type,
+                **details,
+                "sent_at": time.monotonic(),
+                "future": future,
+            }
+        return future
+
+    def _await_response(
+        self, msg_id: str, future: Future, timeout: float
+    ) -> Optional[dict[str, Any]]:
+        """
+        Wait for a peer's reply to one of our requests.
+
+        When the event loop is running on another thread it dispatches the
+        reply and resolves the request's future, so the caller blocks on
+        that future and several requests from different threads can be in
+        flight at once. Replies written by other processes don't wake the
+        loop, so the caller also checks the bus version every
+        RESPONSE_POLL_INTERVAL seconds and wakes the loop when it changes.
+        Otherwise (CLI use, or a request made from the loop thread itself)
+        the bus is polled for the reply directly.
+
+        Args:
+            msg_id: ID of the request message.
+            future: The request's future, from _track_request.
+            timeout: How long to wait, in seconds.
+
+        Returns:
+            The parsed response data, or None on timeout.
+        """
+        loop_thread = self._loop_thread
+        if self._running and loop_thread is not None and loop_thread != threading.get_ident():
+            deadline = time.monotonic() + timeout
+            version = self.message_bus.get_version()
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                try:
+                    return future.result(timeout=min(self.RESPONSE_POLL_INTERVAL, remaining))
+                except FutureTimeoutError:
+                    pass
+                current = self.message_bus.get_version()
+                if current != version:
+                    version = current
+                    self._wake.set()
+
+        response = self.message_bus.wait_for_response(
+            agent_name=self._name_lower,
+            request_id=msg_id,
+            timeout_seconds=timeout,
+        )
+        if response:
+            # Mark it read so the event loop won't process it a second time,
+            # then dispatch like any other inbound message
+            self.message_bus.mark_read(response["id"])
+            self._handle_message(response)
+        return future.result() if future.done() else None
+
     def get_peer_status(self, agent_name: str) -> Optional[dict[str, Any]]:
         """
         Get the status of a peer agent.
@@ -476,6 +767,28 @@ class FDAAgent(BaseAgent):
         """
         return self.state.get_agent_status(agent_name.lower())
 
+    def _get_peer_status_cached(self, agent_name: str) -> Optional[dict[str, Any]]:
+        """
+        Get a peer's status, reusing a lookup made in the last few seconds.
+
+        Delegation helpers check the peer before every request, and one
+        question can trigger several of them; PEER_STATUS_TTL bounds how
+        stale the answer may be.
+
+        Args:
+            agent_name: Name of the peer agent.
+
+        Returns:
+            Agent status dictionary, or None if the agent is unknown.
+        """
+        now = time.monotonic()
+        cached = self._peer_status_cache.get(agent_name)
+        if cached is not None and now - cached[0] < self.PEER_STATUS_TTL:
+            return cached[1]
+        status = self.get_peer_status(agent_name)
+        self._peer_status_cache[agent_name] = (now, status)
+        return status
+
     def get_all_peer_statuses(self) -> list[dict[str, Any]]:
         """
         Get status of all peer agents.
@@ -895,31 +1208,46 @@ class FDAAgent(BaseAgent):
                 print(f"  Warning: '{tz_response}' invalid. Using system default.")
                 responses["timezone"] = None
 
+        # Bind the answers once; both the state and the journal use them
+        get = responses.get
+        role = get("role", "")
+        user_context = get("context", "")
+        goals = get("goals", "")
+        challenges = get("challenges", "")
+        style = get("communication_style", "adaptive")
+        timezone = get("timezone")
+        now = datetime.now()
+
         # Store in state
-        self.state.set_context("user_name", responses.get("name", ""))
-        self.state.set_context("user_role", responses.get("role", ""))
-        self.state.set_context("user_context", responses.get("context", ""))
-        self.state.set_context("user_goals", responses.get("goals", ""))
-        self.state.set_context("user_challenges", responses.get("challenges", ""))
-        self.state.set_context("communication_style", responses.get("communication_style", "adaptive"))
-        self.state.set_context("user_timezone", responses.get("timezone"))
+        self.state.set_context("user_name", get("name", ""))
+        self.state.set_context("user_role", role)
+        self.state.set_context("user_context", user_context)
+        self.state.set_context("user_goals", goals)
+        self.state.set_context("user_challenges", challenges)
+        self.state.set_context("communication_style", style)
+        self.state.set_context("user_timezone", timezone)
         self.state.set_context("onboarded", True)
-        self.state.set_context("onboarded_at", datetime.now().isoformat())
+        self.state.set_context("onboarded_at", now.isoformat())
 
         # Save journal entry
-        name = responses.get("name", "User")
+        name = get("name", "User")
+        parts = [
+            f"# Onboarding — {name}\n\n",
+            f"**Date:** {now.strftime('%Y-%m-%d %H:%M')}\n\n",
+        ]
+        for label, value in (
+            ("Role", role),
+            ("Context", user_context),
+            ("Goals", goals),
+            ("Challenges", challenges),
+            ("Style", style),
+            ("Timezone", timezone or "system default"),
+        ):
+            parts.append(f"- **{label}:** {value}\n")
+
         self.log_to_journal(
             summary=f"Onboarding interview with {name}",
-            content=(
-                f"# Onboarding — {name}\n\n"
-                f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n"
-                f"- **Role:** {responses.get('role', 'N/A')}\n"
-                f"- **Context:** {responses.get('context', 'N/A')}\n"
-                f"- **Goals:** {responses.get('goals', 'N/A')}\n"
-                f"- **Challenges:** {responses.get('challenges', 'N/A')}\n"
-                f"- **Style:** {responses.get('communication_style', 'adaptive')}\n"
-                f"- **Timezone:** {responses.get('timezone') or 'system default'}\n"
-            ),
+            content="".join(parts),
             tags=["onboarding", "user-profile"],
             relevance_decay="slow",
         )
@@ -1017,14 +1345,12 @@ class FDAAgent(BaseAgent):
         if name:
             print("\n  Generating personalized welcome...\n")
             try:
-                synthesis_prompt = (
-                    f"The user {name} just completed onboarding. "
-                    f"Role: {responses.get('role', 'N/A')}. "
-                    f"Goals: {responses.get('goals', 'N/A')}. "
-                    f"Channels: {', '.join(channels) or 'CLI only'}. "
-                    f"Write a brief, warm welcome (2-3 sentences) and suggest "
-                    f"one thing they could try first. Keep it conversational."
-                )
+                synthesis_prompt = ONBOARDING_WELCOME_PROMPT.format_map({
+                    "name": name,
+                    "role": responses.get("role", "N/A"),
+                    "goals": responses.get("goals", "N/A"),
+                    "channels": ", ".join(channels) or "CLI only",
+                })
                 welcome = self.chat(synthesis_prompt, include_history=False)
                 print(f"  {welcome}")
             except Exception:
@@ -1072,29 +1398,31 @@ class FDAAgent(BaseAgent):
         context = {
             "date": start_of_day.strftime("%A, %B %d, %Y"),
             "date_iso": today_str,
-            "user_name": self.state.get_context("user_name"),
-            "user_role": self.state.get_context("user_role"),
-            "user_goals": self.state.get_context("user_goals"),
+            **self.state.get_contexts(["user_name", "user_role", "user_goals"]),
         }
 
         # Get all tasks and filter for today
         all_tasks = self.state.get_tasks()
-        today_tasks = []
+        updated_today = 0
         completed_today = []
         in_progress = []
+        completed_append = completed_today.append
+        in_progress_append = in_progress.append
 
         for t in all_tasks:
-            updated_at = t.get("updated_at", "")
-            if isinstance(updated_at, str) and updated_at.startswith(today_str):
-                today_tasks.append(t)
-                if t.get("status") == "completed":
-                    completed_today.append(t)
-            if t.get("status") == "in_progress":
-                in_progress.append(t)
-
-        context["tasks_completed_today"] = [t.get("title") for t in completed_today]
-        context["tasks_in_progress"] = [t.get("title") for t in in_progress[:5]]
-        context["tasks_updated_today"] = len(today_tasks)
+            get = t.get
+            status = get("status")
+            # updated_at may be stored as NULL
+            if (get("updated_at") or "")[:10] == today_str:
+                updated_today += 1
+                if status == "completed":
+                    completed_append(get("title"))
+            if status == "in_progress":
+                in_progress_append(get("title"))
+
+        context["tasks_completed_today"] = completed_today
+        context["tasks_in_progress"] = in_progress[:5]
+        context["tasks_updated_today"] = updated_today
 
         # Get calendar events for today (if calendar connected)
         context["calendar_events"] = []
@@ -1110,27 +1438,24 @@ class FDAAgent(BaseAgent):
 
         # Get journal entries from today
         recent_entries = self.search_journal("", top_n=10)
-        today_entries = [
-            e for e in recent_entries
-            if e.get("created_at", "").startswith(today_str)
+        context["journal_entries_today"] = [
+            e.get("summary") for e in recent_entries
+            if e.get("created_at", "")[:10] == today_str
         ]
-        context["journal_entries_today"] = [e.get("summary") for e in today_entries]
 
-        # Get any alerts from today
+        # Get any alerts from today (first five only)
         alerts = self.state.get_alerts()
-        today_alerts = [
-            a for a in alerts
-            if a.get("created_at", "").startswith(today_str)
-        ]
-        context["alerts_today"] = [a.get("message") for a in today_alerts[:5]]
+        context["alerts_today"] = list(itertools.islice(
+            (a.get("message") for a in alerts if a.get("created_at", "")[:10] == today_str),
+            5,
+        ))
 
         # Get any decisions made today
         decisions = self.state.get_decisions(limit=10)
-        today_decisions = [
-            d for d in decisions
-            if d.get("created_at", "").startswith(today_str)
+        context["decisions_today"] = [
+            d.get("title") for d in decisions
+            if d.get("created_at", "")[:10] == today_str
         ]
-        context["decisions_today"] = [d.get("title") for d in today_decisions]
 
         # Get today's conversations from ALL interfaces (Discord, Telegram, CLI)
         try:
@@ -1171,6 +1496,9 @@ class FDAAgent(BaseAgent):
         alerts = context.get("alerts_today", [])
         decisions = context.get("decisions_today", [])
         discord_convos = context.get("conversations_today", [])
+        event_lines = [
+            f'{e.get("subject")} at {e.get("start", "")[:16]}' for e in calendar_events
+        ]
 
         prompt = f"""Based on today's activities, write a personal daily journal entry for {user_name}.
 
@@ -1181,25 +1509,25 @@ Role: {user_role}
 ## Today's Activities
 
 ### Tasks Completed
-{chr(10).join(f'- {t}' for t in tasks_completed) if tasks_completed else '- No tasks marked as completed today'}
+{_bullet_list(tasks_completed, '- No tasks marked as completed today')}
 
 ### Tasks In Progress
-{chr(10).join(f'- {t}' for t in tasks_in_progress) if tasks_in_progress else '- No tasks currently in progress'}
+{_bullet_list(tasks_in_progress, '- No tasks currently in progress')}
 
 ### Calendar Events
-{chr(10).join(f'- {e.get("subject")} at {e.get("start", "")[:16]}' for e in calendar_events) if calendar_events else '- No calendar events (or calendar not connected)'}
+{_bullet_list(event_lines, '- No calendar events (or calendar not connected)')}
 
 ### Notes Made Today
-{chr(10).join(f'- {e}' for e in journal_entries) if journal_entries else '- No journal entries made today'}
+{_bullet_list(journal_entries, '- No journal entries made today')}
 
 ### Alerts/Reminders
-{chr(10).join(f'- {a}' for a in alerts) if alerts else '- No alerts today'}
+{_bullet_list(alerts, '- No alerts today')}
 
 ### Decisions Made
-{chr(10).join(f'- {d}' for d in decisions) if decisions else '- No major decisions recorded'}
+{_bullet_list(decisions, '- No major decisions recorded')}
 
 ### Conversations Today (Discord, Telegram, CLI)
-{chr(10).join(f'- {c}' for c in discord_convos[:30]) if discord_convos else '- No conversations today'}
+{_bullet_list(discord_convos[:30], '- No conversations today')}
 
 ---
 
@@ -1259,7 +1587,7 @@ Alerts: {', '.join(alerts) if alerts else 'No alerts'}
 Recent notes: {', '.join(journal_entries[:5]) if journal_entries else 'No journal entries'}
 Decisions made today: {', '.join(decisions) if decisions else 'None'}
 Their goals: {user_goals if user_goals else 'Not specified'}
-Today's conversations: {chr(10).join(discord_convos[:20]) if discord_convos else 'No conversations yet'}
+Today's conversations: {_NL.join(discord_convos[:20]) if discord_convos else 'No conversations yet'}
 
 Write a warm, natural spoken briefing as if you're a personal assistant greeting {user_name} for the day.
 Keep it conversational and concise (under 200 words) — this will be read aloud via text-to-speech.
@@ -1274,28 +1602,108 @@ Do NOT use emojis."""
 
         return self.chat(prompt, include_history=False)
 
-    def daily_checkin(self) -> dict[str, Any]:
+    @staticmethod
+    def _inputs_digest(inputs: Any) -> str:
         """
-        Perform daily health check of the project.
+        Hash the inputs of an LLM analysis into a short cache key.
 
-        Reviews current tasks, blockers, and KPI trends.
+        Args:
+            inputs: JSON-serializable inputs (other values are stringified).
 
         Returns:
-            Dictionary containing checkin results and any alerts.
+            Hex digest of the inputs.
         """
-        # Gather project context
-        context = self.get_project_context()
+        payload = json.dumps(inputs, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _get_cached_analysis(self, name: str, digest: str) -> Optional[dict[str, Any]]:
+        """
+        Get the last result of an analysis if its inputs are unchanged.
 
-        # Get recent journal entries
-        recent_entries = self.search_journal("", top_n=5)
+        Back-to-back runs over the same project state would otherwise repeat
+        the same LLM call; results are reused for ANALYSIS_CACHE_TTL seconds.
+
+        Args:
+            name: Analysis name (e.g. "daily_checkin").
+            digest: Digest of the current inputs, from _inputs_digest.
+
+        Returns:
+            A copy of the cached result marked with "cached": True, or None.
+        """
+        cached = self._analysis_cache.get(name)
+        if (
+            cached is not None
+            and cached[1] == digest
+            and time.monotonic() - cached[0] < self.ANALYSIS_CACHE_TTL
+        ):
+            return {**cached[2], "cached": True}
+        return None
+
+    def _cache_analysis(self, name: str, digest: str, result: dict[str, Any]) -> None:
+        """Remember an analysis result for _get_cached_analysis."""
+        self._analysis_cache[name] = (time.monotonic(), digest, result)
+
+    def _checkin_context(self) -> dict[str, Any]:
+        """
+        Gather the context reviewed by daily_checkin.
+
+        Returns:
+            Project context with recent journal entries and decisions.
+        """
+        context = self.get_project_context_cached()
+
+        # Get recent journal entries (newest first, straight from the index)
         context["recent_journal_entries"] = [
             {"summary": e.get("summary"), "author": e.get("author")}
-            for e in recent_entries
+            for e in self.journal_retriever.index.get_recent(5)
         ]
 
         # Get recent decisions
-        decisions = self.state.get_decisions(limit=5)
-        context["recent_decisions"] = decisions
+        context["recent_decisions"] = self.state.get_decisions(limit=5)
+        return context
+
+    def _checkin_digest(self, context: dict[str, Any]) -> str:
+        """Digest of a daily_checkin context, ignoring its timestamp."""
+        return self._inputs_digest(
+            {k: v for k, v in context.items() if k != "timestamp"}
+        )
+
+    def daily_checkin(self) -> dict[str, Any]:
+        """
+        Perform daily health check of the project.
+
+        Reviews current tasks, blockers, and KPI trends. If nothing has
+        changed since the last checkin (within ANALYSIS_CACHE_TTL), its
+        result is returned again with "cached": True.
+
+        Returns:
+            Dictionary containing checkin results and any alerts.
+        """
+        now = datetime.now()
+        now_iso = now.isoformat()
+
+        # Gather project context
+        context = self._checkin_context()
+
+        # Nothing to review on an empty project; skip the LLM call
+        if not (
+            context.get("tasks_summary")
+            or context.get("unacknowledged_alerts")
+            or context["recent_decisions"]
+            or context["recent_journal_entries"]
+        ):
+            logger.info("[FDA] Daily checkin skipped: no project activity")
+            return {
+                "status": "skipped",
+                "response": "No project activity to review.",
+                "is_critical": False,
+                "timestamp": now_iso,
+            }
+
+        cached = self._get_cached_analysis("daily_checkin", self._checkin_digest(context))
+        if cached is not None:
+            logger.info("[FDA] Daily checkin reused: project unchanged since last run")
+            return cached
 
         prompt = """Perform a daily project health check based on the current context.
 
@@ -1312,29 +1720,33 @@ Be specific and actionable in your recommendations."""
         response = self.chat_with_context(prompt, context)
 
         # Parse response to determine if there are critical issues
-        is_critical = any(
-            word in response.lower()
-            for word in ["at risk", "critical", "urgent", "blocked"]
-        )
+        is_critical = _CRITICAL_RE.search(response) is not None
 
         if is_critical:
             self.add_alert("warning", "Daily checkin identified issues requiring attention")
 
         # Log to journal
         self.log_to_journal(
-            summary=f"Daily checkin - {datetime.now().strftime('%Y-%m-%d')}",
+            summary=f"Daily checkin - {now.strftime('%Y-%m-%d')}",
             content=f"## Daily Health Check\n\n{response}",
             tags=["daily-checkin", "health-check"],
             relevance_decay="fast",
         )
 
-        return {
+        result = {
             "status": "completed",
             "response": response,
             "is_critical": is_critical,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso,
         }
 
+        # Key the cache on the state after this checkin's own alert and
+        # journal writes, so an immediate re-run is recognized as unchanged
+        self._cache_analysis(
+            "daily_checkin", self._checkin_digest(self._checkin_context()), result,
+        )
+        return result
+
     def _explain_capability_limitation(self, question: str) -> str:
         """
         Explain why FDA can't fulfill a request that requires external capabilities.
@@ -1373,58 +1785,7 @@ Be specific and actionable in your recommendations."""
         Returns:
             True if the question requires capabilities beyond FDA's scope.
         """
-        question_lower = question.lower()
-
-        # Web search / internet lookups
-        web_search_phrases = [
-            "search the web", "web search", "search online", "look up online",
-            "google", "search for", "find online", "internet search",
-            "what's the latest", "current news", "recent news", "today's news",
-            "latest update", "what happened", "breaking news",
-        ]
-
-        # Real-time / live data
-        realtime_phrases = [
-            "current price", "stock price", "weather", "forecast",
-            "right now", "live", "real-time", "realtime", "real time",
-            "up to date", "latest", "current",
-        ]
-
-        # External API / integration tasks
-        api_phrases = [
-            "api", "fetch data", "download", "scrape", "crawl",
-            "call the", "query the", "access the", "connect to",
-        ]
-
-        # Code execution / automation
-        automation_phrases = [
-            "run this code", "execute", "automate", "script",
-            "install", "deploy", "build", "compile",
-        ]
-
-        # Research / complex tasks
-        research_phrases = [
-            "research", "investigate", "analyze this", "deep dive",
-            "comprehensive", "detailed analysis", "thorough review",
-        ]
-
-        # Explicit Claude Code delegation requests
-        claude_code_phrases = [
-            "using claude code", "use claude code", "with claude code",
-            "via claude code", "through claude code", "ask claude code",
-            "claude code", "delegate to claude",
-        ]
-
-        all_capability_phrases = (
-            web_search_phrases +
-            realtime_phrases +
-            api_phrases +
-            automation_phrases +
-            research_phrases +
-            claude_code_phrases
-        )
-
-        return any(phrase in question_lower for phrase in all_capability_phrases)
+        return _EXTERNAL_CAPABILITY_RE.search(question.lower()) is not None
 
     def ask(self, question: str, use_claude_code: bool = True, conversation_history: list[dict[str, str]] = None) -> str:
         """
@@ -1445,8 +1806,6 @@ Be specific and actionable in your recommendations."""
         Returns:
             The FDA agent's response.
         """
-        question_lower = question.lower()
-
         # Classify the user's intent using LLM
         intent = self._classify_intent(question)
         logger.info(f"[FDA] Intent classified as: {intent}")
@@ -1460,15 +1819,23 @@ Be specific and actionable in your recommendations."""
             self.state.set_context("active_project_path", explicit_path)
             logger.info(f"[FDA] Saved active project path: {explicit_path}")
 
-        # File/knowledge requests → Librarian
-        if intent == "librarian":
-            peer_result = self._delegate_to_librarian(question)
-
         # Simple status/info queries - answer directly without Claude Code
         is_simple_query = intent == "greeting"
 
-        # Check if the request requires capabilities FDA doesn't have
-        requires_delegation = self._requires_external_capabilities(question)
+        # When the answer will (likely) come from the direct API, read the
+        # relevant journal notes off disk while the Librarian and state
+        # lookups below are in flight
+        notes_future: Optional[Future] = None
+        if intent == "librarian" or is_simple_query or not use_claude_code:
+            notes_future = _IO_POOL.submit(self._find_relevant_notes, question)
+
+        # File/knowledge requests → Librarian. The rest of the answer
+        # context doesn't depend on its result, so build it meanwhile
+        answer_context: Optional[dict[str, Any]] = None
+        if intent == "librarian":
+            librarian_future = _IO_POOL.submit(self._delegate_to_librarian, question)
+            answer_context = self._build_answer_context(question)
+            peer_result = librarian_future.result()
 
         # Try Claude Code for:
         # 1. Requests requiring external capabilities (web search, APIs, etc.)
@@ -1481,48 +1848,26 @@ Be specific and actionable in your recommendations."""
 
             # If Claude Code failed, always fall through to direct API.
             # FDA can still give a helpful answer even without web search/tools.
-            if requires_delegation:
+            if self._requires_external_capabilities(question):
                 logger.info("[FDA] Claude Code unavailable for capability-heavy request, answering directly")
 
         # Fall back to direct API call if Claude Code not available
-        # Build context with user info if available
-        context = {}
-
-        # Add user context from onboarding
-        user_name = self.state.get_context("user_name")
-        if user_name:
-            context["user"] = {
-                "name": user_name,
-                "role": self.state.get_context("user_role"),
-                "goals": self.state.get_context("user_goals"),
-                "challenges": self.state.get_context("user_challenges"),
-            }
-
-        # Add task context
-        project_context = self.get_project_context()
-        context.update(project_context)
-
-        # Add project knowledge context
-        project_knowledge = self._get_relevant_project_knowledge(question)
-        if project_knowledge:
-            context["project_knowledge"] = project_knowledge
+        context = (
+            answer_context if answer_context is not None
+            else self._build_answer_context(question)
+        )
 
         # Add peer agent results if we delegated
         if peer_result:
             context["peer_agent_result"] = peer_result
 
         # Search journal for relevant entries
-        relevant_entries = self.search_journal(question, top_n=3)
-        if relevant_entries:
-            context["relevant_notes"] = [
-                {
-                    "summary": e.get("summary"),
-                    "content": self.journal_retriever._read_entry_content(
-                        e.get("filename", "")
-                    )[:500],
-                }
-                for e in relevant_entries
-            ]
+        relevant_notes = (
+            notes_future.result() if notes_future is not None
+            else self._find_relevant_notes(question)
+        )
+        if relevant_notes:
+            context["relevant_notes"] = relevant_notes
 
         # Add conversation history for context continuity
         if conversation_history:
@@ -1535,7 +1880,9 @@ Be specific and actionable in your recommendations."""
 
         # If we got a peer result, include it in the prompt
         if peer_result:
-            peer_json = json.dumps(peer_result, indent=2, ensure_ascii=False)[:2000]
+            peer_json = json.dumps(
+                _truncate_for_prompt(peer_result), indent=2, ensure_ascii=False,
+            )[:2000]
             if peer_result.get("success"):
                 enhanced_question = f"""{question}
 
@@ -1567,6 +1914,61 @@ Do NOT suggest using slash commands. Be helpful and conversational."""
 
         return response
 
+    def _build_answer_context(self, question: str) -> dict[str, Any]:
+        """
+        Build the user, project and knowledge context for a direct answer.
+
+        Args:
+            question: The user's question.
+
+        Returns:
+            Context dictionary for chat_with_context.
+        """
+        context: dict[str, Any] = {}
+
+        # Add user context from onboarding
+        user = self.state.get_contexts(
+            ["user_name", "user_role", "user_goals", "user_challenges"]
+        )
+        if user["user_name"]:
+            context["user"] = {
+                "name": user["user_name"],
+                "role": user["user_role"],
+                "goals": user["user_goals"],
+                "challenges": user["user_challenges"],
+            }
+
+        # Add task context
+        context.update(self.get_project_context_cached())
+
+        # Add project knowledge context
+        project_knowledge = self._get_relevant_project_knowledge(question)
+        if project_knowledge:
+            context["project_knowledge"] = project_knowledge
+
+        return context
+
+    def _find_relevant_notes(self, question: str) -> list[dict[str, Any]]:
+        """
+        Find journal notes relevant to a question, with their content.
+
+        Args:
+            question: The user's question.
+
+        Returns:
+            Up to three dicts with the note's summary and first 500
+            characters of content.
+        """
+        return [
+            {
+                "summary": e.get("summary"),
+                "content": self.journal_retriever.read_entry_preview(
+                    e.get("filename", ""), 500,
+                ),
+            }
+            for e in self.search_journal(question, top_n=3)
+        ]
+
     def _classify_intent(self, question: str) -> str:
         """
         Classify the user's question intent using the LLM.
@@ -1661,15 +2063,16 @@ Do NOT suggest using slash commands. Be helpful and conversational."""
             Response from Claude Code, or None if unavailable.
         """
         # Check if Executor is running
-        executor_status = self.get_peer_status(Agents.EXECUTOR)
+        executor_status = self._get_peer_status_cached(Agents.EXECUTOR)
         if not executor_status or executor_status.get("status") != "running":
             logger.debug("[FDA] Executor not running, falling back to direct API")
             return None
 
         # Build context for Claude Code
-        user_name = self.state.get_context("user_name") or "user"
-        user_role = self.state.get_context("user_role") or ""
-        user_goals = self.state.get_context("user_goals") or ""
+        user = self.state.get_contexts(["user_name", "user_role", "user_goals"])
+        user_name = user["user_name"] or "user"
+        user_role = user["user_role"] or ""
+        user_goals = user["user_goals"] or ""
 
         # Prepare the prompt with context
         # Note: Claude Code has access to tools (web search, bash, file access)
@@ -1828,7 +2231,7 @@ Answer helpfully and conversationally. Be concise but thorough."""
             logger.info(f"[FDA] User specified explicit path: {explicit_path}")
 
         # Check if Librarian is running
-        librarian_status = self.get_peer_status(Agents.LIBRARIAN)
+        librarian_status = self._get_peer_status_cached(Agents.LIBRARIAN)
         if librarian_status and librarian_status.get("status") == "running":
             # Send request and wait for response, passing explicit path if found
             result = self.request_file_search(question, path=explicit_path, wait_for_response=True, timeout=15.0)
@@ -2071,7 +2474,7 @@ Answer helpfully and conversationally. Be concise but thorough."""
         logger.info(f"[FDA] Delegating to Executor: {question}")
 
         # Check if Executor is running
-        executor_status = self.get_peer_status(Agents.EXECUTOR)
+        executor_status = self._get_peer_status_cached(Agents.EXECUTOR)
         if not executor_status or executor_status.get("status") != "running":
             logger.warning("[FDA] Executor is not running, cannot delegate")
             return None
@@ -2111,14 +2514,14 @@ Answer helpfully and conversationally. Be concise but thorough."""
         logger.info(f"[FDA] Delegating to Claude Code: {prompt[:80]}...")
 
         # Check if Executor is running
-        executor_status = self.get_peer_status(Agents.EXECUTOR)
+        executor_status = self._get_peer_status_cached(Agents.EXECUTOR)
         if not executor_status or executor_status.get("status") != "running":
             logger.warning("[FDA] Executor is not running, cannot delegate to Claude Code")
             return None
 
         # Send request via message bus
         msg_id = self.message_bus.request_claude_code(
-            from_agent=self.name.lower(),
+            from_agent=self._name_lower,
             prompt=prompt,
             cwd=cwd,
             allow_edits=allow_edits,
@@ -2128,7 +2531,7 @@ Answer helpfully and conversationally. Be concise but thorough."""
 
         # Wait for response
         response = self.message_bus.wait_for_response(
-            agent_name=self.name.lower(),
+            agent_name=self._name_lower,
             request_id=msg_id,
             timeout_seconds=float(timeout + 30),  # Extra buffer for response
             poll_interval=1.0,
@@ -2196,8 +2599,7 @@ Answer helpfully and conversationally. Be concise but thorough."""
             Review results and recommendations.
         """
         # Get task details
-        tasks = self.state.get_tasks()
-        task = next((t for t in tasks if t.get("id") == task_id), None)
+        task = self.state.get_task(task_id)
 
         if not task:
             return {
@@ -2207,7 +2609,7 @@ Answer helpfully and conversationally. Be concise but thorough."""
 
         context = {
             "task": task,
-            "project_context": self.get_project_context(),
+            "project_context": self.get_project_context_cached(),
         }
 
         prompt = f"""Review this task and provide feedback:
@@ -2228,10 +2630,7 @@ Please provide:
         response = self.chat_with_context(prompt, context)
 
         # Determine approval status
-        approved = any(
-            phrase in response.lower()
-            for phrase in ["approved", "can be marked as complete", "looks good"]
-        )
+        approved = _REVIEW_APPROVED_RE.search(response) is not None
 
         return {
             "status": "completed",
@@ -2245,24 +2644,38 @@ Please provide:
         """
         Check key performance indicators for the project.
 
+        KPI snapshots are recorded on every check. If the task counts are
+        unchanged since the last check (within ANALYSIS_CACHE_TTL), its
+        result is returned again with "cached": True instead of asking for
+        a new analysis.
+
         Returns:
             Dictionary containing KPI values, trends, and health status.
         """
-        # Get task-based KPIs
-        tasks = self.state.get_tasks()
+        now_iso = datetime.now().isoformat()
 
-        total_tasks = len(tasks)
-        completed_tasks = len([t for t in tasks if t.get("status") == "completed"])
-        blocked_tasks = len([t for t in tasks if t.get("status") == "blocked"])
-        in_progress = len([t for t in tasks if t.get("status") == "in_progress"])
+        # Get task-based KPIs
+        status_counts = self.state.get_task_status_counts()
+        total_tasks = sum(status_counts.values())
+        completed_tasks = status_counts.get("completed", 0)
+        blocked_tasks = status_counts.get("blocked", 0)
+        in_progress = status_counts.get("in_progress", 0)
 
         completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
         block_rate = (blocked_tasks / total_tasks * 100) if total_tasks > 0 else 0
 
         # Record KPI snapshots
-        self.state.add_kpi_snapshot("completion_rate", completion_rate)
-        self.state.add_kpi_snapshot("block_rate", block_rate)
-        self.state.add_kpi_snapshot("total_tasks", total_tasks)
+        self.state.add_kpi_snapshots([
+            ("completion_rate", completion_rate),
+            ("block_rate", block_rate),
+            ("total_tasks", total_tasks),
+        ], timestamp=now_iso)
+
+        digest = self._inputs_digest([total_tasks, completed_tasks, blocked_tasks, in_progress])
+        cached = self._get_cached_analysis("check_kpis", digest)
+        if cached is not None:
+            logger.info("[FDA] KPI check reused: task counts unchanged since last run")
+            return cached
 
         # Get historical trends
         completion_history = self.state.get_kpi_history("completion_rate", limit=7)
@@ -2291,12 +2704,14 @@ Please assess:
 
         analysis = self.chat_with_context(prompt, context)
 
-        return {
+        result = {
             "status": "completed",
             "kpis": kpi_data,
             "analysis": analysis,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso,
         }
+        self._cache_analysis("check_kpis", digest, result)
+        return result
 
     def prepare_meeting(self, event_id: str) -> dict[str, Any]:
         """
@@ -2312,6 +2727,22 @@ Please assess:
         Returns:
             Dictionary containing meeting brief, agenda, and discussion points.
         """
+        event_details, context, prompt, sharepoint_files = self._meeting_prep_inputs(event_id)
+        response = self.chat_with_context(prompt, context)
+        return self._record_meeting_prep(event_id, event_details, sharepoint_files, response)
+
+    def _meeting_prep_inputs(
+        self, event_id: str,
+    ) -> tuple[dict[str, Any], dict[str, Any], str, list[dict[str, Any]]]:
+        """
+        Gather everything prepare_meeting sends to the LLM.
+
+        Args:
+            event_id: The ID of the calendar event.
+
+        Returns:
+            Tuple of (event details, context, prompt, SharePoint files).
+        """
         # Get event details if calendar is available
         event_details = {}
         if self.calendar:
@@ -2321,7 +2752,7 @@ Please assess:
                 logger.warning(f"Could not fetch event details: {e}")
 
         # Get project context
-        context = self.get_project_context()
+        context = self.get_project_context_cached()
         context["event"] = event_details
 
         # Get recent relevant journal entries
@@ -2352,10 +2783,10 @@ Please assess:
         context["sharepoint_files"] = sharepoint_files
 
         # Build the prompt with SharePoint file context
-        attendee_list = ", ".join(
-            a.get("name", a.get("email", ""))
-            for a in event_details.get("attendees", [])
-        )
+        attendee_list = ", ".join([
+            a.get("name") or a.get("email") or ""
+            for a in event_details.get("attendees", ())
+        ])
 
         prompt = f"""Prepare a briefing for this upcoming meeting:
 
@@ -2386,8 +2817,27 @@ Please provide:
 6. **Supporting Data**: Relevant metrics, status updates, or data from the files above
 7. **Referenced Files**: List any SharePoint/OneDrive files that attendees should review before the meeting"""
 
-        response = self.chat_with_context(prompt, context)
+        return event_details, context, prompt, sharepoint_files
+
+    def _record_meeting_prep(
+        self,
+        event_id: str,
+        event_details: dict[str, Any],
+        sharepoint_files: list[dict[str, Any]],
+        response: str,
+    ) -> dict[str, Any]:
+        """
+        Store a generated meeting brief and log it to the journal.
 
+        Args:
+            event_id: The ID of the calendar event.
+            event_details: Event details used for the brief.
+            sharepoint_files: SharePoint/OneDrive files found for the meeting.
+            response: The generated brief.
+
+        Returns:
+            Dictionary containing the meeting brief (see prepare_meeting).
+        """
         # Store the preparation
         prep_id = self.state.record_meeting_prep(
             event_id=event_id,
@@ -2476,7 +2926,7 @@ Please provide:
         Returns:
             Dictionary with the decision and rationale.
         """
-        context = self.get_project_context()
+        context = self.get_project_context_cached()
         if context_info:
             context["additional_context"] = context_info
 
@@ -4,6 +4,7 @@ Journal index management.
 Maintains an index of journal entries for fast lookup and search.
 """
 
+import heapq
 import json
 from pathlib import Path
 from typing import Any, Optional
@@ -70,6 +71,28 @@ class JournalIndex:
             metadata: Entry metadata (filename, author, tags, summary,
                      created_at, relevance_decay).
         """
+        self._upsert_entry(metadata)
+        self.save()
+
+    def add_entries(self, entries: list[dict[str, Any]]) -> None:
+        """
+        Add several entries to the index with a single save.
+
+        Args:
+            entries: List of entry metadata dictionaries (see add_entry).
+        """
+        for metadata in entries:
+            self._upsert_entry(metadata)
+        if entries:
+            self.save()
+
+    def _upsert_entry(self, metadata: dict[str, Any]) -> None:
+        """
+        Insert or replace an entry in memory without saving.
+
+        Args:
+            metadata: Entry metadata dictionary.
+        """
         required_fields = ["filename", "author", "tags", "summary", "created_at"]
         for field in required_fields:
             if field not in metadata:
@@ -84,8 +107,6 @@ class JournalIndex:
         else:
             self.entries.append(metadata)
 
-        self.save()
-
     def remove_entry(self, filename: str) -> bool:
         """
         Remove an entry from the index by filename.
@@ -225,9 +246,8 @@ class JournalIndex:
         Returns:
             List of recent entries, sorted by date descending.
         """
-        sorted_entries = sorted(
+        return heapq.nlargest(
+            limit,
             self.entries,
             key=lambda e: e.get("created_at", ""),
-            reverse=True,
         )
-        return sorted_entries[:limit]
@@ -5,7 +5,9 @@ Implements two-pass retrieval: filter by tags and keywords, then rank by
 relevance and recency with decay.
 """
 
+import heapq
 import math
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Optional
 from datetime import datetime
@@ -20,6 +22,9 @@ from fda.config import (
 )
 from fda.journal.index import JournalIndex
 
+# Characters read at a time when building an entry preview
+PREVIEW_CHUNK_SIZE = 4096
+
 
 class JournalRetriever:
     """
@@ -72,41 +77,48 @@ class JournalRetriever:
         if not candidates:
             return []
 
-        # Pass 2: Score and rank
-        scored_entries = []
+        # Pass 2: Score and rank. The query is preprocessed once for all
+        # candidates, and only the top_n winners are copied into results
+        query_tag_set = set(query_tags)
+        query_words = query_text.lower().split() if query_text else None
+        now = datetime.now()
+
+        scored = []
         for entry in candidates:
-            relevance = self._calculate_relevance_score(entry, query_tags, query_text)
-            recency = self._calculate_recency_score(entry)
+            relevance = self._calculate_relevance_score(entry, query_tag_set, query_words)
+            recency = self._calculate_recency_score(entry, now)
 
             # Combined score using configured weights
             combined_score = (RELEVANCE_WEIGHT * relevance) + (RECENCY_WEIGHT * recency)
+            scored.append((round(combined_score, 4), relevance, recency, entry))
 
-            scored_entry = {
+        # Highest combined score first (ties keep index order, like a stable sort)
+        top = heapq.nlargest(top_n, scored, key=itemgetter(0))
+
+        return [
+            {
                 **entry,
                 "relevance_score": round(relevance, 4),
                 "recency_score": round(recency, 4),
-                "combined_score": round(combined_score, 4),
+                "combined_score": combined_score,
             }
-            scored_entries.append(scored_entry)
-
-        # Sort by combined score descending
-        scored_entries.sort(key=lambda e: e["combined_score"], reverse=True)
-
-        return scored_entries[:top_n]
+            for combined_score, relevance, recency, entry in top
+        ]
 
     def _calculate_relevance_score(
         self,
         entry: dict[str, Any],
-        query_tags: list[str],
-        query_text: str,
+        query_tag_set: set[str],
+        query_words: Optional[list[str]],
     ) -> float:
         """
         Calculate relevance score for an entry.
 
         Args:
             entry: Entry metadata.
-            query_tags: Query tags.
-            query_text: Query text.
+            query_tag_set: Query tags.
+            query_words: Lowercased words of the query text, or None if
+                there is no text query.
 
         Returns:
             Relevance score between 0 and 1.
@@ -118,18 +130,15 @@ class JournalRetriever:
         summary = entry.get("summary", "").lower()
 
         # Tag matching (up to 0.5 points)
-        if query_tags:
+        if query_tag_set:
             max_possible += 0.5
-            query_tag_set = set(query_tags)
             matching_tags = entry_tags.intersection(query_tag_set)
-            if query_tag_set:
-                tag_match_ratio = len(matching_tags) / len(query_tag_set)
-                score += 0.5 * tag_match_ratio
+            tag_match_ratio = len(matching_tags) / len(query_tag_set)
+            score += 0.5 * tag_match_ratio
 
         # Keyword matching (up to 0.5 points)
-        if query_text:
+        if query_words is not None:
             max_possible += 0.5
-            query_words = query_text.lower().split()
 
             if query_words:
                 # Check how many query words appear in summary
@@ -155,6 +164,7 @@ class JournalRetriever:
     def _calculate_recency_score(
         self,
         entry: dict[str, Any],
+        now: Optional[datetime] = None,
     ) -> float:
         """
         Calculate recency score with decay.
@@ -164,6 +174,7 @@ class JournalRetriever:
 
         Args:
             entry: Entry metadata with 'created_at' and 'relevance_decay'.
+            now: Current time (defaults to datetime.now()).
 
         Returns:
             Recency score between 0 and 1.
@@ -177,7 +188,8 @@ class JournalRetriever:
         except (ValueError, TypeError):
             return 0.5
 
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         age_days = (now - created_at).total_seconds() / (24 * 3600)
 
         # Get decay rate
@@ -214,6 +226,56 @@ class JournalRetriever:
 
         return content
 
+    def read_entry_preview(self, filename: str, max_chars: int = 500) -> str:
+        """
+        Read the beginning of a journal entry without loading the whole file.
+
+        Returns the same text as ``_read_entry_content(filename)[:max_chars]``
+        but stops reading once the preview is known.
+
+        Args:
+            filename: The entry filename.
+            max_chars: Maximum number of characters to return.
+
+        Returns:
+            The first max_chars characters of the entry (without frontmatter).
+        """
+        filepath = self.journal_dir / filename
+        if not filepath.exists():
+            return ""
+
+        with open(filepath, encoding="utf-8") as f:
+            text = f.read(max(max_chars + 3, PREVIEW_CHUNK_SIZE))
+            if not text.startswith("---"):
+                return text[:max_chars]
+
+            # Find the end of the frontmatter
+            end = text.find("---", 3)
+            while end == -1:
+                chunk = f.read(PREVIEW_CHUNK_SIZE)
+                if not chunk:
+                    # Unterminated frontmatter is kept, as in _read_entry_content
+                    return text[:max_chars]
+                text += chunk
+                end = text.find("---", 3)
+
+            # The body is stripped, so skip leading whitespace first
+            body = text[end + 3:].lstrip()
+            while len(body) < max_chars:
+                chunk = f.read(PREVIEW_CHUNK_SIZE)
+                if not chunk:
+                    return body.rstrip()[:max_chars]
+                body = (body + chunk).lstrip()
+
+            # Trailing whitespace only matters if nothing else follows
+            preview = body[:max_chars]
+            tail = body[max_chars:]
+            while not tail.strip():
+                tail = f.read(PREVIEW_CHUNK_SIZE)
+                if not tail:
+                    return preview.rstrip()
+            return preview
+
     def retrieve_with_content(
         self,
         query_tags: Optional[list[str]] = None,
@@ -56,6 +56,56 @@ class JournalWriter:
         Returns:
             Path to the written journal file.
         """
+        filepath, metadata = self._write_entry_file(
+            author, tags, summary, content, relevance_decay,
+        )
+
+        # Update the index
+        self.index.add_entry(metadata)
+
+        return filepath
+
+    def write_entries(self, entries: list[dict[str, Any]]) -> list[Path]:
+        """
+        Write several entries, saving the index once for the whole batch.
+
+        Args:
+            entries: List of dicts with the write_entry keyword arguments
+                (author, tags, summary, content, relevance_decay).
+
+        Returns:
+            Paths to the written journal files, in input order.
+        """
+        paths = []
+        metadata_batch = []
+        for entry in entries:
+            filepath, metadata = self._write_entry_file(
+                entry["author"],
+                entry["tags"],
+                entry["summary"],
+                entry["content"],
+                entry.get("relevance_decay", "medium"),
+            )
+            paths.append(filepath)
+            metadata_batch.append(metadata)
+
+        self.index.add_entries(metadata_batch)
+        return paths
+
+    def _write_entry_file(
+        self,
+        author: str,
+        tags: list[str],
+        summary: str,
+        content: str,
+        relevance_decay: str,
+    ) -> tuple[Path, dict[str, Any]]:
+        """
+        Write an entry's markdown file without touching the index.
+
+        Returns:
+            Tuple of (path to the written file, index metadata).
+        """
         now = datetime.now()
         filename = self._generate_filename(summary, now)
         filepath = self.journal_dir / filename
@@ -75,17 +125,14 @@ class JournalWriter:
         # Write the file
         filepath.write_text(full_content, encoding="utf-8")
 
-        # Update the index
-        self.index.add_entry({
+        return filepath, {
             "filename": filename,
             "author": author,
             "tags": tags,
             "summary": summary,
             "created_at": now.isoformat(),
             "relevance_decay": relevance_decay,
-        })
-
-        return filepath
+        }
 
     def _generate_filename(self, summary: str, timestamp: Optional[datetime] = None) -> str:
         """
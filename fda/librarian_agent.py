@@ -1262,14 +1262,13 @@ Return the enhanced entry."""
         # Build context for summarization
         entry_summaries = []
         for entry in entries[:20]:
-            content = self.journal_retriever._read_entry_content(
-                entry.get("filename", "")
-            )
             entry_summaries.append({
                 "summary": entry.get("summary"),
                 "author": entry.get("author"),
                 "date": entry.get("created_at", "")[:10],
-                "content_preview": content[:500] if content else "",
+                "content_preview": self.journal_retriever.read_entry_preview(
+                    entry.get("filename", ""), max_chars=500
+                ),
             })
 
         context = {"entries": entry_summaries}
@@ -742,15 +742,15 @@ class FDAOrchestrator:
             filename = entry.get("filename", "")
             summary = entry.get("summary", "")
             tags = entry.get("tags", [])
-            content = retriever._read_entry_content(filename) if filename else ""
+            # Very long entries are truncated, so only read what is kept
+            content = retriever.read_entry_preview(filename, max_chars=2000) if filename else ""
 
             entry_block = (
                 f"### {summary}\n"
                 f"**Tags:** {', '.join(tags)}\n"
             )
             if content:
-                # Truncate very long entries
-                entry_block += content[:2000] + "\n"
+                entry_block += content + "\n"
             entries_with_content.append(entry_block)
 
         # Build transcript of all entries
@@ -382,6 +382,56 @@ class ProjectState:
                 pass
         return self.connection
 
+    def get_data_version(self) -> int:
+        """
+        Get SQLite's data_version counter for this connection.
+
+        The value changes whenever another connection commits to the
+        database, so callers can detect new writes without querying tables.
+
+        Returns:
+            Current data_version value.
+        """
+        conn = self._get_connection()
+        return conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def get_change_token(self) -> tuple[int, int]:
+        """
+        Get a token that changes whenever the database is modified.
+
+        Combines ``data_version`` (commits from other connections) with this
+        connection's ``total_changes`` (its own writes), so cached query
+        results can be reused until either side writes.
+
+        Returns:
+            Tuple of (data_version, total_changes).
+        """
+        conn = self._get_connection()
+        return (conn.execute("PRAGMA data_version").fetchone()[0], conn.total_changes)
+
+    def get_context_token(self) -> tuple[Any, ...]:
+        """
+        Get a token that changes only when tasks or open alerts change.
+
+        Unlike get_change_token, writes to other tables (heartbeats, agent
+        status, KPI snapshots, journal data) leave it untouched. Every task
+        write bumps ``updated_at``, and raising or acknowledging an alert
+        moves the count or newest ``created_at`` of unacknowledged alerts.
+
+        Returns:
+            Tuple of (task count, newest task update, open alert count,
+            newest open alert).
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*), MAX(updated_at) FROM tasks")
+        task_count, task_updated = cursor.fetchone()
+        cursor.execute(
+            "SELECT COUNT(*), MAX(created_at) FROM alerts WHERE acknowledged = 0"
+        )
+        alert_count, alert_created = cursor.fetchone()
+        return (task_count, task_updated, alert_count, alert_created)
+
     def set_context(self, key: str, value: Any) -> None:
         """
         Set a project context value.
@@ -423,6 +473,30 @@ class ProjectState:
             return None
         return json.loads(row["value"])
 
+    def get_contexts(self, keys: list[str]) -> dict[str, Any]:
+        """
+        Get several project context values in one query.
+
+        Args:
+            keys: Context keys.
+
+        Returns:
+            Dictionary mapping each key to its value, or None if not found.
+        """
+        result: dict[str, Any] = dict.fromkeys(keys)
+        if not keys:
+            return result
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        placeholders = ", ".join("?" * len(keys))
+        cursor.execute(
+            f"SELECT key, value FROM context WHERE key IN ({placeholders})",
+            list(keys),
+        )
+        for row in cursor.fetchall():
+            result[row["key"]] = json.loads(row["value"])
+        return result
+
     def add_task(
         self,
         title: str,
@@ -508,6 +582,36 @@ class ProjectState:
         rows = cursor.fetchall()
         return [dict(row) for row in rows]
 
+    def get_task(self, task_id: str) -> Optional[dict[str, Any]]:
+        """
+        Get a single task by ID.
+
+        Args:
+            task_id: The task ID.
+
+        Returns:
+            Task dictionary or None if not found.
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM tasks WHERE id = ? LIMIT 1", (task_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return dict(row)
+
+    def get_task_status_counts(self) -> dict[str, int]:
+        """
+        Count tasks per status with a single aggregate query.
+
+        Returns:
+            Dictionary mapping status to number of tasks.
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT status, COUNT(*) as count FROM tasks GROUP BY status")
+        return {row["status"]: row["count"] for row in cursor.fetchall()}
+
     def add_kpi_snapshot(
         self,
         metric: str,
@@ -531,6 +635,27 @@ class ProjectState:
         )
         conn.commit()
 
+    def add_kpi_snapshots(
+        self,
+        snapshots: list[tuple[str, float]],
+        timestamp: Optional[str] = None,
+    ) -> None:
+        """
+        Record several KPI snapshots in a single transaction.
+
+        Args:
+            snapshots: List of (metric, value) tuples.
+            timestamp: Optional timestamp shared by all snapshots (defaults to now).
+        """
+        ts = timestamp or datetime.now().isoformat()
+        conn = self._get_connection()
+        # One transaction (and one commit) for all rows; rolled back on error
+        with conn:
+            conn.executemany(
+                "INSERT INTO kpi_snapshots (metric, value, timestamp) VALUES (?, ?, ?)",
+                [(metric, value, ts) for metric, value in snapshots],
+            )
+
     def get_latest_kpi(self, metric: str) -> Optional[dict[str, Any]]:
         """
         Get the latest value for a KPI metric.
@@ -742,6 +867,27 @@ class ProjectState:
             return None
         return dict(row)
 
+    def get_prepared_event_ids(self, event_ids: list[str]) -> set[str]:
+        """
+        Find which events already have meeting preparation, in one query.
+
+        Args:
+            event_ids: Calendar event IDs to check.
+
+        Returns:
+            Set of the given event IDs that have a meeting prep record.
+        """
+        if not event_ids:
+            return set()
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        placeholders = ", ".join("?" * len(event_ids))
+        cursor.execute(
+            f"SELECT DISTINCT event_id FROM meeting_prep WHERE event_id IN ({placeholders})",
+            list(event_ids),
+        )
+        return {row["event_id"] for row in cursor.fetchall()}
+
     # Telegram user methods
 
     def register_telegram_user(
@@ -1880,20 +2026,20 @@ class ProjectState:
             Number of keywords inserted.
         """
         conn = self._get_connection()
-        cursor = conn.cursor()
         rows = [
             (f"kw_{uuid.uuid4().hex[:8]}", pid, kw, w, st, sp, did)
             for pid, kw, w, st, sp, did in keywords
         ]
-        cursor.executemany(
-            """
-            INSERT INTO project_keywords
-            (id, project_id, keyword, weight, source_type, source_path, domain_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            rows,
-        )
-        conn.commit()
+        # One transaction (and one commit) for all rows; rolled back on error
+        with conn:
+            conn.executemany(
+                """
+                INSERT INTO project_keywords
+                (id, project_id, keyword, weight, source_type, source_path, domain_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
         return len(rows)
 
     def search_project_keywords(
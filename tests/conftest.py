@@ -155,3 +155,35 @@ def local_worker(local_worker_dir, mock_claude_backend):
         agent._backend = mock_claude_backend
         agent._current_project = local_worker_dir
         return agent
+
+
+# ---------------------------------------------------------------------------
+# Executor fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def executor(tmp_path, mock_claude_backend):
+    """ExecutorAgent with mocked backend, state, bus, and journal."""
+    with patch("fda.base_agent.get_claude_backend", return_value=mock_claude_backend), \
+         patch("fda.base_agent.ProjectState"), \
+         patch("fda.base_agent.MessageBus"), \
+         patch("fda.base_agent.JournalWriter"), \
+         patch("fda.base_agent.JournalRetriever"):
+        from fda.executor_agent import ExecutorAgent
+        return ExecutorAgent(working_directory=str(tmp_path))
+
+
+# ---------------------------------------------------------------------------
+# FDA agent fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def fda_agent(mock_claude_backend):
+    """FDAAgent with mocked backend, state, bus, and journal."""
+    with patch("fda.base_agent.get_claude_backend", return_value=mock_claude_backend), \
+         patch("fda.base_agent.ProjectState"), \
+         patch("fda.base_agent.MessageBus"), \
+         patch("fda.base_agent.JournalWriter"), \
+         patch("fda.base_agent.JournalRetriever"):
+        from fda.fda_agent import FDAAgent
+        return FDAAgent()
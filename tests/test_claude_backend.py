@@ -0,0 +1,41 @@
+"""
+Tests for the Claude backends.
+"""
+
+from unittest.mock import MagicMock
+
+from fda.claude_backend import AnthropicAPIBackend
+
+
+class TestAnthropicAPIBackend:
+    """Tests for AnthropicAPIBackend with a mocked client."""
+
+    def _backend(self):
+        backend = AnthropicAPIBackend.__new__(AnthropicAPIBackend)
+        backend._client = MagicMock()
+        response = MagicMock(stop_reason="end_turn")
+        response.content = [MagicMock(type="text", text="hi")]
+        backend._client.messages.create.return_value = response
+        return backend
+
+    def test_system_prompt_marked_cacheable(self):
+        backend = self._backend()
+        assert backend.complete(system="sys", messages=[], model="m") == "hi"
+        assert backend._client.messages.create.call_args.kwargs["system"] == [
+            {"type": "text", "text": "sys", "cache_control": {"type": "ephemeral"}},
+        ]
+
+    def test_streaming_falls_back_to_non_streaming(self):
+        backend = self._backend()
+        backend._client.messages.stream.side_effect = RuntimeError("no streaming")
+
+        result = backend.complete_with_tools_streaming(
+            system="sys",
+            messages=[{"role": "user", "content": "q"}],
+            tools=[],
+            tool_executor=lambda name, args: "",
+            model="m",
+        )
+        assert result == "hi"
+        system = backend._client.messages.create.call_args.kwargs["system"]
+        assert system[0]["text"] == "sys"
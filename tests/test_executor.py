@@ -0,0 +1,725 @@
+"""
+Tests for ExecutorAgent — status reporting, commands, and file operations.
+"""
+
+import os
+import re
+import sys
+import pytest
+from unittest.mock import patch
+
+
+class TestStatusReporting:
+    """Tests for heartbeat/status writes."""
+
+    def test_report_status_single_write(self, executor):
+        executor._report_status("running")
+        executor.state.update_agent_status.assert_called_once_with(
+            "executor", "running", None,
+        )
+        executor.state.agent_heartbeat.assert_not_called()
+
+    def test_report_status_throttles_unchanged(self, executor):
+        executor._report_status("running")
+        executor._report_status("running")
+        assert executor.state.update_agent_status.call_count == 1
+
+    def test_report_status_writes_on_change(self, executor):
+        executor._report_status("running")
+        executor._report_status("busy", "Processing execute_request")
+        executor._report_status("running")
+        assert executor.state.update_agent_status.call_count == 3
+
+    def test_report_status_rewrites_after_interval(self, executor):
+        with patch("fda.executor_agent.time.monotonic", side_effect=[100.0, 106.0]):
+            executor._report_status("running")
+            executor._report_status("running")
+        assert executor.state.update_agent_status.call_count == 2
+
+
+class TestJournalPrefilter:
+    """Tests for the journal search pre-check in execute_task."""
+
+    def _use_index(self, executor, tmp_path, entries):
+        from fda.journal.index import JournalIndex
+        index = JournalIndex(index_path=tmp_path / "index.json")
+        index.add_entries([
+            {"filename": f"e{i}.md", "author": "a", "created_at": "2026-01-01T00:00:00", **e}
+            for i, e in enumerate(entries)
+        ])
+        executor.journal_retriever.index = index
+        return index
+
+    def test_short_description_skips_search(self, executor, tmp_path):
+        self._use_index(executor, tmp_path, [
+            {"summary": "Deploy the api", "tags": ["deploy"]},
+        ])
+        assert not executor._journal_may_match("Deploy api", "short")
+
+    def test_shared_word_runs_search(self, executor, tmp_path):
+        self._use_index(executor, tmp_path, [
+            {"summary": "Deploy the api", "tags": ["task-complete"]},
+        ])
+        description = "Roll out the new release to the staging deploy target"
+        assert executor._journal_may_match(f"Release {description}", description)
+
+    def test_unknown_vocabulary_skips_search(self, executor, tmp_path):
+        index = self._use_index(executor, tmp_path, [
+            {"summary": "Deploy the api", "tags": ["deploy"]},
+        ])
+        description = "Write quarterly marketing newsletter covering product news"
+        query = f"Newsletter {description}"
+        assert not executor._journal_may_match(query, description)
+        assert index.search(keywords=query) == []
+
+    def test_substring_match_runs_search(self, executor, tmp_path):
+        index = self._use_index(executor, tmp_path, [
+            {"summary": "Staging deployment notes", "tags": []},
+        ])
+        description = "Figure out why we cannot deploy on Fridays anymore"
+        query = f"Deploy {description}"
+        assert index.search(keywords=query)
+        assert executor._journal_may_match(query, description)
+
+    def test_index_changes_rebuild_text(self, executor, tmp_path):
+        index = self._use_index(executor, tmp_path, [
+            {"summary": "Deploy the api", "tags": []},
+        ])
+        description = "Write quarterly marketing newsletter covering product news"
+        assert not executor._journal_may_match(description, description)
+
+        # Same entry count, new content
+        index.add_entry({
+            "filename": "e0.md", "author": "a", "created_at": "2026-01-01T00:00:00",
+            "summary": "Quarterly newsletter draft", "tags": [],
+        })
+        assert executor._journal_may_match(description, description)
+
+
+class TestErrorBackoff:
+    """Tests for event loop error recovery."""
+
+    def test_backoff_grows_and_heartbeats(self, executor):
+        executor._running = True
+        executor._error_backoff = 12.0
+        clock = [0.0]
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        with patch("fda.executor_agent.time.monotonic", side_effect=lambda: clock[0]), \
+             patch("fda.executor_agent.time.sleep", side_effect=fake_sleep) as mock_sleep, \
+             patch("fda.executor_agent.random.uniform", return_value=1.0):
+            executor._backoff_after_error()
+
+        assert executor._error_backoff == 24.0
+        assert clock[0] == 12.0
+        assert executor.state.agent_heartbeat.call_count == 3
+        assert all(c.args[0] <= executor.HEARTBEAT_INTERVAL for c in mock_sleep.call_args_list)
+
+    def test_backoff_is_capped(self, executor):
+        executor._running = False
+        executor._error_backoff = executor.ERROR_BACKOFF_MAX
+        executor._backoff_after_error()
+        assert executor._error_backoff == executor.ERROR_BACKOFF_MAX
+
+
+class TestMessageHandling:
+    """Tests for _handle_message dispatch."""
+
+    def test_status_request_skips_status_writes(self, executor):
+        executor._handle_message({
+            "id": "m1", "type": "status_request", "from": "fda",
+            "subject": "status", "body": "",
+        })
+        executor.state.update_agent_status.assert_not_called()
+        executor.message_bus.send_result.assert_called_once()
+        assert executor.message_bus.send_result.call_args.kwargs["msg_type"] == "status_response"
+
+
+class TestRunCommand:
+    """Tests for shell command execution."""
+
+    def test_string_command_uses_shell(self, executor):
+        result = executor.run_command("echo hello | tr a-z A-Z")
+        assert result["success"]
+        assert result["stdout"].strip() == "HELLO"
+
+    def test_argv_command_skips_shell(self, executor):
+        result = executor.run_command(["echo", "a b", "$HOME"])
+        assert result["success"]
+        assert result["stdout"].strip() == "a b $HOME"
+        assert result["command"] == "echo 'a b' '$HOME'"
+
+    def test_argv_command_dangerous_check(self, executor):
+        result = executor.run_command(["rm", "-rf", "/"])
+        assert not result["success"]
+        assert result["error"] == "Blocked for safety"
+
+    def test_missing_cwd_reports_error(self, executor, tmp_path):
+        result = executor.run_command("echo hi", cwd=str(tmp_path / "missing"))
+        assert not result["success"]
+        assert "does not exist" in result["error"]
+
+    def test_output_is_capped(self, executor):
+        result = executor.run_command("yes x | head -c 1000000; yes y | head -c 100000 >&2")
+        assert result["success"]
+        assert len(result["stdout"]) == 10000
+        assert len(result["stderr"]) == 5000
+
+    def test_output_cap_counts_characters(self, executor):
+        result = executor.run_command([sys.executable, "-c", "print('\u00e9' * 20000, end='')"])
+        assert result["stdout"] == "\u00e9" * 10000
+
+    def test_timeout_kills_command(self, executor):
+        result = executor.run_command(["sleep", "5"], timeout=0.2)
+        assert not result["success"]
+        assert result["error"] == "timeout"
+
+    def test_execute_request_null_cwd_uses_default(self, executor, tmp_path):
+        executor._handle_execute_request({
+            "id": "m1", "from": "fda",
+            "body": '{"command": "pwd", "cwd": null}',
+        })
+        result = executor.message_bus.send_result.call_args.kwargs["result"]
+        assert result["cwd"] == str(tmp_path)
+
+
+class TestClaudeCodePrewarm:
+    """Tests for reusing a pre-started Claude Code process."""
+
+    @pytest.fixture
+    def fake_claude(self, tmp_path, monkeypatch):
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        script = bin_dir / "claude"
+        script.write_text(
+            '#!/bin/sh\n'
+            'if [ $# -gt 1 ]; then echo "arg:$2"; else echo "stdin:$(cat)"; fi\n'
+        )
+        script.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}:{os.environ['PATH']}")
+        return script
+
+    def test_second_call_uses_warm_process(self, executor, fake_claude):
+        first = executor.run_claude_code("one")
+        second = executor.run_claude_code("two")
+        assert first["output"].strip() == "arg:one"
+        assert second["output"].strip() == "stdin:two"
+        executor._release_warm_claude()
+
+    def test_allow_edits_skips_warm_process(self, executor, fake_claude):
+        executor.run_claude_code("one")
+        warm = executor._claude_proc
+        result = executor.run_claude_code("two", allow_edits=True)
+        assert result["output"].strip() == "arg:--dangerously-skip-permissions"
+        assert executor._claude_proc is warm
+        executor._release_warm_claude()
+
+    def test_cwd_mismatch_discards_warm_process(self, executor, fake_claude, tmp_path):
+        executor.run_claude_code("one")
+        other = tmp_path / "other"
+        other.mkdir()
+        result = executor.run_claude_code("two", cwd=str(other))
+        assert result["output"].strip() == "arg:two"
+        executor._release_warm_claude()
+
+    def test_stop_terminates_warm_process(self, executor, fake_claude):
+        executor.run_claude_code("one")
+        warm = executor._claude_proc
+        assert warm.poll() is None
+        executor.stop()
+        assert executor._claude_proc is None
+        assert warm.poll() is not None
+
+    def test_idle_warm_process_released_by_event_loop(self, executor, fake_claude):
+        executor.run_claude_code("one")
+        warm = executor._claude_proc
+        executor._claude_proc_started -= executor.WARM_CLAUDE_IDLE_TIMEOUT + 1
+        executor.message_bus.get_pending.return_value = []
+        executor.state.get_tasks.return_value = []
+
+        released_during_tick = []
+
+        def stop_after_tick(timeout=None):
+            released_during_tick.append(executor._claude_proc is None)
+            executor._running = False
+            return False
+
+        executor._wake.wait = stop_after_tick
+        executor._running = True
+        executor.run_event_loop()
+
+        assert released_during_tick == [True]
+        assert warm.poll() is not None
+
+
+class TestJournalQueue:
+    """Tests for the background journal flusher."""
+
+    def test_queued_entries_flushed_in_batch(self, executor):
+        for i in range(3):
+            executor._queue_journal(summary=f"S{i}", content="c", tags=["t"])
+        executor._stop_journal_flusher()
+
+        written = [
+            entry
+            for call in executor.journal_writer.write_entries.call_args_list
+            for entry in call.args[0]
+        ]
+        assert [e["summary"] for e in written] == ["S0", "S1", "S2"]
+        assert written[0]["author"] == "Executor"
+        assert executor._journal_thread is None
+
+    def test_callable_content_resolved_by_flusher(self, executor):
+        executor._queue_journal(summary="S", content=lambda: "built", tags=["t"])
+        executor._stop_journal_flusher()
+        batch = executor.journal_writer.write_entries.call_args.args[0]
+        assert batch[0]["content"] == "built"
+
+    def test_command_entries_coalesced(self, executor):
+        executor._queue_journal(summary="Command executed: a", content="A", tags=["command", "execution"])
+        executor._queue_journal(summary="Created file: x", content="X", tags=["file-create"])
+        executor._queue_journal(summary="Command executed: b", content="B", tags=["command", "execution"])
+        executor._stop_journal_flusher()
+
+        batch = executor.journal_writer.write_entries.call_args.args[0]
+        assert [e["summary"] for e in batch] == [
+            "Commands executed: 2 (first: Command executed: a)",
+            "Created file: x",
+        ]
+        assert batch[0]["content"] == "A\n\nB"
+
+    def test_stop_without_entries_is_noop(self, executor):
+        executor._stop_journal_flusher()
+        executor.journal_writer.write_entries.assert_not_called()
+
+
+class TestMessageDispatch:
+    """Tests for the handler table in _handle_message."""
+
+    def test_legacy_message_skips_status_writes(self, executor):
+        executor._handle_message({
+            "id": "m1", "type": "task_assignment", "from": "fda",
+            "subject": "New task", "body": "Task ID: 1",
+        })
+        executor.state.update_agent_status.assert_not_called()
+        executor.message_bus.send_result.assert_not_called()
+
+    def test_unknown_type_is_ignored(self, executor):
+        executor._handle_message({"id": "m1", "type": "mystery", "from": "fda", "body": "x"})
+        executor.state.update_agent_status.assert_not_called()
+
+    def test_empty_work_request_fails_fast(self, executor):
+        executor._handle_message({
+            "id": "m1", "type": "file_request", "from": "fda",
+            "subject": "File", "body": "",
+        })
+        executor.state.update_agent_status.assert_not_called()
+        kwargs = executor.message_bus.send_result.call_args.kwargs
+        assert kwargs["msg_type"] == "file_complete"
+        assert kwargs["success"] is False
+        assert kwargs["reply_to"] == "m1"
+
+    def test_work_request_brackets_status(self, executor):
+        executor._handle_message({
+            "id": "m1", "type": "execute_request", "from": "fda",
+            "subject": "Execute", "body": '{"command": "true"}',
+        })
+        statuses = [c.args[1] for c in executor.state.update_agent_status.call_args_list]
+        assert statuses == ["busy", "running"]
+
+
+class TestCommandHistory:
+    """Tests for the bounded command history."""
+
+    def test_history_is_bounded(self, executor):
+        for i in range(executor.COMMAND_HISTORY_LIMIT + 5):
+            executor.command_history.append({"command": f"cmd {i}", "success": True})
+        assert len(executor.command_history) == executor.COMMAND_HISTORY_LIMIT
+        assert executor.command_history[0]["command"] == "cmd 5"
+
+    def test_status_lists_last_five_commands(self, executor):
+        for i in range(8):
+            executor.command_history.append({"command": f"cmd {i}", "success": True})
+        executor._handle_status_request({"id": "m1", "from": "fda"})
+        status = executor.message_bus.send_result.call_args.kwargs["result"]
+        assert [c["command"] for c in status["recent_commands"]] == [f"cmd {i}" for i in range(3, 8)]
+        assert status["commands_executed"] == 8
+
+
+class TestFileOperations:
+    """Tests for executor file operations."""
+
+    def test_create_file(self, executor, tmp_path):
+        target = tmp_path / "nested" / "new.txt"
+        result = executor.create_file(str(target), "héllo")
+        assert result["success"]
+        assert target.read_text(encoding="utf-8") == "héllo"
+        assert result["size"] == 6
+
+    def test_create_file_bytes(self, executor, tmp_path):
+        target = tmp_path / "blob.bin"
+        data = bytes(range(256))
+        result = executor.create_file_bytes(str(target), data)
+        assert result["size"] == 256
+        assert target.read_bytes() == data
+
+    def test_edit_file_bytes(self, executor, tmp_path):
+        target = tmp_path / "blob.bin"
+        target.write_bytes(b"old")
+        result = executor.edit_file_bytes(str(target), b"\x00\xff")
+        assert result["original_size"] == 3
+        assert result["new_size"] == 2
+        assert target.read_bytes() == b"\x00\xff"
+
+    def test_edit_file_replaces_atomically(self, executor, tmp_path):
+        target = tmp_path / "script.sh"
+        target.write_text("old contents")
+        target.chmod(0o750)
+        result = executor.edit_file(str(target), "new")
+        assert result["success"]
+        assert result["original_size"] == len("old contents")
+        assert target.read_text() == "new"
+        assert (target.stat().st_mode & 0o777) == 0o750
+        assert [p.name for p in tmp_path.iterdir()] == ["script.sh"]
+
+    def test_edit_file_through_symlink(self, executor, tmp_path):
+        real = tmp_path / "real.txt"
+        real.write_text("old")
+        link = tmp_path / "link.txt"
+        link.symlink_to(real)
+        assert executor.edit_file(str(link), "new")["success"]
+        assert link.is_symlink()
+        assert real.read_text() == "new"
+
+    def test_edit_dangling_symlink(self, executor, tmp_path):
+        link = tmp_path / "link.txt"
+        link.symlink_to(tmp_path / "gone.txt")
+        result = executor.edit_file(str(link), "x")
+        assert result["error"] == "File does not exist"
+
+    def test_edit_missing_file(self, executor, tmp_path):
+        result = executor.edit_file(str(tmp_path / "nope.txt"), "x")
+        assert not result["success"]
+
+    def test_read_small_file(self, executor, tmp_path):
+        target = tmp_path / "small.txt"
+        target.write_text("hello")
+        result = executor.read_file(str(target))
+        assert result["content"] == "hello"
+        assert not result["truncated"]
+
+    def test_read_large_file_truncates(self, executor, tmp_path):
+        target = tmp_path / "large.txt"
+        target.write_text("a" * 200_000)
+        result = executor.read_file(str(target), max_size=100_000)
+        assert result["content"] == "a" * 100_000
+        assert result["truncated"]
+        assert result["size"] == 200_000
+
+    def test_read_large_file_whole(self, executor, tmp_path):
+        target = tmp_path / "large.txt"
+        target.write_text("b" * 70_000)
+        result = executor.read_file(str(target), max_size=100_000)
+        assert result["content"] == "b" * 70_000
+        assert not result["truncated"]
+
+    def test_read_large_file_truncates_in_characters(self, executor, tmp_path):
+        target = tmp_path / "large.txt"
+        target.write_text("é" * 70_000, encoding="utf-8")
+        result = executor.read_file(str(target), max_size=50_001)
+        assert result["content"] == "é" * 50_001
+        assert result["truncated"]
+
+        small = tmp_path / "small.txt"
+        small.write_text("é" * 1_000, encoding="utf-8")
+        result = executor.read_file(str(small), max_size=501)
+        assert result["content"] == "é" * 501
+        assert result["truncated"]
+
+    def test_read_file_mapping(self, executor, tmp_path):
+        target = tmp_path / "data.log"
+        target.write_bytes(b"x" * 500 + b"NEEDLE" + b"y" * 500)
+        result = executor.read_file(str(target), max_size=600, decode=False)
+        assert "content" not in result
+        assert result["truncated"]
+        with result["mapping"] as view:
+            assert len(view) == 600
+            assert re.search(rb"NEEDLE", view).start() == 500
+
+    def test_read_empty_file_mapping(self, executor, tmp_path):
+        target = tmp_path / "empty"
+        target.write_bytes(b"")
+        with executor.read_file(str(target), decode=False)["mapping"] as view:
+            assert len(view) == 0
+
+    def test_delete_directory_tree(self, executor, tmp_path):
+        tree = tmp_path / "build"
+        (tree / "a" / "b").mkdir(parents=True)
+        (tree / "a" / "b" / "f.txt").write_text("x")
+        assert executor.delete_file(str(tree))["success"]
+        assert not tree.exists()
+
+    def test_delete_symlink_keeps_target(self, executor, tmp_path):
+        target = tmp_path / "real"
+        target.mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(target)
+        assert executor.delete_file(str(link))["success"]
+        assert not link.is_symlink()
+        assert target.is_dir()
+
+    def test_delete_dangling_symlink(self, executor, tmp_path):
+        link = tmp_path / "dangling"
+        link.symlink_to(tmp_path / "gone")
+        assert executor.delete_file(str(link))["success"]
+        assert not executor.delete_file(str(link))["success"]
+
+    def test_copy_file_preserves_data_and_mtime(self, executor, tmp_path):
+        src = tmp_path / "src.bin"
+        src.write_bytes(os.urandom(300_000))
+        os.utime(src, (1_000_000, 1_000_000))
+        dest_dir = tmp_path / "out"
+        dest_dir.mkdir()
+        assert executor.copy_file(str(src), str(dest_dir))["success"]
+        copied = dest_dir / "src.bin"
+        assert copied.read_bytes() == src.read_bytes()
+        assert copied.stat().st_mtime == 1_000_000
+
+    def test_copy_file_onto_itself_keeps_source(self, executor, tmp_path):
+        src = tmp_path / "src.txt"
+        src.write_text("data")
+        assert not executor.copy_file(str(src), str(src))["success"]
+        assert not executor.copy_file(str(src), str(tmp_path))["success"]
+        assert src.read_text() == "data"
+
+    def test_copy_directory(self, executor, tmp_path):
+        src = tmp_path / "tree"
+        (src / "sub").mkdir(parents=True)
+        (src / "sub" / "a.txt").write_text("a")
+        (src / "empty.txt").write_text("")
+        assert executor.copy_file(str(src), str(tmp_path / "copy"))["success"]
+        assert (tmp_path / "copy" / "sub" / "a.txt").read_text() == "a"
+        assert (tmp_path / "copy" / "empty.txt").read_text() == ""
+
+
+class TestWorkItemFetch:
+    """Tests for per-tick message/task fetching."""
+
+    def test_unchanged_sources_are_not_read(self, executor):
+        executor.message_bus.get_version.return_value = (1, 100)
+        executor.state.get_data_version.return_value = 7
+        executor.message_bus.get_pending.return_value = [{"id": "m1"}]
+        executor.state.get_tasks.return_value = []
+
+        assert executor._fetch_work_items() == ([{"id": "m1"}], [])
+        assert executor._fetch_work_items() == ([], [])
+        assert executor.message_bus.get_pending.call_count == 1
+        assert executor.state.get_tasks.call_count == 1
+
+    def test_changed_sources_are_reread(self, executor):
+        executor.message_bus.get_version.side_effect = [(1, 100), (2, 120)]
+        executor.state.get_data_version.side_effect = [7, 8]
+        executor.message_bus.get_pending.return_value = []
+        executor.state.get_tasks.return_value = []
+
+        executor._fetch_work_items()
+        executor._fetch_work_items()
+        assert executor.message_bus.get_pending.call_count == 2
+        assert executor.state.get_tasks.call_count == 2
+
+    def test_failed_read_is_retried(self, executor):
+        executor.message_bus.get_version.return_value = (1, 100)
+        executor.state.get_data_version.return_value = 7
+        executor.state.get_tasks.return_value = []
+        executor.message_bus.get_pending.side_effect = [OSError("locked"), [{"id": "m1"}]]
+
+        with pytest.raises(OSError):
+            executor._fetch_work_items()
+        assert executor._fetch_work_items() == ([{"id": "m1"}], [])
+
+    def test_messages_marked_read_after_handling(self, executor):
+        handled = []
+
+        def handle(message):
+            if message["id"] == "m2":
+                raise RuntimeError("handler failed")
+            handled.append(message["id"])
+
+        executor._handle_message = handle
+        with pytest.raises(RuntimeError):
+            executor._dispatch_messages([{"id": "m1"}, {"id": "m2"}, {"id": "m3"}])
+
+        assert handled == ["m1"]
+        # m3 was never handled, so it stays unread for the next tick
+        executor.message_bus.mark_read_batch.assert_called_once_with(["m1", "m2"])
+
+    def test_tasks_reread_after_pickup(self, executor):
+        executor.message_bus.get_version.return_value = (1, 100)
+        executor.state.get_data_version.return_value = 7
+        task = {"id": "t1", "title": "T", "priority": "high", "created_at": "2025"}
+        executor.state.get_tasks.return_value = [task]
+
+        _, pending = executor._fetch_work_items()
+        assert executor.pick_up_task(pending) == task
+        executor._fetch_work_items()
+        assert executor.state.get_tasks.call_count == 2
+
+
+class TestPickUpTask:
+    """Tests for choosing the next pending task."""
+
+    def test_priority_then_oldest(self, executor):
+        pending = [
+            {"id": "low", "priority": "low", "created_at": "2025-01-01"},
+            {"id": "new-high", "priority": "high", "created_at": "2025-03-01"},
+            {"id": "old-high", "priority": "high", "created_at": "2025-02-01"},
+            {"id": "medium", "created_at": "2024-01-01"},
+        ]
+        assert executor.pick_up_task(pending)["id"] == "old-high"
+        executor.state.update_task.assert_called_once_with(
+            "old-high", status="in_progress", owner="Executor",
+        )
+
+    def test_no_pending_tasks(self, executor):
+        assert executor.pick_up_task([]) is None
+        executor.state.update_task.assert_not_called()
+
+
+class TestProjectContextCache:
+    """Tests for the context-token keyed project context cache."""
+
+    def test_context_reused_until_state_changes(self, executor):
+        executor.state.get_context_token.return_value = (0, None, 0, None)
+        executor.state.get_tasks.return_value = []
+        executor.state.get_alerts.return_value = []
+
+        first = executor.get_project_context_cached()
+        first["current_task"] = {"id": "t1"}
+        second = executor.get_project_context_cached()
+        assert executor.state.get_tasks.call_count == 1
+        assert "current_task" not in second
+
+        executor.state.get_context_token.return_value = (1, "2026-01-01T00:00:00", 0, None)
+        executor.get_project_context_cached()
+        assert executor.state.get_tasks.call_count == 2
+
+    def test_heartbeat_keeps_context_cached(self, executor, project_state):
+        executor.state = project_state
+        project_state.add_task(title="Own", description="d", owner="w")
+        first = executor.get_project_context_cached()
+
+        project_state.agent_heartbeat(executor.name)
+        with patch.object(project_state, "get_tasks") as get_tasks:
+            second = executor.get_project_context_cached()
+        get_tasks.assert_not_called()
+        assert second["tasks_summary"] == first["tasks_summary"]
+
+
+class TestDangerousCommands:
+    """Tests for the dangerous command filter."""
+
+    @pytest.mark.parametrize("command", [
+        "rm -rf /",
+        "sudo RM -RF /*",
+        "mkfs.ext4 /dev/sdb1",
+        ":(){:|:&};:",
+        "dd if=/dev/zero of=/dev/sda",
+        "echo x > /dev/sda",
+        "rm -rf /tmp/build",
+        "cd x && rm -rf /",
+        "  rm -rf /\n",
+        "rm -fr /",
+        "rm -Rf /etc",
+        "rm -rfv /home/user",
+        "sudo rm -rf /var/lib",
+        "rm -rf -- /",
+        "rm -rf build /etc",
+        "ls; rm -rf /opt",
+        "rm -rf build && ls /",
+        "cd / && rm -rf *",
+        "cd; rm -fr .",
+        "rm -r -f /",
+        "rm --recursive --force /",
+        "rm --force -R /*",
+        "sudo /bin/rm -r --force /usr",
+        "rm -rf ~",
+        "rm -f -r ~/",
+        "rm -fr $HOME",
+    ])
+    def test_dangerous(self, executor, command):
+        assert executor._is_dangerous_command(command)
+
+    @pytest.mark.parametrize("command", [
+        "ls -la /",
+        "rm -rf build",
+        "rm notes.txt",
+        "grep -rf patterns.txt src",
+        "  /usr/bin/rm -rf build",
+        "-rf build /usr/bin/rm ",
+        "rm -rf ./build",
+        "rmdir -rf /x",
+        "rm -r notes /tmp",
+        "rm -r -f build",
+        "rm --recursive ~/notes",
+        "cd build && rm -rf *",
+    ])
+    def test_safe(self, executor, command):
+        assert not executor._is_dangerous_command(command)
+
+
+class TestBlockerDetection:
+    """Tests for blocker detection in execute_task."""
+
+    def test_extract_reason_sentence(self, executor):
+        response = "Did step 1. Blocked by missing API credentials. Will retry."
+        assert executor._extract_blocker_reason(response) == "Blocked by missing API credentials"
+
+    def test_extract_reason_default(self, executor):
+        assert executor._extract_blocker_reason("Has a dependency on X") == (
+            "Blocker identified in task execution"
+        )
+
+    def test_extract_reason_unpunctuated_response(self, executor):
+        response = "Blocker: " + "x" * 100_000 + ". Done."
+        assert executor._extract_blocker_reason(response) == "Blocker: " + "x" * 191
+
+    def test_execute_task_blocked(self, executor, mock_claude_backend):
+        mock_claude_backend.complete.return_value = "Cannot proceed because the DB is DOWN."
+        executor.state.get_tasks.return_value = []
+        executor.state.get_alerts.return_value = []
+        result = executor.execute_task({"id": "t1", "title": "T", "description": ""})
+        assert result["status"] == "blocked"
+        assert result["reason"] == "Cannot proceed because the DB is DOWN"
+        executor.state.update_task.assert_called_once_with("t1", status="blocked")
+
+    def test_execute_task_completed(self, executor, mock_claude_backend):
+        mock_claude_backend.complete.return_value = "All done."
+        executor.state.get_tasks.return_value = []
+        executor.state.get_alerts.return_value = []
+        result = executor.execute_task({"id": "t1", "title": "T", "description": ""})
+        assert result["status"] == "completed"
+        executor._stop_journal_flusher()
+
+
+class TestRunScript:
+    """Tests for script execution."""
+
+    def test_run_python_script_with_args(self, executor, tmp_path):
+        script = tmp_path / "echo_args.py"
+        script.write_text("import sys; print('|'.join(sys.argv[1:]))")
+        result = executor.run_script(str(script), args=["a b", "$HOME", "c;d"])
+        assert result["success"]
+        assert result["stdout"].strip() == "a b|$HOME|c;d"
+
+    def test_unknown_extension_runs_directly(self, executor, tmp_path):
+        script = tmp_path / "tool"
+        script.write_text("#!/bin/sh\necho direct:$1\n")
+        script.chmod(0o755)
+        result = executor.run_script(str(script), args=["x"])
+        assert result["stdout"].strip() == "direct:x"
+
+    def test_run_missing_script(self, executor, tmp_path):
+        result = executor.run_script(str(tmp_path / "missing.py"))
+        assert not result["success"]
@@ -0,0 +1,605 @@
+"""
+Tests for FDAAgent — event loop, peer messaging, and daily context.
+"""
+
+import io
+import threading
+import time
+
+import pytest
+
+
+class TestEventLoop:
+    """Tests for the FDA event loop."""
+
+    def test_stop_wakes_loop(self, fda_agent):
+        fda_agent._wake = threading.Event()
+        fda_agent.message_bus.get_pending.return_value = []
+        fda_agent._running = True
+
+        thread = threading.Thread(target=fda_agent.run_event_loop)
+        thread.start()
+        time.sleep(0.1)
+        started = time.monotonic()
+        fda_agent.stop()
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert time.monotonic() - started < 5
+
+    def test_stop_interrupts_error_backoff(self, fda_agent):
+        fda_agent._wake = threading.Event()
+        fda_agent.message_bus.get_pending.side_effect = RuntimeError("bus down")
+        fda_agent._running = True
+
+        thread = threading.Thread(target=fda_agent.run_event_loop)
+        thread.start()
+        time.sleep(0.1)
+        fda_agent.stop()
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+
+    def test_calendar_polled_on_its_own_interval(self, fda_agent):
+        from unittest.mock import MagicMock
+
+        fda_agent._wake = threading.Event()
+        fda_agent.message_bus.get_pending.return_value = []
+        fda_agent.calendar = MagicMock()
+        fda_agent._check_upcoming_meetings = MagicMock()
+        fda_agent._running = True
+
+        thread = threading.Thread(target=fda_agent.run_event_loop)
+        thread.start()
+        for _ in range(3):
+            time.sleep(0.05)
+            fda_agent.wake()
+        fda_agent.stop()
+        thread.join(timeout=5)
+
+        fda_agent._meeting_check.result(timeout=5)
+        assert fda_agent.message_bus.get_pending.call_count > 1
+        fda_agent._check_upcoming_meetings.assert_called_once()
+
+    def test_meeting_check_does_not_block_message_draining(self, fda_agent):
+        from unittest.mock import MagicMock
+
+        fda_agent._wake = threading.Event()
+        fda_agent.message_bus.get_pending.return_value = []
+        fda_agent.calendar = MagicMock()
+        release = threading.Event()
+        fda_agent._check_upcoming_meetings = MagicMock(side_effect=lambda: release.wait(5))
+        fda_agent._running = True
+
+        thread = threading.Thread(target=fda_agent.run_event_loop)
+        thread.start()
+        for _ in range(3):
+            time.sleep(0.05)
+            fda_agent.wake()
+        polls_during_check = fda_agent.message_bus.get_pending.call_count
+        release.set()
+        fda_agent.stop()
+        thread.join(timeout=5)
+
+        assert polls_during_check > 1
+        fda_agent._check_upcoming_meetings.assert_called_once()
+
+
+class TestPeerRequests:
+    """Tests for request/response round trips with peer agents."""
+
+    def test_reply_dispatched_by_loop_resolves_waiter(self, fda_agent):
+        fda_agent.message_bus.request_search.return_value = "req-1"
+        fda_agent._running = True
+        fda_agent._loop_thread = -1  # some other thread owns the loop
+
+        results = []
+        waiter = threading.Thread(
+            target=lambda: results.append(fda_agent.request_file_search("q", timeout=5)),
+        )
+        waiter.start()
+        while "req-1" not in fda_agent.pending_requests:
+            time.sleep(0.01)
+
+        fda_agent._handle_peer_response({
+            "type": "search_result", "from": "librarian",
+            "reply_to": "req-1", "body": '{"success": true, "result": [1]}',
+        })
+        waiter.join(timeout=5)
+
+        assert results == [{"success": True, "result": [1]}]
+        fda_agent.message_bus.wait_for_response.assert_not_called()
+
+    def test_bus_change_wakes_loop_for_cross_process_reply(self, fda_agent):
+        import itertools
+        from concurrent.futures import Future
+
+        fda_agent.RESPONSE_POLL_INTERVAL = 0.01
+        fda_agent._wake = threading.Event()
+        fda_agent._running = True
+        fda_agent._loop_thread = -1  # some other thread owns the loop
+        fda_agent.message_bus.get_version.side_effect = itertools.count()
+        future = Future()
+
+        def loop():
+            # Stands in for the event loop dispatching the reply once woken
+            if fda_agent._wake.wait(5):
+                future.set_result({"success": True})
+
+        threading.Thread(target=loop).start()
+        assert fda_agent._await_response("req", future, timeout=5) == {"success": True}
+
+    def test_polls_bus_without_event_loop(self, fda_agent):
+        fda_agent.message_bus.request_execute.return_value = "req-2"
+        fda_agent.message_bus.wait_for_response.return_value = {
+            "id": "m2", "type": "execute_result", "from": "executor",
+            "reply_to": "req-2", "body": '{"success": true}',
+        }
+        assert fda_agent.request_command_execution("ls") == {"success": True}
+        fda_agent.message_bus.mark_read.assert_called_once_with("m2")
+
+    def test_timeout_returns_request_id(self, fda_agent):
+        fda_agent.message_bus.request_search.return_value = "req-3"
+        fda_agent.message_bus.wait_for_response.return_value = None
+        assert fda_agent.request_file_search("q", timeout=0.01) == {
+            "request_id": "req-3", "timed_out": True,
+        }
+
+    def test_pending_requests_bounded_and_cleared(self, fda_agent):
+        fda_agent.MAX_PENDING_REQUESTS = 2
+        fda_agent.message_bus.request_search.side_effect = ["a", "b", "c"]
+        for query in "xyz":
+            fda_agent.request_file_search(query, wait_for_response=False)
+        assert list(fda_agent.pending_requests) == ["b", "c"]
+
+        fda_agent._handle_peer_response({"type": "search_result", "reply_to": "c", "body": "{}"})
+        assert list(fda_agent.pending_requests) == ["b"]
+
+
+class TestMessageHandling:
+    """Tests for FDA's inbound message dispatch."""
+
+    def test_response_type_routed_to_pending_request(self, fda_agent):
+        fda_agent.message_bus.request_execute.return_value = "req"
+        fda_agent.request_command_execution("ls", wait_for_response=False)
+        future = fda_agent.pending_requests["req"]["future"]
+
+        fda_agent._handle_message({
+            "id": "m1", "type": "execute_result", "from": "executor",
+            "subject": "done", "body": '{"success": true}', "reply_to": "req",
+        })
+        assert future.result(timeout=0) == {"success": True}
+
+    def test_critical_alert(self, fda_agent):
+        fda_agent._handle_message({
+            "id": "m1", "type": "alert", "from": "executor",
+            "subject": "CRITICAL disk", "body": "disk full",
+        })
+        fda_agent.state.add_alert.assert_called_once_with(
+            level="critical", message="disk full", source="FDA",
+        )
+
+    def test_blocker_raises_warning(self, fda_agent):
+        fda_agent._handle_message({
+            "id": "m1", "type": "blocker", "from": "executor",
+            "subject": "stuck", "body": "no creds",
+        })
+        fda_agent.state.add_alert.assert_called_once_with(
+            level="warning", message="Blocker from executor: stuck - no creds", source="FDA",
+        )
+
+    def test_unknown_type_ignored(self, fda_agent):
+        fda_agent._handle_message({"id": "m1", "type": "mystery"})
+        fda_agent.state.add_alert.assert_not_called()
+
+    def test_event_loop_marks_batch_read_once(self, fda_agent):
+        fda_agent._wake = threading.Event()
+        fda_agent._running = True
+        messages = [
+            {"id": "m1", "type": "status_response", "from": "executor", "body": "ok"},
+            {"id": "m2", "type": "mystery"},
+        ]
+
+        def get_pending(agent):
+            fda_agent._running = False
+            return messages
+
+        fda_agent.message_bus.get_pending.side_effect = get_pending
+        fda_agent.run_event_loop()
+
+        fda_agent.message_bus.mark_read_batch.assert_called_once_with(["m1", "m2"])
+        fda_agent.message_bus.mark_read.assert_not_called()
+
+    def test_failed_handler_leaves_rest_unread(self, fda_agent):
+        from unittest.mock import MagicMock
+
+        fda_agent._handle_message = MagicMock(side_effect=[None, RuntimeError("boom"), None])
+        with pytest.raises(RuntimeError):
+            fda_agent._dispatch_messages([{"id": "m1"}, {"id": "m2"}, {"id": "m3"}])
+        fda_agent.message_bus.mark_read_batch.assert_called_once_with(["m1", "m2"])
+
+    def test_plain_text_discovery_is_logged_only(self, fda_agent):
+        fda_agent._handle_discovery({"from": "librarian", "body": "found a thing"})
+        fda_agent.state.add_discovery.assert_not_called()
+
+    def test_json_discovery_is_stored(self, fda_agent):
+        fda_agent._handle_discovery({
+            "from": "librarian",
+            "body": '{"discovery_type": "pattern", "description": "d"}',
+        })
+        fda_agent.state.add_discovery.assert_called_once_with(
+            agent="librarian", discovery_type="pattern", description="d", details=None,
+        )
+
+    def test_non_object_response_body_wrapped(self, fda_agent):
+        fda_agent.message_bus.request_search.return_value = "req"
+        fda_agent.request_file_search("q", wait_for_response=False)
+        future = fda_agent.pending_requests["req"]["future"]
+        fda_agent._handle_peer_response({"reply_to": "req", "body": "[1, 2]"})
+        assert future.result(timeout=0) == {"result": "[1, 2]"}
+
+
+class TestMeetingPrep:
+    """Tests for the upcoming-meeting check."""
+
+    def test_prepares_only_unprepared_meetings_concurrently(self, fda_agent):
+        from unittest.mock import MagicMock
+
+        fda_agent.calendar = MagicMock()
+        fda_agent.calendar.get_upcoming_events.return_value = [
+            {"id": "a"}, {"id": "b"}, {"id": "c"}, {"subject": "no id"},
+        ]
+        fda_agent.state.get_prepared_event_ids.return_value = {"b"}
+        fda_agent._meeting_prep_inputs = lambda eid: ({"id": eid}, {}, f"prompt {eid}", [])
+
+        barrier = threading.Barrier(2, timeout=5)
+        main_thread = threading.get_ident()
+        recorded = []
+
+        def chat(prompt, context):
+            barrier.wait()
+            return f"brief for {prompt}"
+
+        def record(event_id, details, files, response):
+            # Writes stay on the calling thread
+            assert threading.get_ident() == main_thread
+            recorded.append((event_id, response))
+
+        fda_agent.chat_with_context = chat
+        fda_agent._record_meeting_prep = record
+        fda_agent._check_upcoming_meetings()
+
+        assert recorded == [("a", "brief for prompt a"), ("c", "brief for prompt c")]
+        fda_agent.state.get_prepared_event_ids.assert_called_once_with(["a", "b", "c"])
+
+    def test_failed_brief_does_not_stop_others(self, fda_agent):
+        from unittest.mock import MagicMock
+
+        fda_agent.calendar = MagicMock()
+        fda_agent.calendar.get_upcoming_events.return_value = [{"id": "a"}, {"id": "b"}]
+        fda_agent.state.get_prepared_event_ids.return_value = set()
+        fda_agent._meeting_prep_inputs = lambda eid: ({}, {}, eid, [])
+
+        def chat(prompt, context):
+            if prompt == "a":
+                raise RuntimeError("LLM down")
+            return "ok"
+
+        fda_agent.chat_with_context = chat
+        fda_agent._record_meeting_prep = MagicMock()
+        fda_agent._check_upcoming_meetings()
+
+        fda_agent._record_meeting_prep.assert_called_once_with("b", {}, [], "ok")
+
+
+class TestOnboarding:
+    """Tests for the onboarding profile step."""
+
+    def test_profile_step_stores_answers_and_journals(self, fda_agent, monkeypatch):
+        answers = [
+            "Ada", "engineer", "compilers", "ship v2", "flaky CI",
+            "n", "brief", "skip", "Asia/Seoul",
+        ]
+        monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(answers) + "\n"))
+        monkeypatch.setattr("fda.utils.timezone.validate_timezone", lambda tz: tz)
+
+        responses = {}
+        fda_agent._onboard_step_profile(responses)
+
+        fda_agent.state.set_context.assert_any_call("user_role", "engineer")
+        fda_agent.state.set_context.assert_any_call("user_timezone", "Asia/Seoul")
+        content = fda_agent.journal_writer.write_entry.call_args.kwargs["content"]
+        assert content.startswith("# Onboarding — Ada\n\n**Date:** ")
+        assert content.endswith(
+            "- **Role:** engineer\n- **Context:** compilers\n- **Goals:** ship v2\n"
+            "- **Challenges:** flaky CI\n- **Style:** brief\n- **Timezone:** Asia/Seoul\n"
+        )
+
+    def test_complete_step_builds_welcome_prompt(self, fda_agent, capsys):
+        from unittest.mock import MagicMock
+
+        fda_agent.chat = MagicMock(return_value="Hi Ada!")
+        fda_agent._onboard_step_complete({
+            "name": "Ada", "role": "engineer", "channels_enabled": ["slack"],
+        })
+
+        prompt = fda_agent.chat.call_args.args[0]
+        assert prompt.startswith(
+            "The user Ada just completed onboarding. Role: engineer. "
+            "Goals: N/A. Channels: slack. "
+        )
+        assert "Hi Ada!" in capsys.readouterr().out
+
+
+class TestDailyContext:
+    """Tests for gather_daily_context."""
+
+    def test_filters_to_today(self, fda_agent):
+        from datetime import datetime
+
+        today = "2026-03-04"
+        fda_agent.state.get_contexts.side_effect = dict.fromkeys
+        fda_agent.state.get_tasks.return_value = [
+            {"title": "done", "status": "completed", "updated_at": f"{today}T10:00"},
+            {"title": "old", "status": "completed", "updated_at": "2026-03-03T10:00"},
+            {"title": "doing", "status": "in_progress", "updated_at": "2026-03-01T10:00"},
+            {"title": "none", "status": "pending", "updated_at": None},
+        ]
+        fda_agent.journal_retriever.retrieve.return_value = [
+            {"summary": "j1", "created_at": f"{today}T09:00"},
+            {"summary": "j0", "created_at": "2026-03-02T09:00"},
+        ]
+        fda_agent.state.get_alerts.return_value = [
+            {"message": f"a{i}", "created_at": f"{today}T0{i}:00"} for i in range(7)
+        ]
+        fda_agent.state.get_decisions.return_value = [
+            {"title": "d1", "created_at": f"{today}T11:00"},
+            {"title": "d0"},
+        ]
+        fda_agent.state.get_messages_today.return_value = []
+
+        context = fda_agent.gather_daily_context(
+            datetime(2026, 3, 4), datetime(2026, 3, 4, 23, 59),
+        )
+        assert context["tasks_completed_today"] == ["done"]
+        assert context["tasks_in_progress"] == ["doing"]
+        assert context["tasks_updated_today"] == 1
+        assert context["journal_entries_today"] == ["j1"]
+        assert context["alerts_today"] == ["a0", "a1", "a2", "a3", "a4"]
+        assert context["decisions_today"] == ["d1"]
+
+
+class TestRouting:
+    """Tests for question routing helpers."""
+
+    def test_external_capability_phrases(self, fda_agent):
+        assert fda_agent._requires_external_capabilities("What's the WEATHER in Seoul?")
+        assert fda_agent._requires_external_capabilities("please use Claude Code for this")
+        assert not fda_agent._requires_external_capabilities("How are you?")
+
+    def test_greeting_skips_capability_scan(self, fda_agent):
+        from unittest.mock import MagicMock
+
+        fda_agent._classify_intent = MagicMock(return_value="greeting")
+        fda_agent._requires_external_capabilities = MagicMock(return_value=True)
+        fda_agent._get_relevant_project_knowledge = MagicMock(return_value=None)
+        fda_agent.search_journal = MagicMock(return_value=[])
+        fda_agent.chat_with_context = MagicMock(return_value="Hello!")
+        fda_agent.state.get_contexts.side_effect = dict.fromkeys
+
+        assert fda_agent.ask("hi there") == "Hello!"
+        fda_agent._requires_external_capabilities.assert_not_called()
+
+    def test_peer_status_cached_briefly(self, fda_agent, monkeypatch):
+        clock = [100.0]
+        monkeypatch.setattr("fda.fda_agent.time.monotonic", lambda: clock[0])
+        fda_agent.state.get_agent_status.return_value = {"status": "running"}
+
+        assert fda_agent._get_peer_status_cached("executor") == {"status": "running"}
+        fda_agent._get_peer_status_cached("executor")
+        assert fda_agent.state.get_agent_status.call_count == 1
+
+        clock[0] += fda_agent.PEER_STATUS_TTL
+        fda_agent._get_peer_status_cached("executor")
+        assert fda_agent.state.get_agent_status.call_count == 2
+
+
+class TestDailyCheckin:
+    """Tests for daily_checkin."""
+
+    def test_skips_llm_without_activity(self, fda_agent):
+        from unittest.mock import MagicMock
+
+        fda_agent.get_project_context_cached = MagicMock(return_value={
+            "tasks_summary": {}, "unacknowledged_alerts": [],
+        })
+        fda_agent.journal_retriever.index.get_recent.return_value = []
+        fda_agent.state.get_decisions.return_value = []
+        fda_agent.chat_with_context = MagicMock()
+
+        result = fda_agent.daily_checkin()
+        assert result["status"] == "skipped"
+        assert result["is_critical"] is False
+        fda_agent.chat_with_context.assert_not_called()
+        fda_agent.journal_writer.write_entry.assert_not_called()
+
+    def test_reviews_when_tasks_exist(self, fda_agent):
+        from unittest.mock import MagicMock
+
+        fda_agent.get_project_context_cached = MagicMock(return_value={
+            "tasks_summary": {"pending": 1}, "unacknowledged_alerts": [],
+        })
+        fda_agent.journal_retriever.index.get_recent.return_value = []
+        fda_agent.state.get_decisions.return_value = []
+        fda_agent.chat_with_context = MagicMock(return_value="All good.")
+
+        result = fda_agent.daily_checkin()
+        assert result["status"] == "completed"
+        fda_agent.chat_with_context.assert_called_once()
+
+    def test_unchanged_project_reuses_result(self, fda_agent):
+        from datetime import datetime
+        from unittest.mock import MagicMock
+
+        summary = {"pending": 1}
+        fda_agent.get_project_context_cached = MagicMock(side_effect=lambda: {
+            "tasks_summary": dict(summary), "unacknowledged_alerts": [],
+            "timestamp": datetime.now().isoformat(),
+        })
+        fda_agent.journal_retriever.index.get_recent.return_value = []
+        fda_agent.state.get_decisions.return_value = []
+        fda_agent.chat_with_context = MagicMock(return_value="All good.")
+
+        first = fda_agent.daily_checkin()
+        second = fda_agent.daily_checkin()
+        assert second == {**first, "cached": True}
+        fda_agent.chat_with_context.assert_called_once()
+        fda_agent.journal_writer.write_entry.assert_called_once()
+
+        summary["completed"] = 1
+        assert "cached" not in fda_agent.daily_checkin()
+        assert fda_agent.chat_with_context.call_count == 2
+
+
+class TestKPIs:
+    """Tests for check_kpis."""
+
+    def test_counts_tasks_by_status(self, fda_agent):
+        from unittest.mock import MagicMock
+
+        fda_agent.state.get_task_status_counts.return_value = {
+            "completed": 2, "blocked": 1, "in_progress": 1,
+        }
+        fda_agent.state.get_kpi_history.return_value = []
+        fda_agent.chat_with_context = MagicMock(return_value="ok")
+
+        result = fda_agent.check_kpis()
+        kpis = result["kpis"]
+        snapshot_call = fda_agent.state.add_kpi_snapshots.call_args
+        assert snapshot_call.kwargs["timestamp"] == result["timestamp"]
+        assert kpis["total_tasks"] == 4
+        assert kpis["completed_tasks"] == 2
+        assert kpis["blocked_tasks"] == 1
+        assert kpis["in_progress_tasks"] == 1
+        assert kpis["completion_rate"] == 50.0
+        assert kpis["block_rate"] == 25.0
+
+    def test_unchanged_counts_reuse_result(self, fda_agent):
+        from unittest.mock import MagicMock
+
+        fda_agent.state.get_task_status_counts.return_value = {"completed": 1}
+        fda_agent.state.get_kpi_history.return_value = []
+        fda_agent.chat_with_context = MagicMock(return_value="ok")
+
+        first = fda_agent.check_kpis()
+        assert fda_agent.check_kpis() == {**first, "cached": True}
+        fda_agent.chat_with_context.assert_called_once()
+        assert fda_agent.state.add_kpi_snapshots.call_count == 2
+
+        fda_agent.state.get_task_status_counts.return_value = {"completed": 2}
+        assert "cached" not in fda_agent.check_kpis()
+        assert fda_agent.chat_with_context.call_count == 2
+
+
+class TestReviewTask:
+    """Tests for review_task."""
+
+    def test_missing_task(self, fda_agent):
+        fda_agent.state.get_task.return_value = None
+        result = fda_agent.review_task("t1")
+        assert result == {"status": "error", "message": "Task t1 not found"}
+        fda_agent.state.get_task.assert_called_once_with("t1")
+        fda_agent.state.get_tasks.assert_not_called()
+
+    def test_approval_detected_case_insensitively(self, fda_agent):
+        from unittest.mock import MagicMock
+
+        fda_agent.state.get_task.return_value = {"id": "t1", "title": "T"}
+        fda_agent.chat_with_context = MagicMock(return_value="This LOOKS GOOD to me.")
+        assert fda_agent.review_task("t1")["approved"] is True
+
+        fda_agent.chat_with_context.return_value = "Needs more tests."
+        assert fda_agent.review_task("t1")["approved"] is False
+
+
+class TestAsk:
+    """Tests for ask()."""
+
+    def test_librarian_delegation_overlaps_note_lookup(self, fda_agent):
+        from unittest.mock import MagicMock
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def delegate(question):
+            barrier.wait()
+            return {"success": True, "files": []}
+
+        def notes(question):
+            barrier.wait()
+            return [{"summary": "s", "content": "c"}]
+
+        fda_agent._classify_intent = MagicMock(return_value="librarian")
+        fda_agent._delegate_to_librarian = delegate
+        fda_agent._find_relevant_notes = notes
+        fda_agent._get_relevant_project_knowledge = MagicMock(return_value=None)
+        fda_agent.chat_with_context = MagicMock(return_value="Found it")
+        fda_agent.state.get_contexts.side_effect = dict.fromkeys
+
+        assert fda_agent.ask("where is the deck?") == "Found it"
+        context = fda_agent.chat_with_context.call_args.args[1]
+        assert context["relevant_notes"] == [{"summary": "s", "content": "c"}]
+
+    def test_librarian_delegation_overlaps_context_build(self, fda_agent):
+        from unittest.mock import MagicMock
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def delegate(question):
+            barrier.wait()
+            return {"success": True, "files": []}
+
+        def knowledge(question):
+            barrier.wait()
+            return {"project_name": "fda"}
+
+        fda_agent._classify_intent = MagicMock(return_value="librarian")
+        fda_agent._delegate_to_librarian = delegate
+        fda_agent._get_relevant_project_knowledge = knowledge
+        fda_agent._find_relevant_notes = MagicMock(return_value=[])
+        fda_agent.chat_with_context = MagicMock(return_value="Found it")
+        fda_agent.state.get_contexts.side_effect = dict.fromkeys
+
+        assert fda_agent.ask("where is the deck?") == "Found it"
+        context = fda_agent.chat_with_context.call_args.args[1]
+        assert context["project_knowledge"] == {"project_name": "fda"}
+        assert context["peer_agent_result"] == {"success": True, "files": []}
+
+    def test_truncate_for_prompt(self):
+        from fda.fda_agent import _truncate_for_prompt
+
+        result = _truncate_for_prompt(
+            {"files": [{"path": "p" * 600, "size": 1}] * 30, "success": True},
+        )
+        assert len(result["files"]) == 20
+        assert result["files"][0] == {"path": "p" * 500, "size": 1}
+        assert result["success"] is True
+
+
+class TestDailyJournal:
+    """Tests for generate_daily_journal."""
+
+    def test_prompt_lists(self, fda_agent):
+        from datetime import datetime
+        from unittest.mock import MagicMock
+
+        fda_agent.chat = MagicMock(return_value="entry")
+        fda_agent.generate_daily_journal({
+            "user_name": "Ada",
+            "tasks_completed_today": ["a", "b"],
+            "calendar_events": [{"subject": "Sync", "start": "2026-03-04T10:00:00Z"}],
+        }, datetime(2026, 3, 4, 21, 0))
+
+        prompt = fda_agent.chat.call_args.args[0]
+        assert "### Tasks Completed\n- a\n- b\n\n" in prompt
+        assert "### Tasks In Progress\n- No tasks currently in progress\n" in prompt
+        assert "### Calendar Events\n- Sync at 2026-03-04T10:00\n" in prompt
@@ -96,6 +96,16 @@ class TestJournalWriter:
             )
         assert len(journal_writer.index.entries) == 5
 
+    def test_write_entries_batch(self, journal_writer):
+        paths = journal_writer.write_entries([
+            {"author": "test", "tags": ["a"], "summary": f"Batch {i}", "content": f"C{i}"}
+            for i in range(3)
+        ])
+        assert len(paths) == 3
+        assert all(p.exists() for p in paths)
+        assert len(journal_writer.index.entries) == 3
+        assert journal_writer.index.index_path.exists()
+
 
 class TestJournalIndex:
     """Tests for JournalIndex — search and lookup."""
@@ -274,3 +284,17 @@ class TestJournalRetriever:
         self._seed_entries(journal_writer, count=3)
         results = journal_retriever.retrieve()
         assert len(results) == 3
+
+    @pytest.mark.parametrize("text", [
+        "no frontmatter " * 100,
+        "---\ntitle: t\n---\n\n  short body  \n\n",
+        "---\ntitle: t\n---\n" + "\n" * 5000 + "body " * 300 + "\n" * 5000,
+        "---\ntitle: t\n---\n" + "x" * 498 + "  \n\n",
+        "---\nunterminated " * 3,
+        "",
+    ])
+    def test_read_entry_preview_matches_full_read(self, journal_retriever, tmp_journal_dir, text):
+        (tmp_journal_dir / "entry.md").write_text(text, encoding="utf-8")
+        expected = journal_retriever._read_entry_content("entry.md")[:500]
+        assert journal_retriever.read_entry_preview("entry.md", 500) == expected
+        assert journal_retriever.read_entry_preview("missing.md") == ""
@@ -53,6 +53,18 @@ class TestMessageBus:
         pending = message_bus.get_pending("worker")
         assert len(pending) == 0
 
+    def test_mark_read_batch(self, message_bus):
+        ids = [
+            message_bus.send(
+                from_agent="fda", to_agent="worker",
+                msg_type="TASK", subject=f"T{i}", body="b",
+            )
+            for i in range(3)
+        ]
+        message_bus.mark_read_batch(ids[:2])
+        pending = message_bus.get_pending("worker")
+        assert [m["id"] for m in pending] == [ids[2]]
+
     def test_priority_ordering(self, message_bus):
         message_bus.send(
             from_agent="fda", to_agent="worker",
@@ -84,6 +96,21 @@ class TestMessageBus:
         assert thread[0]["subject"] == "Original"
         assert thread[1]["subject"] == "Reply"
 
+    def test_send_batch(self, message_bus):
+        original_id = message_bus.send(
+            from_agent="fda", to_agent="worker",
+            msg_type="TASK", subject="Original", body="b",
+        )
+        ids = message_bus.send_batch([
+            {"from_agent": "fda", "to_agent": "worker", "msg_type": "TASK",
+             "subject": "A", "body": "a"},
+            {"from_agent": "worker", "to_agent": "fda", "msg_type": "RESULT",
+             "subject": "Reply", "body": "r", "reply_to": original_id},
+        ])
+        assert len(ids) == 2
+        assert [m["subject"] for m in message_bus.get_pending("worker")] == ["Original", "A"]
+        assert len(message_bus.get_thread(original_id)) == 2
+
     def test_case_insensitive_agent_names(self, message_bus):
         message_bus.send(
             from_agent="FDA", to_agent="Worker",
@@ -154,3 +181,42 @@ class TestMessageBus:
         pending = message_bus.get_pending("fda")
         assert len(pending) == 1
         assert pending[0]["priority"] == "high"
+
+    def test_send_sets_wakeup_event(self, message_bus):
+        event = message_bus.wakeup_event("Executor")
+        event.clear()
+        message_bus.send(
+            from_agent="fda", to_agent="executor",
+            msg_type="TASK", subject="T", body="b",
+        )
+        assert event.is_set()
+        assert message_bus.wakeup_event("executor") is event
+
+    def test_wait_for_response_woken_by_reply(self, message_bus):
+        import threading
+        import time
+
+        request_id = message_bus.send(
+            from_agent="fda", to_agent="executor",
+            msg_type="TASK", subject="Q", body="b",
+        )
+
+        def reply():
+            time.sleep(0.1)
+            message_bus.send(
+                from_agent="executor", to_agent="fda",
+                msg_type="RESULT", subject="A", body="r", reply_to=request_id,
+            )
+
+        threading.Thread(target=reply).start()
+        started = time.monotonic()
+        response = message_bus.wait_for_response(
+            "fda", request_id, timeout_seconds=10, poll_interval=5,
+        )
+        assert response["subject"] == "A"
+        assert time.monotonic() - started < 2
+
+    def test_wait_for_response_times_out(self, message_bus):
+        assert message_bus.wait_for_response(
+            "fda", "missing", timeout_seconds=0.1, poll_interval=0.05,
+        ) is None
@@ -19,6 +19,14 @@ class TestProjectState:
     def test_get_context_missing_key(self, project_state):
         assert project_state.get_context("nonexistent") is None
 
+    def test_get_contexts(self, project_state):
+        project_state.set_context("user_name", "John")
+        project_state.set_context("user_goals", ["ship"])
+        assert project_state.get_contexts(["user_name", "user_goals", "user_role"]) == {
+            "user_name": "John", "user_goals": ["ship"], "user_role": None,
+        }
+        assert project_state.get_contexts([]) == {}
+
     def test_context_overwrite(self, project_state):
         project_state.set_context("key", "v1")
         project_state.set_context("key", "v2")
@@ -39,6 +47,12 @@ class TestProjectState:
         tasks = project_state.get_tasks()
         assert len(tasks) == 2
 
+    def test_get_task_by_id(self, project_state):
+        task_id = project_state.add_task(title="Task", description="d", owner="w")
+        task = project_state.get_task(task_id)
+        assert task["title"] == "Task"
+        assert project_state.get_task("missing") is None
+
     def test_update_task_status(self, project_state):
         task_id = project_state.add_task(
             title="Task", description="d", owner="w",
@@ -48,6 +62,14 @@ class TestProjectState:
         completed = [t for t in tasks if t["id"] == task_id]
         assert completed[0]["status"] == "completed"
 
+    def test_get_task_status_counts(self, project_state):
+        for title in ("A", "B", "C"):
+            project_state.add_task(title=title, description="d", owner="w")
+        task_id = project_state.get_tasks()[0]["id"]
+        project_state.update_task(task_id, status="completed")
+        counts = project_state.get_task_status_counts()
+        assert counts == {"pending": 2, "completed": 1}
+
     def test_add_alert(self, project_state):
         alert_id = project_state.add_alert(
             level="warning",
@@ -87,6 +109,26 @@ class TestProjectState:
         assert len(decisions) == 1
         assert decisions[0]["title"] == "D1"
 
+    def test_add_kpi_snapshots(self, project_state):
+        project_state.add_kpi_snapshots([("completion_rate", 50.0), ("total_tasks", 4)])
+        assert project_state.get_latest_kpi("completion_rate")["value"] == 50.0
+        assert project_state.get_latest_kpi("total_tasks")["value"] == 4
+
+    def test_add_kpi_snapshots_is_atomic(self, project_state):
+        import sqlite3
+
+        with pytest.raises(sqlite3.IntegrityError):
+            project_state.add_kpi_snapshots([("completion_rate", 50.0), ("block_rate", None)])
+        assert project_state.get_latest_kpi("completion_rate") is None
+        project_state.add_kpi_snapshots([("completion_rate", 60.0)])
+        assert project_state.get_latest_kpi("completion_rate")["value"] == 60.0
+
+    def test_get_prepared_event_ids(self, project_state):
+        project_state.record_meeting_prep("e1", "brief", "fda")
+        project_state.record_meeting_prep("e1", "newer brief", "fda")
+        assert project_state.get_prepared_event_ids(["e1", "e2"]) == {"e1"}
+        assert project_state.get_prepared_event_ids([]) == set()
+
     def test_agent_status(self, project_state):
         project_state.update_agent_status("worker", "running")
         status = project_state.get_agent_status("worker")
@@ -99,6 +141,38 @@ class TestProjectState:
         status = project_state.get_agent_status("worker")
         assert status["last_heartbeat"] is not None
 
+    def test_data_version_tracks_other_connections(self, project_state, tmp_state_db):
+        from fda.state.project_state import ProjectState
+        before = project_state.get_data_version()
+        project_state.add_task(title="Own", description="d", owner="w")
+        assert project_state.get_data_version() == before
+
+        ProjectState(db_path=tmp_state_db).add_task(title="Other", description="d", owner="w")
+        assert project_state.get_data_version() != before
+
+    def test_change_token_tracks_own_writes(self, project_state):
+        before = project_state.get_change_token()
+        assert project_state.get_change_token() == before
+        project_state.add_task(title="Own", description="d", owner="w")
+        assert project_state.get_change_token() != before
+
+    def test_context_token_ignores_unrelated_writes(self, project_state):
+        task_id = project_state.add_task(title="Own", description="d", owner="w")
+        before = project_state.get_context_token()
+        project_state.agent_heartbeat("worker")
+        project_state.add_kpi_snapshots([("tasks_total", 1.0)])
+        assert project_state.get_context_token() == before
+
+        project_state.update_task(task_id, status="in_progress")
+        after_update = project_state.get_context_token()
+        assert after_update != before
+
+        alert_id = project_state.add_alert(level="info", message="m", source="s")
+        after_alert = project_state.get_context_token()
+        assert after_alert != after_update
+        project_state.acknowledge_alert(alert_id)
+        assert project_state.get_context_token() != after_alert
+
     def test_telegram_user_registration(self, project_state):
         project_state.register_telegram_user("12345", "TestUser")
         users = project_state.get_telegram_users(active_only=True)